@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+HTTP API for Smart AI Resume Analyzer
+
+A small ASGI service exposing the analyzers without Streamlit:
+
+    POST /analyze     multipart: file (PDF/DOCX), role, [category]
+    POST /analyze/ai  multipart: file (PDF/DOCX), role, [category], [job_description]
+    POST /build       JSON resume data (as used by the resume builder) -> DOCX
+    GET  /stats       resume, AI analysis and write queue statistics
+    GET  /metrics     per-stage timing histograms (Prometheus text format)
+
+Extraction and standard scoring run in a process pool whose workers load
+their analyzers once at startup. AI calls and database reads run in the
+thread pool, and results are saved through the shared write-behind queue.
+
+Usage:
+    python api_server.py [--host 0.0.0.0] [--port 8000] [--workers N] [--trace] [--trace-file FILE]
+"""
+
+import argparse
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+from config.database import (
+    init_database, queue_document, queue_resume_analysis, queue_ai_analysis_data,
+    queue_analysis_result, save_resume_data, build_standard_analysis_records,
+    get_resume_stats, get_ai_analysis_stats, get_write_queue_stats, get_write_queue
+)
+from config import tracing
+from config.tracing import traced
+from utils.pipeline import (
+    SUPPORTED_EXTENSIONS, find_role, warm_worker, analyze_document, extract_text, get_analyzer
+)
+
+# Worker processes for extraction and scoring
+API_WORKERS = int(os.getenv("API_WORKERS", os.cpu_count() or 1))
+
+# Largest accepted upload
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+AI_MODEL = "Google Gemini"
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class RequestError(Exception):
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+async def read_upload(request):
+    """Read a multipart upload and resolve its target role
+
+    Returns (form, content, file_name, category, requirements).
+    """
+    form = await request.form()
+    upload = form.get('file')
+    if upload is None or not hasattr(upload, 'read'):
+        raise RequestError("Missing 'file' upload")
+    file_name = upload.filename or ''
+    if not file_name.lower().endswith(SUPPORTED_EXTENSIONS):
+        raise RequestError("Only PDF and DOCX files are supported", 415)
+
+    content = await upload.read()
+    if not content:
+        raise RequestError("Uploaded file is empty")
+    if len(content) > MAX_UPLOAD_BYTES:
+        raise RequestError("Uploaded file is too large", 413)
+
+    role = form.get('role')
+    if not role:
+        raise RequestError("Missing 'role' field")
+    category, requirements = find_role(role, form.get('category'))
+    if not requirements:
+        raise RequestError(f"Unknown role: {role}", 404)
+    return form, content, file_name, category, requirements
+
+
+async def run_in_pool(request, func, *args):
+    """Run func in the process pool, merging the spans it recorded into this request's trace"""
+    loop = asyncio.get_running_loop()
+    result, spans = await loop.run_in_executor(
+        request.app.state.pool, tracing.call_collecting, tracing.is_enabled(), func, *args
+    )
+    tracing.merge_spans(spans)
+    return result
+
+
+@traced('request.analyze')
+async def analyze(request):
+    """Standard ATS analysis of an uploaded resume"""
+    form, content, file_name, category, requirements = await read_upload(request)
+    role = form.get('role')
+    semantic = (form.get('semantic') or '').lower() in ('1', 'true', 'yes', 'on')
+
+    result = await run_in_pool(request, analyze_document, content, file_name, requirements, semantic)
+    if result['status'] != 'ok':
+        return JSONResponse({'error': result['error']}, status_code=422)
+
+    content_hash = result['content_hash']
+    analysis = result['analysis']
+    if result.get('text'):
+        queue_document(content_hash, result['text'], file_name)
+    if analysis.get('document_type') == 'resume':
+        resume_data, analysis_data = build_standard_analysis_records(
+            analysis, role, category, content_hash
+        )
+        queue_resume_analysis(resume_data, analysis_data, result=analysis)
+
+    return JSONResponse({
+        'content_hash': content_hash,
+        'role': role,
+        'category': category,
+        'text_reused': result['text_reused'],
+        'timings_ms': {stage: round(seconds * 1000, 1) for stage, seconds in result['timings'].items()},
+        'analysis': analysis
+    })
+
+
+@traced('request.analyze_ai')
+async def analyze_ai(request):
+    """AI analysis of an uploaded resume"""
+    form, content, file_name, category, requirements = await read_upload(request)
+    role = form.get('role')
+    job_description = form.get('job_description') or None
+
+    # OCR-capable extraction is CPU-bound: run it in the process pool
+    try:
+        text, content_hash, reused = await run_in_pool(request, extract_text, content, file_name, 'ai')
+    except Exception as e:
+        return JSONResponse({'error': f"Text extraction failed: {e}"}, status_code=422)
+    if not text or not text.strip():
+        return JSONResponse({'error': "Could not extract any text from the file"}, status_code=422)
+    if not reused:
+        queue_document(content_hash, text, file_name)
+
+    # The model call is network-bound: a thread is enough
+    ai_analyzer = request.app.state.ai_analyzer
+    result = await run_in_threadpool(
+        ai_analyzer.analyze_resume_with_gemini, text, job_description=job_description, job_role=role
+    )
+    if not result or 'error' in result:
+        return JSONResponse({'error': (result or {}).get('error', 'Unknown error')}, status_code=502)
+
+    queue_ai_analysis_data(None, {
+        "model_used": AI_MODEL,
+        "resume_score": result.get("resume_score", 0),
+        "job_role": role
+    })
+    queue_analysis_result(content_hash, AI_MODEL, role, result)
+
+    return JSONResponse({
+        'content_hash': content_hash,
+        'role': role,
+        'category': category,
+        'text_reused': reused,
+        'analysis': result
+    })
+
+
+@traced('request.build')
+async def build(request):
+    """Generate a DOCX resume from builder data"""
+    try:
+        data = await request.json()
+    except ValueError:
+        return JSONResponse({'error': "Request body must be JSON"}, status_code=400)
+    if not isinstance(data, dict) or not data.get('personal_info'):
+        return JSONResponse({'error': "Missing 'personal_info'"}, status_code=400)
+    data.setdefault('template', 'Modern')
+
+    builder = request.app.state.builder
+    try:
+        buffer = await run_in_threadpool(builder.generate_resume, data)
+    except Exception as e:
+        return JSONResponse({'error': f"Resume generation failed: {e}"}, status_code=422)
+    await run_in_threadpool(save_resume_data, data)
+
+    name = (data['personal_info'].get('full_name') or 'resume').replace(' ', '_')
+    return Response(
+        buffer.getvalue(),
+        media_type=DOCX_MIME,
+        headers={'Content-Disposition': f'attachment; filename="{name}_resume.docx"'}
+    )
+
+
+async def stats(request):
+    """Resume and AI analysis statistics"""
+    resume_stats = await run_in_threadpool(get_resume_stats) or {}
+    return JSONResponse({
+        'resumes': {
+            'total_resumes': resume_stats.get('total_resumes', 0),
+            'avg_ats_score': resume_stats.get('avg_ats_score', 0),
+            'recent_activity': [
+                {'name': name, 'target_role': role, 'created_at': created_at}
+                for name, role, created_at in resume_stats.get('recent_activity', [])
+            ]
+        },
+        'ai_analysis': await run_in_threadpool(get_ai_analysis_stats),
+        'write_queue': get_write_queue_stats()
+    })
+
+
+async def metrics(request):
+    """Per-stage timing histograms of this process"""
+    return PlainTextResponse(tracing.prometheus_text(), media_type='text/plain; version=0.0.4')
+
+
+def handle_request_error(request, exc):
+    return JSONResponse({'error': str(exc)}, status_code=exc.status_code)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    init_database()
+    from utils.resume_builder import ResumeBuilder
+
+    app.state.pool = ProcessPoolExecutor(max_workers=API_WORKERS, initializer=warm_worker,
+                                         initargs=('standard', 'ai'))
+    # Start every worker now so the first requests do not pay for imports
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(app.state.pool, warm_worker) for _ in range(API_WORKERS)
+    ))
+    app.state.ai_analyzer = get_analyzer('ai')
+    app.state.builder = ResumeBuilder()
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown()
+        get_write_queue().flush()
+
+
+app = Starlette(
+    routes=[
+        Route('/analyze', analyze, methods=['POST']),
+        Route('/analyze/ai', analyze_ai, methods=['POST']),
+        Route('/build', build, methods=['POST']),
+        Route('/stats', stats, methods=['GET']),
+        Route('/metrics', metrics, methods=['GET']),
+    ],
+    exception_handlers={RequestError: handle_request_error},
+    lifespan=lifespan
+)
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the resume analyzer HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Extraction/scoring worker processes (default: CPU count)")
+    parser.add_argument('--trace', action='store_true', help="Record per-stage timings for /metrics")
+    parser.add_argument('--trace-file', help="Also append every span to this JSONL file (implies --trace)")
+    args = parser.parse_args()
+    if args.workers:
+        global API_WORKERS
+        API_WORKERS = args.workers
+    if args.trace or args.trace_file:
+        # Set in the environment too; pool workers follow this process through call_collecting()
+        os.environ['RESUME_TRACING'] = '1'
+        if args.trace_file:
+            os.environ['RESUME_TRACE_FILE'] = os.path.abspath(args.trace_file)
+        tracing.enable(os.environ.get('RESUME_TRACE_FILE'))
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,10 +22,14 @@ import requests
 from dashboard.dashboard import DashboardManager
 from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
 from config.job_roles import JOB_ROLES
+from config.tracing import span, traced
+from config.profiling import maybe_profile
 from config.database import (
     get_database_connection, save_resume_data, save_analysis_data,
     init_database, verify_admin, log_admin_action, save_ai_analysis_data,
-    get_ai_analysis_stats, reset_ai_analysis_stats, get_detailed_ai_analysis_stats
+    get_ai_analysis_stats, reset_ai_analysis_stats, get_detailed_ai_analysis_stats,
+    queue_ai_analysis_data, queue_resume_analysis, hash_bytes, get_document_text,
+    queue_document, queue_analysis_result, build_standard_analysis_records
 )
 from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
@@ -1247,26 +1251,37 @@ class ResumeApp:
                 unsafe_allow_html=True
             )
         else:
+            semantic = st.checkbox(
+                "Include semantic role match", value=False, key="standard_semantic",
+                help="Also compare your whole resume with every job role, not just the listed skills"
+            )
             if st.button("🔍 Analyze My Resume", type="primary", use_container_width=True):
-                with st.spinner("Analyzing your document..."):
+                with st.spinner("Analyzing your document..."), span('request.standard_analysis', role=selected_role):
                     try:
-                        # Extract text
-                        if uploaded_file.type == "application/pdf":
-                            text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                        else:
-                            text = self.analyzer.extract_text_from_docx(uploaded_file)
+                        # Profiled when an admin armed the profiler for the next run
+                        with maybe_profile('standard', uploaded_file.getvalue(), uploaded_file.name) as profile:
+                            # Extract text, reusing the stored text of a file seen before
+                            text, content_hash = self.get_resume_text(
+                                uploaded_file, self.analyzer, reuse_text=profile is None
+                            )
 
-                        if not text or text.strip() == "":
-                            st.error("Could not extract any text from the uploaded file.")
-                            return
+                            if not text or text.strip() == "":
+                                st.error("Could not extract any text from the uploaded file.")
+                                return
 
-                        # Analyze
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                            # Analyze
+                            analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info, semantic=semantic)
 
                         if 'error' in analysis:
                             st.error(analysis['error'])
                             return
 
+                        # Record the analysis for the dashboard without blocking the response
+                        if analysis.get('document_type') == 'resume':
+                            self.save_standard_analysis(
+                                analysis, selected_role, selected_category, content_hash
+                            )
+
                         st.snow()
 
                         # Display results
@@ -1275,6 +1290,39 @@ class ResumeApp:
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
 
+    @traced('get_resume_text')
+    def get_resume_text(self, uploaded_file, analyzer, reuse_text=True):
+        """Get the text of an uploaded resume and its content hash
+
+        Extracted text is stored per file hash, so re-uploading the same file
+        skips PDF parsing and OCR entirely unless ``reuse_text`` is False.
+        """
+        content_hash = hash_bytes(uploaded_file.getvalue())
+        # Lets other pages (e.g. LinkedIn job ranking) reuse the last analyzed resume
+        st.session_state.last_resume_hash = content_hash
+        text = get_document_text(content_hash) if reuse_text else None
+        if text is not None:
+            return text, content_hash
+
+        if uploaded_file.type == "application/pdf":
+            text = analyzer.extract_text_from_pdf(uploaded_file)
+        else:
+            text = analyzer.extract_text_from_docx(uploaded_file)
+
+        if text and text.strip():
+            queue_document(content_hash, text, uploaded_file.name, uploaded_file.type)
+        return text, content_hash
+
+    def save_standard_analysis(self, analysis, selected_role, selected_category, content_hash=None):
+        """Queue a standard analysis result for the dashboard tables"""
+        try:
+            resume_data, analysis_data = build_standard_analysis_records(
+                analysis, selected_role, selected_category, content_hash
+            )
+            queue_resume_analysis(resume_data, analysis_data, result=analysis)
+        except Exception as e:
+            print(f"Error queueing analysis data: {str(e)}")
+
     def display_standard_analysis_results(self, analysis, selected_role, selected_category):
         """Display standard analysis results"""
         col1, col2 = st.columns(2)
@@ -1341,6 +1389,26 @@ class ResumeApp:
 
             st.markdown("</div>", unsafe_allow_html=True)
 
+        semantic_match = analysis.get('semantic_match')
+        if semantic_match:
+            # Semantic Role Match Card
+            closest_roles = ''.join(
+                f"<p style='color: var(--text-secondary);'>• {match['role']} "
+                f"<span style='color: var(--primary-color);'>{match['similarity']}%</span></p>"
+                for match in semantic_match['top_roles']
+            )
+            st.markdown(f"""
+            <div class='feature-card'>
+                <h2 style='color: white; margin-bottom: 1rem;'>Semantic Role Match</h2>
+                <p style='color: var(--text-secondary);'>
+                    Similarity to {selected_role}:
+                    <span style='font-weight: bold; color: var(--primary-color);'>{semantic_match['score']}%</span>
+                </p>
+                <h4 style='color: var(--primary-color);'>Closest Roles:</h4>
+                {closest_roles}
+            </div>
+            """, unsafe_allow_html=True)
+
     def render_ai_analyzer(self):
         """Render AI analyzer content"""
         st.markdown("""
@@ -1392,31 +1460,33 @@ class ResumeApp:
             )
         else:
             if st.button("🤖 Analyze with AI", type="primary", use_container_width=True):
-                with st.spinner(f"Analyzing with {ai_model}..."):
+                with st.spinner(f"Analyzing with {ai_model}..."), span('request.ai_analysis', model=ai_model, role=selected_role):
                     try:
-                        # Extract text
-                        if uploaded_file.type == "application/pdf":
-                            text = self.ai_analyzer.extract_text_from_pdf(uploaded_file)
-                        else:
-                            text = self.ai_analyzer.extract_text_from_docx(uploaded_file)
-
-                        # Analyze with AI
-                        if use_custom_job_desc and custom_job_description:
-                            analysis_result = self.ai_analyzer.analyze_resume_with_gemini(
-                                text, job_role=selected_role, job_description=custom_job_description
-                            )
-                        else:
-                            analysis_result = self.ai_analyzer.analyze_resume_with_gemini(
-                                text, job_role=selected_role
+                        # Profiled when an admin armed the profiler for the next run
+                        with maybe_profile(ai_model, uploaded_file.getvalue(), uploaded_file.name) as profile:
+                            # Extract text, reusing the stored text of a file seen before
+                            text, content_hash = self.get_resume_text(
+                                uploaded_file, self.ai_analyzer, reuse_text=profile is None
                             )
 
+                            # Analyze with AI
+                            if use_custom_job_desc and custom_job_description:
+                                analysis_result = self.ai_analyzer.analyze_resume_with_gemini(
+                                    text, job_role=selected_role, job_description=custom_job_description
+                                )
+                            else:
+                                analysis_result = self.ai_analyzer.analyze_resume_with_gemini(
+                                    text, job_role=selected_role
+                                )
+
                         if analysis_result and "error" not in analysis_result:
-                            # Save to database
-                            save_ai_analysis_data(None, {
+                            # Save to database in the background
+                            queue_ai_analysis_data(None, {
                                 "model_used": ai_model,
                                 "resume_score": analysis_result.get("resume_score", 0),
                                 "job_role": selected_role
                             })
+                            queue_analysis_result(content_hash, ai_model, selected_role, analysis_result)
 
                             st.snow()
                             st.success("✅ Analysis complete!")
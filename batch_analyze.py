@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Headless batch analysis for Smart AI Resume Analyzer
+
+Analyzes a directory or glob of PDF/DOCX resumes against one job role without
+the Streamlit UI. Files are extracted and scored across a process pool;
+results stream to a JSONL or CSV file and into the dashboard database.
+
+Re-running with the same output file skips every file that already has a
+successful result, so an interrupted batch picks up where it stopped.
+
+Usage:
+    python batch_analyze.py resumes/ --role "Backend Developer" -o results.jsonl
+    python batch_analyze.py "inbox/**/*.pdf" --role "Data Scientist" -o results.csv
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config.database import (
+    init_database, get_database_connection, insert_document, insert_resume_data, insert_analysis_data, insert_analysis_result,
+    index_document_text, build_standard_analysis_records, without_personal_info
+)
+from utils.pipeline import SUPPORTED_EXTENSIONS, find_role, warm_worker, analyze_document
+
+# Columns written to CSV output; JSONL output also carries the full analysis
+RESULT_COLUMNS = [
+    'file', 'status', 'error', 'content_hash', 'document_type', 'ats_score',
+    'keyword_match_score', 'format_score', 'section_score', 'missing_skills', 'semantic_score'
+]
+
+# Per-file stages, plus database writes timed per transaction of --db-batch-size results
+STAGES = ('read', 'extract', 'analyze', 'write_batch')
+
+
+def find_files(source):
+    """Expand a directory (recursively) or glob pattern into supported resume files"""
+    if os.path.isdir(source):
+        pattern = os.path.join(source, '**', '*')
+    else:
+        pattern = source
+    return sorted(
+        path for path in glob.glob(pattern, recursive=True)
+        if os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS)
+    )
+
+
+def analyze_file(path, requirements, semantic=False, use_stored=True):
+    """Read and analyze one file in a worker process
+
+    ``use_stored`` lets extraction reuse text already stored in the database.
+    """
+    start = time.perf_counter()
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError as e:
+        return {'file': path, 'status': 'error', 'error': str(e), 'timings': {}}
+    read_time = time.perf_counter() - start
+
+    result = analyze_document(content, path, requirements, semantic, use_stored)
+    result['file'] = path
+    result['timings']['read'] = read_time
+    return result
+
+
+class ResultWriter:
+    """Append results to a JSONL or CSV file, flushing after each one"""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'a', newline='', encoding='utf-8')
+        if self.format == 'csv':
+            self.writer = csv.DictWriter(self.file, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+            if new_file:
+                self.writer.writeheader()
+
+    def write(self, row):
+        if self.format == 'csv':
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def load_completed(path):
+    """Files that already have a successful result in an existing output file"""
+    if not os.path.exists(path):
+        return set()
+    completed = set()
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for row in rows:
+            if row.get('status') == 'ok':
+                completed.add(row['file'])
+    return completed
+
+
+def output_row(result):
+    """Flatten a worker result into an output row"""
+    analysis = result.get('analysis') or {}
+    keyword_match = analysis.get('keyword_match', {})
+    row = {
+        'file': result['file'],
+        'status': result['status'],
+        'error': result['error'],
+        'content_hash': result.get('content_hash'),
+        'document_type': analysis.get('document_type'),
+        'ats_score': analysis.get('ats_score'),
+        'keyword_match_score': keyword_match.get('score'),
+        'format_score': analysis.get('format_score'),
+        'section_score': analysis.get('section_score'),
+        'missing_skills': ', '.join(keyword_match.get('missing_skills', [])),
+        'semantic_score': (analysis.get('semantic_match') or {}).get('score')
+    }
+    return row
+
+
+def save_results(conn, results, role, category):
+    """Write a batch of successful results to the database in one transaction"""
+    cursor = conn.cursor()
+    for result in results:
+        content_hash = result['content_hash']
+        if result.get('text'):
+            insert_document(cursor, content_hash, result['text'], os.path.basename(result['file']))
+        analysis = result['analysis']
+        if analysis.get('document_type') != 'resume':
+            continue
+        resume_data, analysis_data = build_standard_analysis_records(analysis, role, category, content_hash)
+        resume_id = insert_resume_data(cursor, resume_data)
+        insert_analysis_data(cursor, resume_id, analysis_data)
+        index_document_text(cursor, resume_id, content_hash)
+        insert_analysis_result(cursor, content_hash, 'standard', role, without_personal_info(analysis), resume_id)
+    conn.commit()
+
+
+def print_timing_report(timings, processed, failed, elapsed):
+    print(f"\nProcessed {processed} files ({failed} failed) in {elapsed:.1f}s "
+          f"- {processed / elapsed if elapsed else 0:.1f} files/sec")
+    print(f"{'stage':<12}{'total s':>10}{'mean ms':>10}{'p95 ms':>10}")
+    for stage in STAGES:
+        values = sorted(timings[stage])
+        if not values:
+            continue
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"{stage:<12}{sum(values):>10.2f}{sum(values) / len(values) * 1000:>10.1f}{p95 * 1000:>10.1f}")
+
+
+def run_batch(files, role, category, requirements, output, workers=None, db_batch_size=50, save_to_db=True,
+              semantic=False):
+    """Analyze files across a process pool, streaming results as they finish"""
+    completed = load_completed(output)
+    pending = [path for path in files if path not in completed]
+    if completed:
+        print(f"Skipping {len(files) - len(pending)} files already in {output}")
+    if not pending:
+        print("Nothing to do")
+        return
+
+    if save_to_db:
+        init_database()
+    conn = get_database_connection() if save_to_db else None
+    writer = ResultWriter(output)
+    timings = {stage: [] for stage in STAGES}
+    to_save, processed, failed = [], 0, 0
+    start = time.perf_counter()
+
+    def flush():
+        # Rows reach the database before the results file marks them done,
+        # so a crash never skips a file that was not saved
+        write_start = time.perf_counter()
+        save_results(conn, to_save, role, category)
+        timings['write_batch'].append(time.perf_counter() - write_start)
+        for saved in to_save:
+            writer.write(result_row(writer, saved))
+        to_save.clear()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker) as pool:
+            futures = [
+                pool.submit(analyze_file, path, requirements, semantic, save_to_db) for path in pending
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                processed += 1
+                for stage, seconds in result['timings'].items():
+                    timings[stage].append(seconds)
+
+                if result['status'] != 'ok':
+                    failed += 1
+                    print(f"[{processed}/{len(pending)}] {result['file']}: {result['error']}")
+                    writer.write(result_row(writer, result))
+                elif save_to_db:
+                    to_save.append(result)
+                    if len(to_save) >= db_batch_size:
+                        flush()
+                else:
+                    writer.write(result_row(writer, result))
+
+                if processed % 25 == 0:
+                    print(f"[{processed}/{len(pending)}] {processed / (time.perf_counter() - start):.1f} files/sec")
+    finally:
+        if to_save:
+            flush()
+        writer.close()
+        if conn:
+            conn.close()
+
+    print_timing_report(timings, processed, failed, time.perf_counter() - start)
+
+
+def result_row(writer, result):
+    """Output row for a result; JSONL rows also carry the full analysis"""
+    row = output_row(result)
+    if writer.format == 'jsonl' and result.get('analysis'):
+        row['analysis'] = result['analysis']
+    row['timings_ms'] = {stage: round(seconds * 1000, 1) for stage, seconds in result['timings'].items()}
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze a batch of PDF/DOCX resumes against a job role")
+    parser.add_argument('source', help="Directory (searched recursively) or glob pattern of resumes")
+    parser.add_argument('--role', required=True, help="Target role, as named in config/job_roles.py")
+    parser.add_argument('--category', help="Role category (optional if the role name is unique)")
+    parser.add_argument('-o', '--output', default='batch_results.jsonl',
+                        help="Results file; .csv for CSV, anything else for JSON Lines")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--db-batch-size', type=int, default=50, help="Results per database transaction")
+    parser.add_argument('--no-db', action='store_true', help="Only write the results file")
+    parser.add_argument('--semantic', action='store_true',
+                        help="Also score each resume against every role by semantic similarity")
+    args = parser.parse_args()
+
+    category, requirements = find_role(args.role, args.category)
+    if not requirements:
+        print(f"Unknown role: {args.role}")
+        sys.exit(1)
+
+    files = find_files(args.source)
+    if not files:
+        print(f"No PDF or DOCX files found for {args.source}")
+        sys.exit(1)
+
+    print(f"Analyzing {len(files)} files for {args.role} ({category})")
+    run_batch(
+        files, args.role, category, requirements, args.output,
+        workers=args.workers, db_batch_size=args.db_batch_size, save_to_db=not args.no_db,
+        semantic=args.semantic
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Synthetic resume corpus for the benchmark suite
+
+Generates reproducible resumes of varied length and renders each one as a
+text PDF (reportlab), a scanned PDF (the text drawn onto page images with
+Pillow, so only OCR can read it) and a DOCX (python-docx).
+"""
+import io
+import os
+import random
+import textwrap
+
+FIRST_NAMES = ['Aarav', 'Maya', 'Liam', 'Sofia', 'Noah', 'Priya', 'Ethan', 'Zara', 'Lucas', 'Ana']
+LAST_NAMES = ['Sharma', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Silva', 'Kim', 'Patel', 'Rossi', 'Khan']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Hooli']
+TITLES = ['Software Engineer', 'Data Analyst', 'Backend Developer', 'Frontend Developer',
+          'DevOps Engineer', 'Machine Learning Engineer', 'Product Manager']
+DEGREES = ['Bachelor of Technology in Computer Science', 'Master of Science in Data Science',
+           'Bachelor of Science in Information Technology', 'MBA in Technology Management']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+SKILLS = ['Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue.js', 'Node.js',
+          'Django', 'Flask', 'SQL', 'PostgreSQL', 'MongoDB', 'Docker', 'Kubernetes', 'AWS', 'Azure',
+          'Git', 'CI/CD', 'Terraform', 'TensorFlow', 'PyTorch', 'Pandas', 'HTML', 'CSS', 'REST APIs',
+          'Agile', 'Scrum', 'Linux', 'Jenkins']
+VERBS = ['Developed', 'Designed', 'Implemented', 'Led', 'Improved', 'Managed', 'Created', 'Automated']
+OBJECTS = ['a microservice platform', 'the data pipeline', 'customer-facing dashboards',
+           'the CI/CD workflow', 'a recommendation engine', 'internal APIs', 'the deployment process']
+RESULTS = ['reducing latency by {n}%', 'serving {n}k daily users', 'cutting costs by {n}%',
+           'improving test coverage to {n}%', 'saving {n} hours per week']
+
+# Number of experience entries, bullets per entry and projects per size class
+SIZES = {
+    'short': (1, 2, 1),
+    'medium': (3, 4, 2),
+    'long': (6, 6, 4),
+}
+
+
+def generate_resume_text(rng, size='medium'):
+    """Build one plain-text resume with the usual sections"""
+    jobs, bullets, projects = SIZES[size]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    skills = rng.sample(SKILLS, rng.randint(6, 15))
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        f"linkedin.com/in/{first.lower()}-{last.lower()} | github.com/{first.lower()}{last.lower()}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(TITLES)} with {rng.randint(1, 12)} years of experience building software with "
+        f"{', '.join(skills[:3])}. Passionate about reliable systems, clean code and measurable impact "
+        "for users and the business.",
+        "",
+        "EXPERIENCE",
+    ]
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 3)
+        lines.append(f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)} ({start} - {year})")
+        for _ in range(bullets):
+            result = rng.choice(RESULTS).format(n=rng.randint(10, 90))
+            lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)}, {result}")
+        year = start
+    lines += ["", "EDUCATION"]
+    lines.append(f"{rng.choice(DEGREES)} - {rng.choice(SCHOOLS)} ({year - 4} - {year}) CGPA {rng.randint(70, 98) / 10}")
+    lines += ["", "PROJECTS"]
+    for i in range(projects):
+        lines.append(f"Project {i + 1}: {rng.choice(OBJECTS).capitalize()}")
+        lines.append(f"• Built with {', '.join(rng.sample(skills, 3))}")
+    lines += ["", "SKILLS", ', '.join(skills)]
+    return '\n'.join(lines)
+
+
+def render_text_pdf(text):
+    """Render text into a PDF with a real text layer"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    y = height - 50
+    for line in text.split('\n'):
+        for wrapped in textwrap.wrap(line, 95) or ['']:
+            if y < 50:
+                pdf.showPage()
+                y = height - 50
+            pdf.drawString(50, y, wrapped)
+            y -= 14
+    pdf.save()
+    return buffer.getvalue()
+
+
+def render_scanned_pdf(text, dpi=150):
+    """Render text onto page images and save them as an image-only PDF"""
+    from PIL import Image, ImageDraw
+
+    page_width, page_height = int(8.5 * dpi), int(11 * dpi)
+    line_height, margin = int(dpi * 0.2), int(dpi * 0.5)
+    lines = [wrapped for line in text.split('\n') for wrapped in (textwrap.wrap(line, 95) or [''])]
+    per_page = (page_height - 2 * margin) // line_height
+
+    pages = []
+    for start in range(0, len(lines), per_page):
+        page = Image.new('L', (page_width, page_height), 255)
+        draw = ImageDraw.Draw(page)
+        for i, line in enumerate(lines[start:start + per_page]):
+            draw.text((margin, margin + i * line_height), line, fill=0)
+        pages.append(page)
+
+    buffer = io.BytesIO()
+    pages[0].save(buffer, format='PDF', save_all=True, append_images=pages[1:], resolution=dpi)
+    return buffer.getvalue()
+
+
+def render_docx(text):
+    """Render text into a DOCX document, one paragraph per line"""
+    from docx import Document
+
+    document = Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+RENDERERS = {
+    'text_pdf': ('pdf', render_text_pdf),
+    'scanned_pdf': ('pdf', render_scanned_pdf),
+    'docx': ('docx', render_docx),
+}
+
+
+def generate_corpus(out_dir, count=30, seed=42, formats=tuple(RENDERERS)):
+    """Write a corpus to ``out_dir`` and return its entries
+
+    Each entry is a dict with the text, size class, and the rendered file
+    path per format. Files already on disk are reused, so repeated runs with
+    the same seed do not regenerate them. A format whose renderer library is
+    not installed is left out of every entry.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    sizes = list(SIZES)
+    formats = list(formats)
+    corpus = []
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        text = generate_resume_text(rng, size)
+        entry = {'id': i, 'size': size, 'text': text, 'files': {}}
+        for fmt in list(formats):
+            extension, render = RENDERERS[fmt]
+            path = os.path.join(out_dir, f"resume_{seed}_{i:04d}_{fmt}.{extension}")
+            if not os.path.exists(path):
+                try:
+                    content = render(text)
+                except ImportError as e:
+                    print(f"Skipping {fmt} files: {e}")
+                    formats.remove(fmt)
+                    continue
+                with open(path, 'wb') as f:
+                    f.write(content)
+            entry['files'][fmt] = path
+        corpus.append(entry)
+    return corpus
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the resume extraction and analysis stages
+
+Generates a synthetic corpus (see benchmarks/corpus.py) and times each stage
+on its own: the three PDF extractors, DOCX extraction, the extract_* section
+parsers, keyword matching, formatting checks and analyze_resume end to end.
+
+Each stage runs in a fresh worker process by default, so its peak RSS is not
+inflated by the stages before it. Results are written as JSON with p50/p95
+latency, throughput and peak RSS per stage; pass an earlier results file as
+--baseline to print the change in p50 for every stage.
+
+Usage:
+    python -m benchmarks.run --out benchmark_results.json
+    python -m benchmarks.run --stages extract.resume_analyzer,analyze_resume --count 60
+    python -m benchmarks.run --baseline previous.json --out current.json
+"""
+import argparse
+import datetime
+import json
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.corpus import generate_corpus
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+DEFAULT_ROLE = ('Software Development and Engineering', 'Backend Developer')
+
+SECTION_PARSERS = (
+    'extract_personal_info', 'extract_education', 'extract_experience',
+    'extract_projects', 'extract_skills', 'extract_summary'
+)
+
+# Stage name -> input the stage consumes: a rendered format, or 'text'
+STAGES = {
+    'extract.resume_analyzer': 'text_pdf',
+    'extract.resume_parser': 'text_pdf',
+    'extract.ai_analyzer': 'text_pdf',
+    'extract.ai_analyzer.ocr': 'scanned_pdf',
+    'extract.docx': 'docx',
+    **{f'sections.{name}': 'text' for name in SECTION_PARSERS},
+    'calculate_keyword_match': 'text',
+    'check_formatting': 'text',
+    'analyze_resume': 'text',
+}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def build_stage(name, requirements):
+    """Return a callable taking one stage input"""
+    if name == 'extract.resume_analyzer':
+        from utils.resume_analyzer import ResumeAnalyzer
+        return ResumeAnalyzer().extract_text_from_pdf
+    if name == 'extract.resume_parser':
+        from utils.resume_parser import ResumeParser
+        return ResumeParser().extract_text_from_pdf
+    if name in ('extract.ai_analyzer', 'extract.ai_analyzer.ocr'):
+        from utils.ai_resume_analyzer import AIResumeAnalyzer
+        return AIResumeAnalyzer().extract_text_from_pdf
+    if name == 'extract.docx':
+        import io
+        from utils.resume_analyzer import ResumeAnalyzer
+        extract_docx = ResumeAnalyzer().extract_text_from_docx
+        return lambda content: extract_docx(io.BytesIO(content))
+
+    from utils.resume_analyzer import ResumeAnalyzer
+    analyzer = ResumeAnalyzer()
+    if name.startswith('sections.'):
+        return getattr(analyzer, name.split('.', 1)[1])
+    if name == 'calculate_keyword_match':
+        required_skills = requirements.get('required_skills', [])
+        return lambda text: analyzer.calculate_keyword_match(text, required_skills)
+    if name == 'check_formatting':
+        return analyzer.check_formatting
+    if name == 'analyze_resume':
+        return lambda text: analyzer.analyze_resume({'raw_text': text}, requirements)
+    raise ValueError(f"Unknown stage: {name}")
+
+
+def load_inputs(name, corpus):
+    """Stage inputs as (size, value) pairs, read before timing starts"""
+    source = STAGES[name]
+    inputs = []
+    for entry in corpus:
+        if source == 'text':
+            inputs.append((entry['size'], entry['text']))
+        elif source not in entry['files']:
+            raise RuntimeError(f"No {source} files in the corpus (renderer not installed)")
+        else:
+            with open(entry['files'][source], 'rb') as f:
+                inputs.append((entry['size'], f.read()))
+    return inputs
+
+
+def run_stage(name, corpus, requirements, repeat=3, warmup=1):
+    """Time one stage over the corpus and summarise it
+
+    Setup (imports, analyzer construction) and ``warmup`` passes over the
+    first few inputs are excluded from the samples.
+    """
+    inputs = load_inputs(name, corpus)
+    start = time.perf_counter()
+    func = build_stage(name, requirements)
+    setup_seconds = time.perf_counter() - start
+
+    for _, value in inputs[:warmup]:
+        try:
+            func(value)
+        except Exception:
+            pass
+
+    samples, by_size, errors = [], {}, []
+    busy = 0.0
+    for _ in range(repeat):
+        for size, value in inputs:
+            start = time.perf_counter()
+            try:
+                func(value)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            busy += elapsed
+            samples.append(elapsed)
+            by_size.setdefault(size, []).append(elapsed)
+
+    return {
+        'input': STAGES[name],
+        'setup_ms': round(setup_seconds * 1000, 2),
+        **summarise(samples, busy),
+        'by_size': {size: summarise(values, sum(values)) for size, values in sorted(by_size.items())},
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def summarise(samples, busy):
+    samples = sorted(samples)
+    return {
+        'samples': len(samples),
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 3) if samples else None,
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 3) if samples else None,
+        'mean_ms': round(busy / len(samples) * 1000, 3) if samples else None,
+        'throughput_per_sec': round(len(samples) / busy, 2) if busy else None,
+    }
+
+
+def _stage_worker(args):
+    name, corpus, requirements, repeat, warmup = args
+    try:
+        return run_stage(name, corpus, requirements, repeat, warmup)
+    except Exception as e:
+        # Missing optional dependencies (e.g. Tesseract for OCR) skip the stage
+        return {'input': STAGES[name], 'skipped': f"{type(e).__name__}: {e}", 'peak_rss_mb': peak_rss_mb()}
+
+
+def run_isolated(name, corpus, requirements, repeat, warmup):
+    """Run a stage in a fresh process so its peak RSS is its own"""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(_stage_worker, ((name, corpus, requirements, repeat, warmup),))
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(stages, count=30, seed=42, repeat=3, warmup=1, corpus_dir=DEFAULT_CORPUS_DIR,
+                   isolate=True, progress=print):
+    """Run the selected stages and return the full report dict"""
+    from config.job_roles import JOB_ROLES
+
+    formats = sorted({STAGES[name] for name in stages} - {'text'})
+    start = time.perf_counter()
+    corpus = generate_corpus(corpus_dir, count=count, seed=seed, formats=formats)
+    rendered = sorted(corpus[0]['files']) if corpus else []
+    progress(f"Corpus: {len(corpus)} resumes ({', '.join(rendered) or 'text only'}) "
+             f"in {time.perf_counter() - start:.1f}s")
+
+    category, role = DEFAULT_ROLE
+    requirements = JOB_ROLES[category][role]
+
+    results = {}
+    for name in stages:
+        if isolate:
+            result = run_isolated(name, corpus, requirements, repeat, warmup)
+        else:
+            result = _stage_worker((name, corpus, requirements, repeat, warmup))
+        results[name] = result
+        if 'skipped' in result:
+            progress(f"{name:<36} skipped: {result['skipped']}")
+        else:
+            progress(f"{name:<36} p50 {result['p50_ms']:>9.3f} ms  p95 {result['p95_ms']:>9.3f} ms  "
+                     f"{result['throughput_per_sec']:>9.1f}/s  rss {result['peak_rss_mb']} MB"
+                     + (f"  ({result['errors']} errors)" if result['errors'] else ''))
+
+    return {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': {'count': count, 'seed': seed, 'repeat': repeat, 'warmup': warmup,
+                   'isolated': isolate, 'role': role},
+        'stages': results,
+    }
+
+
+def print_comparison(report, baseline):
+    """Print the p50 change of each stage against an earlier report"""
+    print(f"\nCompared with {baseline.get('git_revision')} ({baseline.get('created_at')}):")
+    print(f"{'stage':<36}{'base p50':>12}{'p50':>12}{'change':>10}")
+    for name, result in report['stages'].items():
+        previous = baseline.get('stages', {}).get(name, {})
+        before, after = previous.get('p50_ms'), result.get('p50_ms')
+        if not before or after is None:
+            continue
+        print(f"{name:<36}{before:>12.3f}{after:>12.3f}{(after - before) / before * 100:>+9.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume extraction and analysis stages")
+    parser.add_argument('--stages', help="Comma-separated stages (default: all). Prefixes such as "
+                                         "'extract' or 'sections' select a group")
+    parser.add_argument('--count', type=int, default=30, help="Resumes in the synthetic corpus")
+    parser.add_argument('--seed', type=int, default=42, help="Corpus random seed")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes over the corpus per stage")
+    parser.add_argument('--warmup', type=int, default=1, help="Untimed calls before each stage")
+    parser.add_argument('--corpus-dir', default=DEFAULT_CORPUS_DIR, help="Where rendered files are cached")
+    parser.add_argument('--in-process', action='store_true',
+                        help="Run every stage in this process (faster, but peak RSS accumulates)")
+    parser.add_argument('--out', help="Write the JSON report here (default: stdout)")
+    parser.add_argument('--baseline', help="Earlier JSON report to compare against")
+    parser.add_argument('--list', action='store_true', help="List stages and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, source in STAGES.items():
+            print(f"{name:<36}{source}")
+        return
+
+    stages = list(STAGES)
+    if args.stages:
+        wanted = [s.strip() for s in args.stages.split(',') if s.strip()]
+        stages = [name for name in STAGES if any(name == w or name.startswith(w + '.') for w in wanted)]
+        if not stages:
+            parser.error(f"No stages match {args.stages}; use --list to see them")
+
+    # Progress goes to stderr when the report itself goes to stdout
+    log = print if args.out else (lambda message: print(message, file=sys.stderr))
+    report = run_benchmarks(stages, args.count, args.seed, args.repeat, args.warmup,
+                            args.corpus_dir, isolate=not args.in_process, progress=log)
+    report['peak_rss_mb'] = peak_rss_mb()
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.out}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            print_comparison(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
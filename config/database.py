@@ -1,6 +1,24 @@
+import ast
+import hashlib
+import json
 import sqlite3
+import threading
+import time
+import zlib
 from datetime import datetime
 
+from config.skills import get_roles_fingerprint
+from config.write_queue import get_write_queue
+
+# Columns of resume_data that hold structured (list/dict) values as JSON text
+JSON_COLUMNS = ('education', 'experience', 'projects', 'skills')
+
+# Bumped whenever init_database gains a data migration
+SCHEMA_VERSION = 3
+
+# Tables whose writes bump the data_version counter read by the dashboard cache
+VERSIONED_TABLES = ('resume_data', 'resume_analysis', 'ai_analysis', 'admin_logs')
+
 def get_database_connection():
     """Create and return a database connection"""
     conn = sqlite3.connect('resume_data.db')
@@ -24,11 +42,12 @@ def init_database():
         summary TEXT,
         target_role TEXT,
         target_category TEXT,
-        education TEXT,
-        experience TEXT,
-        projects TEXT,
-        skills TEXT,
+        education TEXT,     -- JSON
+        experience TEXT,    -- JSON
+        projects TEXT,      -- JSON
+        skills TEXT,        -- JSON
         template TEXT,
+        document_hash TEXT, -- resume_documents.content_hash
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     ''')
@@ -82,42 +101,346 @@ def init_database():
     )
     ''')
     
+    # Create ai_analysis table
+    cursor.execute(AI_ANALYSIS_TABLE)
+    
+    # Extracted text of uploaded files, keyed by a hash of the file
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_documents (
+        content_hash TEXT PRIMARY KEY,  -- sha256 of the uploaded file
+        file_name TEXT,
+        file_type TEXT,
+        text_hash TEXT NOT NULL,        -- sha256 of the extracted text
+        text_length INTEGER NOT NULL,
+        text_blob BLOB NOT NULL,        -- zlib-compressed UTF-8 text
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    
+    # Full structured output of every standard and AI analysis
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content_hash TEXT NOT NULL,
+        analyzer TEXT NOT NULL,         -- 'standard' or the AI model name
+        job_role TEXT,
+        resume_id INTEGER,
+        result_blob BLOB NOT NULL,      -- zlib-compressed JSON
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (content_hash) REFERENCES resume_documents (content_hash),
+        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    )
+    ''')
+    
+    # cProfile runs of single analyses, captured on demand from the admin dashboard
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_profiles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        content_hash TEXT NOT NULL,     -- sha256 of the profiled input file
+        file_name TEXT,
+        analyzer TEXT NOT NULL,         -- 'standard' or the AI model name
+        duration_ms REAL NOT NULL,
+        top_functions TEXT,             -- JSON: hottest functions by cumulative time
+        profile_blob BLOB NOT NULL,     -- zlib-compressed .prof (marshalled pstats) data
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    
+    # Job postings collected by the LinkedIn scraper
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS scraped_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL UNIQUE,
+        title TEXT,
+        company TEXT,
+        location TEXT,
+        source TEXT NOT NULL DEFAULT 'linkedin',
+        description_blob BLOB NOT NULL, -- zlib-compressed UTF-8 text
+        -- Millisecond precision: utils/job_index re-indexes a job when this changes
+        scraped_at TIMESTAMP DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+    )
+    ''')
+    
+    # Inverted index from canonical skill (config.skills) to the jobs mentioning it
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS scraped_job_skills (
+        skill TEXT NOT NULL,
+        job_id INTEGER NOT NULL,
+        PRIMARY KEY (skill, job_id),
+        FOREIGN KEY (job_id) REFERENCES scraped_jobs (id)
+    ) WITHOUT ROWID
+    ''')
+    
+    # Progress of utils/rescoring runs, one row per JOB_ROLES fingerprint
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS rescore_checkpoints (
+        roles_hash TEXT PRIMARY KEY,
+        last_resume_id INTEGER NOT NULL DEFAULT 0,
+        processed INTEGER NOT NULL DEFAULT 0,
+        skipped INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        completed_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    
+    # Indexes used by the dashboard joins and date-range queries
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_data_target_role ON resume_data (target_role)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)')
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_analysis_results_lookup
+    ON analysis_results (content_hash, analyzer, job_role)
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_scraped_job_skills_job_id ON scraped_job_skills (job_id)')
+    
+    create_data_version_triggers(cursor)
+    create_search_index(cursor)
+    migrate_database(conn)
+    record_rescore_baseline(cursor)
+    
     conn.commit()
     conn.close()
 
+def record_rescore_baseline(cursor):
+    """Mark scores as current for the present JOB_ROLES on a database that was never re-scored
+
+    Scores saved so far were computed against the roles in use now, so they
+    become the baseline that later role changes are detected against.
+    """
+    cursor.execute('''
+    INSERT INTO rescore_checkpoints (roles_hash, completed_at)
+    SELECT ?, CURRENT_TIMESTAMP
+    WHERE NOT EXISTS (SELECT 1 FROM rescore_checkpoints)
+    ''', (get_roles_fingerprint(),))
+
+def create_data_version_triggers(cursor):
+    """Create the data_version counter and the triggers that bump it on every write"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS data_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)')
+    
+    # Triggers run inside the writing transaction, so every save_*/insert_*
+    # path (including other processes) bumps the version atomically
+    for table in VERSIONED_TABLES:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS bump_data_version_{table}_{event.lower()}
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_version SET version = version + 1 WHERE id = 1;
+            END
+            ''')
+
+def get_data_version(conn=None):
+    """Get the monotonic data version, or None if the counter does not exist yet"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT version FROM data_version WHERE id = 1')
+        row = cursor.fetchone()
+        return row[0] if row else None
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        if own_conn:
+            conn.close()
+
+# Columns mirrored into resume_fts and their bm25 weights (skills and role rank highest)
+RESUME_FTS_COLUMNS = (
+    ('name', 2.0),
+    ('summary', 1.0),
+    ('skills', 4.0),
+    ('experience', 1.0),
+    ('target_role', 3.0),
+    ('resume_text', 1.0),
+)
+
+def json_text_sql(column):
+    """SQL expression flattening a JSON column to its text values for indexing"""
+    return f'''(CASE WHEN json_valid({column}) THEN (
+        SELECT group_concat(value, ' ') FROM json_tree({column}) WHERE type = 'text'
+    ) ELSE {column} END)'''
+
+def resume_fts_values_sql(row):
+    """SQL values of one resume_fts row built from the resume_data row alias ``row``"""
+    return f'''
+        {row}.id,
+        {row}.name,
+        {row}.summary,
+        {json_text_sql(row + '.skills')},
+        {json_text_sql(row + '.experience')},
+        {row}.target_role,
+        COALESCE({json_text_sql(row + '.projects')}, '') || ' ' ||
+        COALESCE({json_text_sql(row + '.education')}, '')
+    '''
+
+def create_search_index(cursor):
+    """Create the resume_fts full-text index and the triggers keeping it in sync"""
+    columns = ', '.join(name for name, _ in RESUME_FTS_COLUMNS)
+    cursor.execute(f'''
+    CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+        {columns},
+        tokenize = 'porter unicode61'
+    )
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS resume_fts_insert AFTER INSERT ON resume_data
+    BEGIN
+        INSERT INTO resume_fts (rowid, {columns}) VALUES ({resume_fts_values_sql('NEW')});
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS resume_fts_update AFTER UPDATE ON resume_data
+    BEGIN
+        UPDATE resume_fts SET
+            name = NEW.name,
+            summary = NEW.summary,
+            skills = {json_text_sql('NEW.skills')},
+            experience = {json_text_sql('NEW.experience')},
+            target_role = NEW.target_role
+        WHERE rowid = OLD.id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS resume_fts_delete AFTER DELETE ON resume_data
+    BEGIN
+        DELETE FROM resume_fts WHERE rowid = OLD.id;
+    END
+    ''')
+
+def rebuild_search_index(cursor):
+    """Re-index every resume, e.g. after the index is first created"""
+    columns = ', '.join(name for name, _ in RESUME_FTS_COLUMNS)
+    cursor.execute('DELETE FROM resume_fts')
+    cursor.execute(f'''
+    INSERT INTO resume_fts (rowid, {columns})
+    SELECT {resume_fts_values_sql('r')} FROM resume_data r
+    ''')
+    # Resumes with stored document text are searched by that text instead
+    cursor.execute('PRAGMA table_info(resume_data)')
+    if 'document_hash' in [row[1] for row in cursor.fetchall()]:
+        cursor.execute('SELECT id, document_hash FROM resume_data WHERE document_hash IS NOT NULL')
+        for resume_id, content_hash in cursor.fetchall():
+            index_document_text(cursor, resume_id, content_hash)
+
+def to_fts_query(text):
+    """Turn free text typed into a search box into a safe FTS5 MATCH expression
+
+    Every word is quoted so punctuation such as "C++" or "node.js" cannot
+    break the query syntax. Words are ANDed; a bare OR is kept as an
+    operator and a trailing * makes a prefix search.
+    """
+    terms = []
+    for word in str(text or '').split():
+        if word == 'OR' and terms and terms[-1] != 'OR':
+            terms.append(word)
+            continue
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    if terms and terms[-1] == 'OR':
+        terms.pop()
+    return ' '.join(terms)
+
+def to_json_column(value):
+    """Serialize a structured resume field for storage in a JSON column"""
+    if value is None or value == '':
+        return '[]'
+    return json.dumps(value, ensure_ascii=False)
+
+def legacy_to_python(value):
+    """Parse a value written before JSON columns (str() repr or comma-joined)"""
+    if value is None or not str(value).strip():
+        return []
+    try:
+        parsed = ast.literal_eval(value)
+        if isinstance(parsed, (list, tuple, dict)):
+            return list(parsed) if isinstance(parsed, tuple) else parsed
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        pass
+    return [item.strip() for item in str(value).split(',') if item.strip()]
+
+def migrate_database(conn):
+    """Apply pending data migrations, tracked with PRAGMA user_version"""
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA user_version')
+    version = cursor.fetchone()[0]
+    
+    if version < 1:
+        # Convert str(list)/comma-joined structured fields into JSON text
+        for column in JSON_COLUMNS:
+            cursor.execute(f'''
+            SELECT id, {column} FROM resume_data
+            WHERE {column} IS NULL
+               OR json_valid({column}) = 0
+               OR json_type({column}) NOT IN ('array', 'object')
+            ''')
+            rows = cursor.fetchall()
+            cursor.executemany(
+                f'UPDATE resume_data SET {column} = ? WHERE id = ?',
+                [(to_json_column(legacy_to_python(value)), row_id) for row_id, value in rows]
+            )
+    
+    if version < 2:
+        # resume_fts and its triggers were just created; index existing resumes
+        rebuild_search_index(cursor)
+    
+    if version < 3:
+        # Link resumes to their stored document text
+        cursor.execute('PRAGMA table_info(resume_data)')
+        if 'document_hash' not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE resume_data ADD COLUMN document_hash TEXT')
+    
+    if version < SCHEMA_VERSION:
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+def insert_resume_data(cursor, data):
+    """Insert a resume_data row with the given cursor and return its id"""
+    personal_info = data.get('personal_info', {})
+    
+    cursor.execute('''
+    INSERT INTO resume_data (
+        name, email, phone, linkedin, github, portfolio,
+        summary, target_role, target_category, education, 
+        experience, projects, skills, template, document_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        to_json_column(data.get('education', [])),
+        to_json_column(data.get('experience', [])),
+        to_json_column(data.get('projects', [])),
+        to_json_column(data.get('skills', [])),
+        data.get('template', ''),
+        data.get('document_hash')
+    ))
+    return cursor.lastrowid
+
 def save_resume_data(data):
     """Save resume data to database"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
-        
+        resume_id = insert_resume_data(cursor, data)
         conn.commit()
-        return cursor.lastrowid
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
@@ -125,28 +448,32 @@ def save_resume_data(data):
     finally:
         conn.close()
 
+def insert_analysis_data(cursor, resume_id, analysis):
+    """Insert a resume_analysis row with the given cursor"""
+    cursor.execute('''
+    INSERT INTO resume_analysis (
+        resume_id, ats_score, keyword_match_score,
+        format_score, section_score, missing_skills,
+        recommendations
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        resume_id,
+        float(analysis.get('ats_score', 0)),
+        float(analysis.get('keyword_match_score', 0)),
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    ))
+    return cursor.lastrowid
+
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
-        
+        insert_analysis_data(cursor, resume_id, analysis)
         conn.commit()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
@@ -154,6 +481,371 @@ def save_analysis_data(resume_id, analysis):
     finally:
         conn.close()
 
+def queue_analysis_data(resume_id, analysis):
+    """Save resume analysis data in the background"""
+    get_write_queue().submit(
+        lambda cursor: insert_analysis_data(cursor, resume_id, analysis)
+    )
+
+# Contact details ResumeAnalyzer extracts; shown to the uploader but never stored
+PERSONAL_INFO_FIELDS = ('name', 'email', 'phone', 'linkedin', 'github', 'portfolio')
+
+def without_personal_info(analysis):
+    """Copy of an analysis result without the uploader's contact details"""
+    return {key: value for key, value in analysis.items() if key not in PERSONAL_INFO_FIELDS}
+
+def build_standard_analysis_records(analysis, target_role, target_category, content_hash=None):
+    """Map a ResumeAnalyzer.analyze_resume result to resume_data and resume_analysis values
+    
+    Only the target role and category, the scores and the link to the stored
+    document are kept; the uploader's personal details are not saved.
+    """
+    resume_data = {
+        'target_role': target_role,
+        'target_category': target_category,
+        'document_hash': content_hash
+    }
+    analysis_data = {
+        'ats_score': analysis.get('ats_score', 0),
+        'keyword_match_score': analysis.get('keyword_match', {}).get('score', 0),
+        'format_score': analysis.get('format_score', 0),
+        'section_score': analysis.get('section_score', 0),
+        'missing_skills': json.dumps(analysis.get('keyword_match', {}).get('missing_skills', [])),
+        'recommendations': json.dumps(analysis.get('suggestions', []))
+    }
+    return resume_data, analysis_data
+
+def queue_resume_analysis(data, analysis, result=None):
+    """Save a resume and its analysis together in the background
+    
+    If ``data`` carries a document_hash, the analysis ``result`` (without
+    personal details) is stored alongside and the stored document text is added to the search
+    index of the new resume.
+    """
+    def job(cursor):
+        resume_id = insert_resume_data(cursor, data)
+        insert_analysis_data(cursor, resume_id, analysis)
+        content_hash = data.get('document_hash')
+        if content_hash:
+            index_document_text(cursor, resume_id, content_hash)
+            if result is not None:
+                insert_analysis_result(
+                    cursor, content_hash, 'standard', data.get('target_role'),
+                    without_personal_info(result), resume_id
+                )
+    get_write_queue().submit(job)
+
+def hash_bytes(data):
+    """Content hash used to key stored documents"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def compress_text(text):
+    return zlib.compress(text.encode('utf-8'), 6)
+
+def decompress_text(blob):
+    return zlib.decompress(blob).decode('utf-8')
+
+def insert_document(cursor, content_hash, text, file_name=None, file_type=None):
+    """Store the extracted text of a file once per content hash"""
+    cursor.execute('''
+    INSERT OR IGNORE INTO resume_documents (
+        content_hash, file_name, file_type, text_hash, text_length, text_blob
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ''', (
+        content_hash,
+        file_name,
+        file_type,
+        hash_bytes(text),
+        len(text),
+        compress_text(text)
+    ))
+
+def queue_document(content_hash, text, file_name=None, file_type=None):
+    """Store extracted document text in the background"""
+    get_write_queue().submit(
+        lambda cursor: insert_document(cursor, content_hash, text, file_name, file_type)
+    )
+
+def get_document_text(content_hash, conn=None):
+    """Get the stored extracted text for a file hash, or None if it was never extracted"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT text_blob FROM resume_documents WHERE content_hash = ?', (content_hash,)
+        )
+        row = cursor.fetchone()
+        return decompress_text(row[0]) if row else None
+    except (sqlite3.Error, zlib.error) as e:
+        print(f"Error reading stored document: {str(e)}")
+        return None
+    finally:
+        if own_conn:
+            conn.close()
+
+def index_document_text(cursor, resume_id, content_hash):
+    """Replace a resume's derived search text with its full stored document text"""
+    cursor.execute(
+        'SELECT text_blob FROM resume_documents WHERE content_hash = ?', (content_hash,)
+    )
+    row = cursor.fetchone()
+    if row:
+        cursor.execute(
+            'UPDATE resume_fts SET resume_text = ? WHERE rowid = ?',
+            (decompress_text(row[0]), resume_id)
+        )
+
+def insert_analysis_result(cursor, content_hash, analyzer, job_role, result, resume_id=None):
+    """Store the full structured output of an analysis as compressed JSON"""
+    payload = json.dumps(result, ensure_ascii=False, default=str)
+    cursor.execute('''
+    INSERT INTO analysis_results (
+        content_hash, analyzer, job_role, resume_id, result_blob
+    ) VALUES (?, ?, ?, ?, ?)
+    ''', (content_hash, analyzer, job_role, resume_id, compress_text(payload)))
+    return cursor.lastrowid
+
+def queue_analysis_result(content_hash, analyzer, job_role, result, resume_id=None):
+    """Store a full analysis result in the background"""
+    get_write_queue().submit(
+        lambda cursor: insert_analysis_result(
+            cursor, content_hash, analyzer, job_role, result, resume_id
+        )
+    )
+
+def get_analysis_result(content_hash, analyzer, job_role=None, conn=None):
+    """Get the latest stored analysis of a document, or None"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        SELECT result_blob FROM analysis_results
+        WHERE content_hash = ? AND analyzer = ? AND job_role IS ?
+        ORDER BY id DESC
+        LIMIT 1
+        ''', (content_hash, analyzer, job_role))
+        row = cursor.fetchone()
+        return json.loads(decompress_text(row[0])) if row else None
+    except (sqlite3.Error, zlib.error, ValueError) as e:
+        print(f"Error reading stored analysis: {str(e)}")
+        return None
+    finally:
+        if own_conn:
+            conn.close()
+
+def save_profile(content_hash, analyzer, duration_ms, profile_data, top_functions, file_name=None):
+    """Store a captured profile and return its id"""
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        INSERT INTO analysis_profiles (
+            content_hash, file_name, analyzer, duration_ms, top_functions, profile_blob
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            content_hash,
+            file_name,
+            analyzer,
+            duration_ms,
+            json.dumps(top_functions),
+            zlib.compress(profile_data, 6)
+        ))
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+def get_profiles(limit=20, conn=None):
+    """Most recent captured profiles, without their profile data"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+        SELECT id, content_hash, file_name, analyzer, duration_ms, top_functions, created_at
+        FROM analysis_profiles
+        ORDER BY id DESC
+        LIMIT ?
+        ''', (limit,))
+        columns = [column[0] for column in cursor.description]
+        profiles = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for profile in profiles:
+            profile['top_functions'] = json.loads(profile['top_functions'] or '[]')
+        return profiles
+    except sqlite3.Error as e:
+        print(f"Error reading profiles: {str(e)}")
+        return []
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_profile_data(profile_id, conn=None):
+    """The .prof file contents of a captured profile, or None"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT profile_blob FROM analysis_profiles WHERE id = ?', (profile_id,))
+        row = cursor.fetchone()
+        return zlib.decompress(row[0]) if row else None
+    except (sqlite3.Error, zlib.error) as e:
+        print(f"Error reading profile: {str(e)}")
+        return None
+    finally:
+        if own_conn:
+            conn.close()
+
+def save_scraped_jobs(jobs):
+    """Store scraped job postings and their skills; returns their ids in order
+
+    ``jobs`` are dicts with url, title, company, location and description.
+    A posting scraped again (same URL) is updated in place and keeps its id.
+    """
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        job_ids = []
+        for job in jobs:
+            cursor.execute('''
+            INSERT INTO scraped_jobs (url, title, company, location, source, description_blob)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (url) DO UPDATE SET
+                title = excluded.title,
+                company = excluded.company,
+                location = excluded.location,
+                description_blob = excluded.description_blob,
+                scraped_at = strftime('%Y-%m-%d %H:%M:%f', 'now')
+            ''', (
+                job['url'],
+                job.get('title'),
+                job.get('company'),
+                job.get('location'),
+                job.get('source', 'linkedin'),
+                compress_text(job['description'])
+            ))
+            cursor.execute('SELECT id FROM scraped_jobs WHERE url = ?', (job['url'],))
+            job_id = cursor.fetchone()[0]
+            cursor.execute('DELETE FROM scraped_job_skills WHERE job_id = ?', (job_id,))
+            cursor.executemany(
+                'INSERT OR IGNORE INTO scraped_job_skills (skill, job_id) VALUES (?, ?)',
+                [(skill, job_id) for skill in job.get('skills', [])]
+            )
+            job_ids.append(job_id)
+        conn.commit()
+        return job_ids
+    finally:
+        conn.close()
+
+def get_scraped_jobs(job_ids=None, conn=None):
+    """Stored job postings with decompressed descriptions, by id or all of them"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        columns = 'id, url, title, company, location, source, description_blob, scraped_at'
+        if job_ids is not None:
+            job_ids = list(job_ids)
+            if not job_ids:
+                return []
+            placeholders = ', '.join('?' * len(job_ids))
+            cursor.execute(f'SELECT {columns} FROM scraped_jobs WHERE id IN ({placeholders})', job_ids)
+        else:
+            cursor.execute(f'SELECT {columns} FROM scraped_jobs ORDER BY id')
+        names = [column[0] for column in cursor.description]
+        jobs = []
+        for row in cursor.fetchall():
+            job = dict(zip(names, row))
+            job['description'] = decompress_text(job.pop('description_blob'))
+            jobs.append(job)
+        return jobs
+    except (sqlite3.Error, zlib.error) as e:
+        print(f"Error reading scraped jobs: {str(e)}")
+        return []
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_scraped_job_versions(conn=None):
+    """scraped_at of every stored job posting, as {job_id: scraped_at}"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        return dict(conn.execute('SELECT id, scraped_at FROM scraped_jobs').fetchall())
+    except sqlite3.Error as e:
+        print(f"Error reading scraped jobs: {str(e)}")
+        return {}
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_scraped_jobs_signature(conn=None):
+    """(count, latest scraped_at) of the stored job postings; changes whenever one is added or re-scraped"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        return tuple(conn.execute('SELECT COUNT(*), MAX(scraped_at) FROM scraped_jobs').fetchone())
+    except sqlite3.Error:
+        return None
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_job_skills(job_ids, conn=None):
+    """Canonical skills of each job, as {job_id: set of skills}"""
+    job_ids = list(job_ids)
+    if not job_ids:
+        return {}
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        placeholders = ', '.join('?' * len(job_ids))
+        rows = conn.execute(
+            f'SELECT job_id, skill FROM scraped_job_skills WHERE job_id IN ({placeholders})', job_ids
+        ).fetchall()
+        skills = {job_id: set() for job_id in job_ids}
+        for job_id, skill in rows:
+            skills[job_id].add(skill)
+        return skills
+    except sqlite3.Error as e:
+        print(f"Error reading job skills: {str(e)}")
+        return {}
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_jobs_with_skills(skills, conn=None):
+    """Ids of jobs mentioning any of ``skills``, via the skill inverted index"""
+    skills = list(skills)
+    if not skills:
+        return set()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        placeholders = ', '.join('?' * len(skills))
+        rows = conn.execute(
+            f'SELECT DISTINCT job_id FROM scraped_job_skills WHERE skill IN ({placeholders})', skills
+        ).fetchall()
+        return {row[0] for row in rows}
+    except sqlite3.Error as e:
+        print(f"Error reading job skills: {str(e)}")
+        return set()
+    finally:
+        if own_conn:
+            conn.close()
+
 def get_resume_stats():
     """Get statistics about resumes"""
     conn = get_database_connection()
@@ -188,22 +880,32 @@ def get_resume_stats():
     finally:
         conn.close()
 
+def insert_admin_action(cursor, admin_email, action):
+    """Insert an admin_logs row with the given cursor"""
+    cursor.execute('''
+    INSERT INTO admin_logs (admin_email, action)
+    VALUES (?, ?)
+    ''', (admin_email, action))
+
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO admin_logs (admin_email, action)
-        VALUES (?, ?)
-        ''', (admin_email, action))
+        insert_admin_action(cursor, admin_email, action)
         conn.commit()
     except Exception as e:
         print(f"Error logging admin action: {str(e)}")
     finally:
         conn.close()
 
+def queue_admin_action(admin_email, action):
+    """Log an admin action in the background"""
+    get_write_queue().submit(
+        lambda cursor: insert_admin_action(cursor, admin_email, action)
+    )
+
 def get_admin_logs():
     """Get all admin login/logout logs"""
     conn = get_database_connection()
@@ -222,39 +924,221 @@ def get_admin_logs():
     finally:
         conn.close()
 
-def get_all_resume_data():
-    """Get all resume data for admin dashboard"""
-    conn = get_database_connection()
+RESUME_LISTING_COLUMNS = '''
+    r.id,
+    r.name,
+    r.email,
+    r.phone,
+    r.linkedin,
+    r.github,
+    r.portfolio,
+    r.target_role,
+    r.target_category,
+    r.created_at,
+    a.ats_score,
+    a.keyword_match_score,
+    a.format_score,
+    a.section_score
+'''
+
+# Join each resume with its latest analysis so a resume appears exactly once
+LATEST_ANALYSIS_JOIN = '''
+    LEFT JOIN resume_analysis a ON a.id = (
+        SELECT MAX(id) FROM resume_analysis WHERE resume_id = r.id
+    )
+'''
+
+def build_resume_filters(filters):
+    """Build a WHERE clause for the admin resume listing filters
+    
+    Supported keys: role, category, min_score, max_score, start_date, end_date.
+    Returns the SQL fragment (without WHERE) and its parameters.
+    """
+    clauses, params = [], []
+    filters = filters or {}
+    
+    if filters.get('role'):
+        clauses.append('r.target_role = ?')
+        params.append(filters['role'])
+    if filters.get('category'):
+        clauses.append('r.target_category = ?')
+        params.append(filters['category'])
+    if filters.get('min_score') is not None:
+        clauses.append('a.ats_score >= ?')
+        params.append(float(filters['min_score']))
+    if filters.get('max_score') is not None:
+        clauses.append('a.ats_score <= ?')
+        params.append(float(filters['max_score']))
+    if filters.get('start_date'):
+        clauses.append('r.created_at >= ?')
+        params.append(str(filters['start_date']))
+    if filters.get('end_date'):
+        # Inclusive end date: compare against the start of the next day
+        clauses.append("r.created_at < date(?, '+1 day')")
+        params.append(str(filters['end_date']))
+    
+    return ' AND '.join(clauses), params
+
+def get_resume_page(page_size=50, after=None, filters=None, conn=None):
+    """Get one page of resume data joined with its latest analysis
+    
+    Rows are ordered newest first and paginated by keyset on (created_at, id):
+    pass the next_cursor returned for the previous page as ``after``.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        # Get resume data joined with analysis data
-        cursor.execute('''
-        SELECT 
-            r.id,
-            r.name,
-            r.email,
-            r.phone,
-            r.linkedin,
-            r.github,
-            r.portfolio,
-            r.target_role,
-            r.target_category,
-            r.created_at,
+        where, params = build_resume_filters(filters)
+        clauses = [where] if where else []
+        if after:
+            clauses.append('(r.created_at < ? OR (r.created_at = ? AND r.id < ?))')
+            params.extend([after[0], after[0], after[1]])
+        
+        query = f'''
+        SELECT {RESUME_LISTING_COLUMNS}
+        FROM resume_data r
+        {LATEST_ANALYSIS_JOIN}
+        {'WHERE ' + ' AND '.join(clauses) if clauses else ''}
+        ORDER BY r.created_at DESC, r.id DESC
+        LIMIT ?
+        '''
+        # Fetch one extra row to know whether another page exists
+        cursor.execute(query, params + [page_size + 1])
+        rows = cursor.fetchall()
+        
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = (rows[-1][9], rows[-1][0])
+        return rows, next_cursor
+    except Exception as e:
+        print(f"Error getting resume page: {str(e)}")
+        return [], None
+    finally:
+        if own_conn:
+            conn.close()
+
+def search_resumes(text, filters=None, limit=50, conn=None):
+    """Full-text search over resumes, best matches first
+    
+    ``text`` is matched against resume_fts; ``filters`` takes the same keys
+    as the resume listing (e.g. {'min_score': 70}) and is applied to the
+    matching rows only. Returns a list of dicts with a highlighted snippet.
+    """
+    match = to_fts_query(text)
+    if not match:
+        return []
+    
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        where, params = build_resume_filters(filters)
+        weights = ', '.join(str(weight) for _, weight in RESUME_FTS_COLUMNS)
+        cursor.execute(f'''
+        SELECT
+            r.id, r.name, r.email, r.target_role, r.target_category, r.created_at,
             a.ats_score,
-            a.keyword_match_score,
-            a.format_score,
-            a.section_score
+            snippet(resume_fts, -1, '**', '**', '…', 12),
+            bm25(resume_fts, {weights}) AS rank
+        FROM resume_fts
+        JOIN resume_data r ON r.id = resume_fts.rowid
+        {LATEST_ANALYSIS_JOIN}
+        WHERE resume_fts MATCH ?
+        {'AND ' + where if where else ''}
+        ORDER BY rank
+        LIMIT ?
+        ''', [match] + params + [limit])
+        
+        return [
+            {
+                'id': row[0],
+                'name': row[1],
+                'email': row[2],
+                'target_role': row[3],
+                'target_category': row[4],
+                'created_at': row[5],
+                'ats_score': row[6],
+                'snippet': row[7],
+                'rank': row[8]
+            } for row in cursor.fetchall()
+        ]
+    except Exception as e:
+        print(f"Error searching resumes: {str(e)}")
+        return []
+    finally:
+        if own_conn:
+            conn.close()
+
+def count_resumes(filters=None, conn=None):
+    """Count resumes matching the admin listing filters"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        where, params = build_resume_filters(filters)
+        cursor.execute(f'''
+        SELECT COUNT(*)
         FROM resume_data r
-        LEFT JOIN resume_analysis a ON r.id = a.resume_id
-        ORDER BY r.created_at DESC
+        {LATEST_ANALYSIS_JOIN if 'a.' in where else ''}
+        {'WHERE ' + where if where else ''}
+        ''', params)
+        return cursor.fetchone()[0]
+    except Exception as e:
+        print(f"Error counting resumes: {str(e)}")
+        return 0
+    finally:
+        if own_conn:
+            conn.close()
+
+def get_resume_filter_options(conn=None):
+    """Get the distinct target roles and categories for the admin filters"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT DISTINCT target_role FROM resume_data
+        WHERE target_role IS NOT NULL AND target_role <> ''
+        ORDER BY target_role
         ''')
-        return cursor.fetchall()
+        roles = [row[0] for row in cursor.fetchall()]
+        cursor.execute('''
+        SELECT DISTINCT target_category FROM resume_data
+        WHERE target_category IS NOT NULL AND target_category <> ''
+        ORDER BY target_category
+        ''')
+        categories = [row[0] for row in cursor.fetchall()]
+        return roles, categories
     except Exception as e:
-        print(f"Error getting resume data: {str(e)}")
-        return []
+        print(f"Error getting resume filter options: {str(e)}")
+        return [], []
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
+
+def iter_resume_data(filters=None, batch_size=500):
+    """Iterate over all resume data page by page without loading it at once"""
+    after = None
+    while True:
+        rows, after = get_resume_page(batch_size, after, filters)
+        yield from rows
+        if after is None:
+            break
+
+def get_all_resume_data():
+    """Get all resume data for admin dashboard"""
+    return list(iter_resume_data())
 
 def verify_admin(email, password):
     """Verify admin credentials"""
@@ -286,6 +1170,32 @@ def add_admin(email, password):
     finally:
         conn.close()
 
+AI_ANALYSIS_TABLE = """
+    CREATE TABLE IF NOT EXISTS ai_analysis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        resume_id INTEGER,
+        model_used TEXT,
+        resume_score INTEGER,
+        job_role TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    )
+"""
+
+def insert_ai_analysis_data(cursor, resume_id, analysis_data):
+    """Insert an ai_analysis row with the given cursor and return its id"""
+    cursor.execute("""
+        INSERT INTO ai_analysis (
+            resume_id, model_used, resume_score, job_role
+        ) VALUES (?, ?, ?, ?)
+    """, (
+        resume_id,
+        analysis_data.get('model_used', ''),
+        analysis_data.get('resume_score', 0),
+        analysis_data.get('job_role', '')
+    ))
+    return cursor.lastrowid
+
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
     conn = get_database_connection()
@@ -293,32 +1203,14 @@ def save_ai_analysis_data(resume_id, analysis_data):
     
     try:
         # Check if the ai_analysis table exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS ai_analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER,
-                model_used TEXT,
-                resume_score INTEGER,
-                job_role TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-            )
-        """)
+        cursor.execute(AI_ANALYSIS_TABLE)
         
         # Insert the analysis data
-        cursor.execute("""
-            INSERT INTO ai_analysis (
-                resume_id, model_used, resume_score, job_role
-            ) VALUES (?, ?, ?, ?)
-        """, (
-            resume_id,
-            analysis_data.get('model_used', ''),
-            analysis_data.get('resume_score', 0),
-            analysis_data.get('job_role', '')
-        ))
+        analysis_id = insert_ai_analysis_data(cursor, resume_id, analysis_data)
         
         conn.commit()
-        return cursor.lastrowid
+        invalidate_ai_analysis_stats()
+        return analysis_id
     except Exception as e:
         print(f"Error saving AI analysis data: {e}")
         conn.rollback()
@@ -326,184 +1218,157 @@ def save_ai_analysis_data(resume_id, analysis_data):
     finally:
         conn.close()
 
-def get_ai_analysis_stats():
-    """Get statistics about AI analyzer usage"""
-    conn = get_database_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
-        """)
-        
-        if not cursor.fetchone():
-            return {
-                "total_analyses": 0,
-                "model_usage": [],
-                "average_score": 0,
-                "top_job_roles": []
-            }
-        
-        # Get total number of analyses
-        cursor.execute("SELECT COUNT(*) FROM ai_analysis")
-        total_analyses = cursor.fetchone()[0]
-        
-        # Get model usage statistics
-        cursor.execute("""
-            SELECT model_used, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY model_used
-            ORDER BY count DESC
-        """)
-        model_usage = [{"model": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get average resume score
-        cursor.execute("SELECT AVG(resume_score) FROM ai_analysis")
-        average_score = cursor.fetchone()[0] or 0
-        
-        # Get top job roles
-        cursor.execute("""
-            SELECT job_role, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY job_role
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        top_job_roles = [{"role": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        return {
-            "total_analyses": total_analyses,
-            "model_usage": model_usage,
-            "average_score": round(average_score, 1),
-            "top_job_roles": top_job_roles
-        }
-    except Exception as e:
-        print(f"Error getting AI analysis stats: {e}")
-        return {
-            "total_analyses": 0,
-            "model_usage": [],
-            "average_score": 0,
-            "top_job_roles": []
-        }
-    finally:
-        conn.close()
+def queue_ai_analysis_data(resume_id, analysis_data):
+    """Save AI analysis data in the background"""
+    get_write_queue().submit(
+        lambda cursor: insert_ai_analysis_data(cursor, resume_id, analysis_data),
+        on_commit=invalidate_ai_analysis_stats
+    )
 
-def get_detailed_ai_analysis_stats():
-    """Get detailed statistics about AI analyzer usage including daily trends"""
-    conn = get_database_connection()
+def get_write_queue_stats():
+    """Get queue depth and throughput of the background analytics writer"""
+    return get_write_queue().stats()
+
+# (min, max, label) buckets of the AI resume score histogram
+SCORE_BUCKETS = [
+    (0, 20, "0-20"),
+    (21, 40, "21-40"),
+    (41, 60, "41-60"),
+    (61, 80, "61-80"),
+    (81, 100, "81-100")
+]
+
+# Seconds an AI stats snapshot is served from memory before re-querying
+AI_STATS_TTL = 30
+
+_ai_stats_cache = {'snapshot': None, 'expires': 0.0}
+_ai_stats_lock = threading.Lock()
+
+def empty_ai_analysis_snapshot():
+    """AI stats snapshot for an empty or missing ai_analysis table"""
+    return {
+        "total_analyses": 0,
+        "model_usage": [],
+        "average_score": 0,
+        "top_job_roles": [],
+        "daily_trend": [],
+        "score_distribution": [{"range": label, "count": 0} for _, _, label in SCORE_BUCKETS],
+        "recent_analyses": []
+    }
+
+def invalidate_ai_analysis_stats():
+    """Drop the cached AI stats snapshot so the next read re-queries"""
+    with _ai_stats_lock:
+        _ai_stats_cache['snapshot'] = None
+
+def query_ai_analysis_snapshot(conn):
+    """Compute all AI analyzer statistics with two queries"""
     cursor = conn.cursor()
     
-    try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
-        """)
-        
-        if not cursor.fetchone():
-            return {
-                "total_analyses": 0,
-                "model_usage": [],
-                "average_score": 0,
-                "top_job_roles": [],
-                "daily_trend": [],
-                "score_distribution": [],
-                "recent_analyses": []
-            }
-        
-        # Get total number of analyses
-        cursor.execute("SELECT COUNT(*) FROM ai_analysis")
-        total_analyses = cursor.fetchone()[0]
-        
-        # Get model usage statistics
-        cursor.execute("""
-            SELECT model_used, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY model_used
-            ORDER BY count DESC
-        """)
-        model_usage = [{"model": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get average resume score
-        cursor.execute("SELECT AVG(resume_score) FROM ai_analysis")
-        average_score = cursor.fetchone()[0] or 0
-        
-        # Get top job roles
-        cursor.execute("""
-            SELECT job_role, COUNT(*) as count
-            FROM ai_analysis
-            GROUP BY job_role
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        top_job_roles = [{"role": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get daily trend for the last 7 days
-        cursor.execute("""
-            SELECT DATE(created_at) as date, COUNT(*) as count
-            FROM ai_analysis
-            WHERE created_at >= date('now', '-7 days')
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """)
-        daily_trend = [{"date": row[0], "count": row[1]} for row in cursor.fetchall()]
-        
-        # Get score distribution
-        score_ranges = [
-            {"min": 0, "max": 20, "range": "0-20"},
-            {"min": 21, "max": 40, "range": "21-40"},
-            {"min": 41, "max": 60, "range": "41-60"},
-            {"min": 61, "max": 80, "range": "61-80"},
-            {"min": 81, "max": 100, "range": "81-100"}
-        ]
-        
-        score_distribution = []
-        for range_info in score_ranges:
-            cursor.execute("""
-                SELECT COUNT(*) FROM ai_analysis 
-                WHERE resume_score >= ? AND resume_score <= ?
-            """, (range_info["min"], range_info["max"]))
-            count = cursor.fetchone()[0]
-            score_distribution.append({"range": range_info["range"], "count": count})
-        
-        # Get recent analyses
-        cursor.execute("""
-            SELECT model_used, resume_score, job_role, datetime(created_at) as date
+    # Check if the ai_analysis table exists
+    cursor.execute("""
+        SELECT name FROM sqlite_master WHERE type='table' AND name='ai_analysis'
+    """)
+    if not cursor.fetchone():
+        return empty_ai_analysis_snapshot()
+    
+    # Totals and the score histogram in a single pass
+    bucket_columns = ",\n".join(
+        f"SUM(CASE WHEN resume_score >= {low} AND resume_score <= {high} THEN 1 ELSE 0 END)"
+        for low, high, _ in SCORE_BUCKETS
+    )
+    cursor.execute(f"""
+        SELECT COUNT(*), AVG(resume_score),
+        {bucket_columns}
+        FROM ai_analysis
+    """)
+    row = cursor.fetchone()
+    total_analyses, average_score = row[0], row[1] or 0
+    score_distribution = [
+        {"range": label, "count": count or 0}
+        for (_, _, label), count in zip(SCORE_BUCKETS, row[2:])
+    ]
+    
+    # Model usage, job roles, daily trend and recent analyses in one grouped query
+    cursor.execute("""
+        SELECT 'model', model_used, COUNT(*), NULL, NULL
+        FROM ai_analysis GROUP BY model_used
+        UNION ALL
+        SELECT 'role', job_role, COUNT(*), NULL, NULL
+        FROM ai_analysis GROUP BY job_role
+        UNION ALL
+        SELECT 'day', DATE(created_at), COUNT(*), NULL, NULL
+        FROM ai_analysis
+        WHERE created_at >= date('now', '-7 days')
+        GROUP BY DATE(created_at)
+        UNION ALL
+        SELECT 'recent', model_used, resume_score, job_role, created_at
+        FROM (
+            SELECT model_used, resume_score, job_role, datetime(created_at) as created_at
             FROM ai_analysis
             ORDER BY created_at DESC
             LIMIT 5
-        """)
-        recent_analyses = [
+        )
+    """)
+    groups = {'model': [], 'role': [], 'day': [], 'recent': []}
+    for kind, key, value, extra, created_at in cursor.fetchall():
+        groups[kind].append((key, value, extra, created_at))
+    
+    model_usage = sorted(groups['model'], key=lambda g: g[1], reverse=True)
+    top_job_roles = sorted(groups['role'], key=lambda g: g[1], reverse=True)[:5]
+    daily_trend = sorted(groups['day'], key=lambda g: g[0])
+    recent = sorted(groups['recent'], key=lambda g: g[3] or '', reverse=True)
+    
+    return {
+        "total_analyses": total_analyses,
+        "model_usage": [{"model": model, "count": count} for model, count, _, _ in model_usage],
+        "average_score": round(average_score, 1),
+        "top_job_roles": [{"role": role, "count": count} for role, count, _, _ in top_job_roles],
+        "daily_trend": [{"date": date, "count": count} for date, count, _, _ in daily_trend],
+        "score_distribution": score_distribution,
+        "recent_analyses": [
             {
-                "model": row[0],
-                "score": row[1],
-                "job_role": row[2],
-                "date": row[3]
-            } for row in cursor.fetchall()
+                "model": model,
+                "score": score,
+                "job_role": job_role,
+                "date": date
+            } for model, score, job_role, date in recent
         ]
-        
-        return {
-            "total_analyses": total_analyses,
-            "model_usage": model_usage,
-            "average_score": round(average_score, 1),
-            "top_job_roles": top_job_roles,
-            "daily_trend": daily_trend,
-            "score_distribution": score_distribution,
-            "recent_analyses": recent_analyses
-        }
+    }
+
+def get_ai_analysis_snapshot():
+    """Get all AI analyzer statistics, cached for AI_STATS_TTL seconds"""
+    with _ai_stats_lock:
+        if _ai_stats_cache['snapshot'] is not None and time.monotonic() < _ai_stats_cache['expires']:
+            return _ai_stats_cache['snapshot']
+    
+    conn = get_database_connection()
+    try:
+        snapshot = query_ai_analysis_snapshot(conn)
     except Exception as e:
-        print(f"Error getting detailed AI analysis stats: {e}")
-        return {
-            "total_analyses": 0,
-            "model_usage": [],
-            "average_score": 0,
-            "top_job_roles": [],
-            "daily_trend": [],
-            "score_distribution": [],
-            "recent_analyses": []
-        }
+        print(f"Error getting AI analysis stats: {e}")
+        return empty_ai_analysis_snapshot()
     finally:
         conn.close()
+    
+    with _ai_stats_lock:
+        _ai_stats_cache['snapshot'] = snapshot
+        _ai_stats_cache['expires'] = time.monotonic() + AI_STATS_TTL
+    return snapshot
+
+def get_ai_analysis_stats():
+    """Get statistics about AI analyzer usage"""
+    snapshot = get_ai_analysis_snapshot()
+    return {
+        "total_analyses": snapshot["total_analyses"],
+        "model_usage": snapshot["model_usage"],
+        "average_score": snapshot["average_score"],
+        "top_job_roles": snapshot["top_job_roles"]
+    }
+
+def get_detailed_ai_analysis_stats():
+    """Get detailed statistics about AI analyzer usage including daily trends"""
+    return get_ai_analysis_snapshot()
 
 def reset_ai_analysis_stats():
     """Reset AI analysis statistics by truncating the ai_analysis table"""
@@ -522,6 +1387,7 @@ def reset_ai_analysis_stats():
         # Delete all records from the ai_analysis table
         cursor.execute("DELETE FROM ai_analysis")
         conn.commit()
+        invalidate_ai_analysis_stats()
         
         return {"success": True, "message": "AI analysis statistics have been reset successfully"}
     except Exception as e:
@@ -0,0 +1,138 @@
+"""
+On-demand profiling of a single analysis request
+
+An admin arms the profiler from the dashboard; the next extraction and
+analysis in this process then runs under cProfile, bypassing stored text so
+the extractor is actually exercised. The profile is saved to
+analysis_profiles together with the input file's content hash, and the
+dashboard lists the hottest functions and offers the .prof file, which opens
+with pstats, snakeviz and similar tools.
+"""
+import cProfile
+import marshal
+import os
+import pstats
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from config.database import hash_bytes, save_profile
+
+TOP_FUNCTIONS = 30
+
+_lock = threading.Lock()
+_armed_at = None
+
+
+def arm():
+    """Profile the next analysis run in this process"""
+    global _armed_at
+    with _lock:
+        _armed_at = time.time()
+
+
+def disarm():
+    global _armed_at
+    with _lock:
+        _armed_at = None
+
+
+def armed_at():
+    """When the profiler was armed, or None if it is not waiting for a run"""
+    return _armed_at
+
+
+def _claim():
+    """Take the armed slot, so exactly one request is profiled"""
+    global _armed_at
+    with _lock:
+        claimed, _armed_at = _armed_at, None
+    return claimed is not None
+
+
+class ProfileRun:
+    """Handle for a profiled block; ``profile_id`` is set once it is saved"""
+
+    def __init__(self, analyzer, content_hash, file_name):
+        self.analyzer = analyzer
+        self.content_hash = content_hash
+        self.file_name = file_name
+        self.profile_id = None
+
+
+@contextmanager
+def maybe_profile(analyzer, content, file_name=None):
+    """Run the block under cProfile if the profiler is armed
+
+    Yields a ProfileRun while profiling and None otherwise, so callers can
+    skip caches that would hide the work being profiled.
+    """
+    if _armed_at is None or not _claim():
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Another profiler is already active on this thread
+        print(f"Could not start profiler: {e}")
+        arm()
+        yield None
+        return
+
+    run = ProfileRun(analyzer, hash_bytes(content), file_name)
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        profiler.disable()
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        try:
+            profiler.create_stats()
+            run.profile_id = save_profile(
+                run.content_hash, analyzer, duration_ms,
+                marshal.dumps(profiler.stats), top_functions(pstats.Stats(profiler)), file_name
+            )
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+
+
+def load_stats(profile_data):
+    """pstats.Stats for stored .prof data"""
+    with tempfile.NamedTemporaryFile(suffix='.prof', delete=False) as f:
+        f.write(profile_data)
+        path = f.name
+    try:
+        return pstats.Stats(path)
+    finally:
+        os.unlink(path)
+
+
+def _location(filename, line, name):
+    if filename == '~':
+        # Built-in functions have no source file
+        return name
+    cwd = os.getcwd()
+    if filename.startswith(cwd + os.sep):
+        filename = os.path.relpath(filename, cwd)
+    else:
+        filename = os.path.join(*filename.split(os.sep)[-2:])
+    return f"{filename}:{line}({name})"
+
+
+def top_functions(stats, limit=TOP_FUNCTIONS, sort='cumulative'):
+    """Hottest functions of a pstats.Stats as JSON-friendly dicts"""
+    stats.sort_stats(sort)
+    rows = []
+    for func in stats.fcn_list[:limit]:
+        primitive_calls, calls, total_time, cumulative_time, _ = stats.stats[func]
+        rows.append({
+            'function': _location(*func),
+            'calls': f"{calls}/{primitive_calls}" if calls != primitive_calls else str(calls),
+            'tottime_ms': round(total_time * 1000, 3),
+            'cumtime_ms': round(cumulative_time * 1000, 3),
+            'percall_ms': round(cumulative_time / primitive_calls * 1000, 3) if primitive_calls else 0.0,
+        })
+    return rows
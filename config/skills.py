@@ -0,0 +1,267 @@
+"""
+Skill taxonomy shared by every analyzer
+
+SKILL_TAXONOMY maps a category to its skills, and each canonical skill name
+to the aliases that should count as that skill ("JS" -> JavaScript, "k8s" ->
+Kubernetes). get_skill_matcher() compiles every name and alias once into a
+token trie that finds skills of any length in a single pass over the text,
+preferring the longest match ("React Native" over "React").
+
+Names in CASE_SENSITIVE_SKILLS are also ordinary words or single letters,
+so they only match with the exact casing given here.
+
+get_roles_fingerprint() hashes this taxonomy together with JOB_ROLES; stored
+scores computed under a different fingerprint are stale.
+"""
+import hashlib
+import json
+import re
+import threading
+
+from config.job_roles import JOB_ROLES
+
+SKILL_TAXONOMY = {
+    "Programming Languages": {
+        "Python": ["python3"],
+        "Java": [],
+        "JavaScript": ["js", "ecmascript", "es6"],
+        "TypeScript": [],
+        "C": [],
+        "C++": ["cpp"],
+        "C#": ["csharp", "c sharp"],
+        "Go": ["golang"],
+        "Rust": [],
+        "Kotlin": [],
+        "Swift": [],
+        "R": [],
+        "PHP": [],
+        "Ruby": [],
+        "SQL": ["t-sql", "pl/sql"],
+    },
+    "Web Development": {
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "React": ["react.js", "reactjs"],
+        "Angular": ["angularjs", "angular.js"],
+        "Vue.js": ["vue", "vuejs"],
+        "Node.js": ["node", "nodejs", "node js"],
+        "Express.js": ["Express", "expressjs"],
+        "Django": [],
+        "Flask": [],
+        "Spring": ["spring boot"],
+        "APIs": ["api", "rest api", "rest apis", "restful api", "restful apis", "graphql"],
+        "Responsive Design": ["responsive web design"],
+        "Frontend Tech": ["frontend", "front-end", "front end"],
+        "Backend Tech": ["backend", "back-end", "back end"],
+        "Web Security": ["owasp"],
+    },
+    "Mobile Development": {
+        "React Native": [],
+        "Flutter": [],
+        "Mobile UI/UX": ["mobile ui", "mobile ux"],
+        "App Store Deployment": ["app store", "play store", "google play"],
+    },
+    "Data Science and AI": {
+        "Machine Learning": ["ml"],
+        "Deep Learning": ["neural networks"],
+        "AI": ["artificial intelligence"],
+        "Data Science": [],
+        "Analytics": ["data analytics", "data analysis"],
+        "Statistics": ["statistical analysis", "statistical modeling"],
+        "Data Visualization": ["data viz", "tableau", "power bi"],
+        "TensorFlow": [],
+        "PyTorch": ["torch"],
+        "MLOps": ["ml ops"],
+        "Excel": ["microsoft excel", "ms excel"],
+    },
+    "Databases": {
+        "Databases": ["database", "rdbms"],
+        "Database Design": ["data modeling", "data modelling", "schema design"],
+        "PostgreSQL": ["postgres"],
+        "MySQL": [],
+        "MongoDB": ["mongo"],
+    },
+    "Cloud and DevOps": {
+        "AWS": ["amazon web services"],
+        "Azure": ["microsoft azure"],
+        "GCP": ["google cloud", "google cloud platform"],
+        "Docker": [],
+        "Kubernetes": ["k8s"],
+        "CI/CD": ["ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+        "DevOps": [],
+        "Infrastructure as Code": ["iac"],
+        "Terraform": [],
+        "Jenkins": [],
+        "Git": ["github", "gitlab"],
+        "Linux": [],
+        "Automation": [],
+        "Monitoring": ["observability"],
+        "Performance Tuning": ["performance optimization", "performance optimisation"],
+    },
+    "Security": {
+        "Security": ["cybersecurity", "cyber security", "information security"],
+        "Network Security": [],
+        "Ethical Hacking": ["penetration testing", "pentesting"],
+        "Incident Response": [],
+        "Threat Detection": [],
+        "Security Tools": [],
+    },
+    "Design": {
+        "UI/UX": ["ui", "ux", "ui design", "ux design", "user interface", "user experience"],
+        "Figma": [],
+        "Adobe XD": [],
+        "Wireframing": ["wireframes"],
+        "Prototyping": ["prototypes"],
+        "Typography": [],
+        "Color Theory": ["colour theory"],
+        "Visual Design": [],
+        "User Research": [],
+        "Usability Testing": [],
+    },
+    "Game Development": {
+        "Unity": ["unity3d"],
+        "Unreal Engine": ["unreal", "ue4", "ue5"],
+        "3D Graphics": ["3d modeling", "3d modelling"],
+        "Game Physics": [],
+    },
+    "Product and Management": {
+        "Agile": [],
+        "Scrum": [],
+        "Jira": [],
+        "Product Strategy": [],
+        "Roadmapping": ["roadmaps", "product roadmap"],
+        "Market Research": [],
+        "User Stories": [],
+        "Stakeholder Management": [],
+        "Project Planning": ["project management"],
+        "Risk Management": [],
+        "System Design": ["system architecture"],
+    },
+}
+
+CASE_SENSITIVE_SKILLS = {"C", "R", "Go", "Swift", "Rust", "Spring", "Express", "Excel", "Unity"}
+
+# Words, or single non-space punctuation characters
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+_END = object()
+
+
+def tokenize(text):
+    """Split text into the tokens the matcher works on"""
+    return _TOKEN.findall(text)
+
+
+def _phrase_key(phrase):
+    return ' '.join(tokenize(phrase.lower()))
+
+
+class SkillMatcher:
+    """Token trie over every skill name and alias"""
+
+    def __init__(self, taxonomy=SKILL_TAXONOMY, case_sensitive=CASE_SENSITIVE_SKILLS):
+        self.taxonomy = taxonomy
+        self.case_sensitive = case_sensitive
+        self.categories = {}
+        self.canonical = {}
+        self._trie = {}
+        for category, skills in taxonomy.items():
+            for skill, aliases in skills.items():
+                self.categories[skill] = category
+                for phrase in [skill, *aliases]:
+                    self._add(phrase, skill, phrase in case_sensitive)
+
+    def _add(self, phrase, skill, case_sensitive):
+        key = _phrase_key(phrase)
+        if self.canonical.get(key, skill) != skill:
+            raise ValueError(f"'{phrase}' is listed for both {self.canonical[key]} and {skill}")
+        if not case_sensitive:
+            self.canonical[key] = skill
+        node = self._trie
+        for token in key.split(' '):
+            node = node.setdefault(token, {})
+        # A case-sensitive phrase keeps its exact tokens to compare against
+        node.setdefault(_END, []).append((skill, tokenize(phrase) if case_sensitive else None))
+
+    def find(self, text):
+        """Canonical skills in ``text``, in order of first appearance"""
+        tokens = tokenize(text)
+        lowered = [token.lower() for token in tokens]
+        found = {}
+        i, count = 0, len(tokens)
+        while i < count:
+            node, j, match = self._trie, i, None
+            while j < count:
+                node = node.get(lowered[j])
+                if node is None:
+                    break
+                j += 1
+                for skill, exact in node.get(_END, ()):
+                    if exact is None or tokens[i:j] == exact:
+                        match = (skill, j)
+                        break
+            if match:
+                found.setdefault(match[0], None)
+                i = match[1]
+            else:
+                i += 1
+        return list(found)
+
+    def canonicalize(self, skill):
+        """Canonical name for a skill name or alias, or None if it is not in the taxonomy"""
+        if skill in self.categories:
+            return skill
+        return self.canonical.get(_phrase_key(skill))
+
+    def category(self, skill):
+        return self.categories.get(self.canonicalize(skill) or skill)
+
+    def phrases(self):
+        """(phrase, canonical skill, case sensitive) for every name and alias"""
+        for skills in self.taxonomy.values():
+            for skill, aliases in skills.items():
+                for phrase in [skill, *aliases]:
+                    yield phrase, skill, phrase in self.case_sensitive
+
+    def match(self, text, required_skills):
+        """Split ``required_skills`` into (found, missing) for a text
+
+        Skills are compared by canonical name, so an alias in the text
+        satisfies the requirement. Skills outside the taxonomy fall back to a
+        whole-phrase search.
+        """
+        present = set(self.find(text))
+        padded_text = None
+        found, missing = [], []
+        for skill in required_skills:
+            canonical = self.canonicalize(skill)
+            if canonical is not None:
+                is_found = canonical in present
+            else:
+                if padded_text is None:
+                    padded_text = f" {' '.join(tokenize(text.lower()))} "
+                is_found = f" {_phrase_key(skill)} " in padded_text
+            (found if is_found else missing).append(skill)
+        return found, missing
+
+
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher():
+    """Process-wide SkillMatcher, compiled on first use"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = SkillMatcher()
+    return _matcher
+
+
+def get_roles_fingerprint(job_roles=None):
+    """Hash of the role requirements and skill taxonomy; a new value means stored scores are stale"""
+    payload = json.dumps(
+        [job_roles or JOB_ROLES, SKILL_TAXONOMY, sorted(CASE_SENSITIVE_SKILLS)], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,354 @@
+"""
+Lightweight tracing for the extraction and analysis hot paths
+
+Code marks a stage with ``with span('extract.ai.pdfplumber', pages=3):`` or the
+``@traced('name')`` decorator. Tracing is off unless RESUME_TRACING=1 is set
+or enable() is called; while it is off, span() hands back a shared no-op
+context manager, so instrumented code pays one call and a flag check.
+
+Finished spans feed three outputs:
+
+- per-stage duration histograms, exported in Prometheus text format by
+  prometheus_text() (served at GET /metrics by api_server.py),
+- a JSONL trace file, one line per span, when RESUME_TRACE_FILE is set,
+- a ring buffer of recent traces for the admin dashboard timing panel.
+
+Nested spans form a trace: the outermost span of a call chain is the root,
+and children find their parent through a context variable, so threads and
+asyncio tasks keep separate traces.
+
+Spans recorded in a worker process do not reach the parent's metrics on
+their own. Submit the work as ``call_collecting(is_enabled(), func, *args)``;
+it returns the result together with the spans the call finished, and
+merge_spans() adds them to the parent's metrics and current trace.
+"""
+import collections
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+MAX_TRACES = 50
+MAX_SPANS_PER_TRACE = 500
+
+_enabled = os.getenv('RESUME_TRACING', '').lower() in ('1', 'true', 'yes', 'on')
+_current = contextvars.ContextVar('resume_trace_span', default=None)
+# List collecting finished spans instead of recording them, set by call_collecting()
+_collector = contextvars.ContextVar('resume_trace_collector', default=None)
+_ids = itertools.count(1)
+_lock = threading.Lock()
+_metrics = {}  # span name -> [bucket counts, total seconds, count, errors]
+_open_traces = {}  # root span id -> spans finished so far
+_recent_traces = collections.deque(maxlen=MAX_TRACES)
+
+_trace_file = None
+_trace_path = os.getenv('RESUME_TRACE_FILE') or None
+_file_lock = threading.Lock()
+
+
+class _NoopSpan:
+    """Returned by span() while tracing is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """One timed stage; use through span() rather than directly"""
+    __slots__ = ('name', 'attrs', 'span_id', 'trace_id', 'parent_id', 'depth',
+                 'started_at', '_start', '_token')
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        parent = _current.get()
+        self.span_id = next(_ids)
+        if parent is None:
+            self.trace_id, self.parent_id, self.depth = self.span_id, None, 0
+            with _lock:
+                _open_traces[self.trace_id] = []
+        else:
+            self.trace_id, self.parent_id, self.depth = parent.trace_id, parent.span_id, parent.depth + 1
+        self._token = _current.set(self)
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._start
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            # Exited in a different context than it was entered in
+            _current.set(None)
+        _record(self, duration, exc_type.__name__ if exc_type else None)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes learned while the span is running (e.g. page count)"""
+        self.attrs.update(attrs)
+
+
+def span(name, **attrs):
+    """Context manager timing one stage; a no-op while tracing is disabled"""
+    if not _enabled:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def traced(name=None):
+    """Decorator form of span(); defaults to the function's qualified name"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                with Span(span_name, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record(finished, duration, error):
+    entry = {
+        'span_id': finished.span_id,
+        'parent_id': finished.parent_id,
+        'name': finished.name,
+        'depth': finished.depth,
+        'started_at': finished.started_at,
+        'duration_ms': round(duration * 1000, 3),
+        'error': error,
+        'attrs': finished.attrs,
+    }
+    collector = _collector.get()
+    if collector is not None:
+        # Handed back to the parent process, which records it (see merge_spans)
+        collector.append(dict(entry, trace_id=finished.trace_id))
+        if finished.parent_id is None:
+            with _lock:
+                _open_traces.pop(finished.trace_id, None)
+        return
+    _store(entry, finished.trace_id, duration)
+
+
+def _store(entry, trace_id, duration):
+    """Add a finished span to the metrics, its trace and the trace file"""
+    name, error = entry['name'], entry['error']
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = [[0] * len(BUCKETS), 0.0, 0, 0]
+        for i, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                metric[0][i] += 1
+                break
+        metric[1] += duration
+        metric[2] += 1
+        if error:
+            metric[3] += 1
+
+        # Children finishing after their root (e.g. in another thread) are
+        # left out of the trace but still counted above
+        spans = _open_traces.get(trace_id)
+        if spans is not None and len(spans) < MAX_SPANS_PER_TRACE:
+            spans.append(entry)
+        if entry['parent_id'] is None:
+            _recent_traces.append({
+                'trace_id': trace_id,
+                'name': name,
+                'started_at': entry['started_at'],
+                'duration_ms': entry['duration_ms'],
+                'error': error,
+                'spans': sorted(_open_traces.pop(trace_id, [entry]), key=lambda s: s['started_at']),
+            })
+
+    if _trace_path:
+        _write_trace_line(dict(entry, trace_id=trace_id, pid=os.getpid()))
+
+
+def call_collecting(enabled, func, *args):
+    """Run ``func(*args)`` and return (result, spans it finished), for use in worker processes
+
+    ``enabled`` is the caller's is_enabled(), so workers trace exactly when
+    their parent does. The spans are meant for merge_spans() in the parent.
+    """
+    global _enabled
+    if not enabled:
+        return func(*args), []
+    was_enabled, _enabled = _enabled, True
+    spans = []
+    token = _collector.set(spans)
+    # A forked worker inherits whatever span was open when it started; start fresh
+    current_token = _current.set(None)
+    try:
+        result = func(*args)
+    finally:
+        _current.reset(current_token)
+        _collector.reset(token)
+        _enabled = was_enabled
+    return result, spans
+
+
+def merge_spans(spans):
+    """Record spans collected by call_collecting() in another process
+
+    They are nested under the current span, or become traces of their own
+    when there is none.
+    """
+    if not spans:
+        return
+    parent = _current.get()
+    span_ids = {entry['span_id']: next(_ids) for entry in spans}
+    roots = {entry['trace_id'] for entry in spans if entry['parent_id'] is None}
+    if parent is None:
+        with _lock:
+            for root in roots:
+                _open_traces[span_ids[root]] = []
+    # Spans arrive in the order they finished, so children come before their roots
+    for entry in spans:
+        merged = dict(entry)
+        del merged['trace_id']
+        merged['span_id'] = span_ids[entry['span_id']]
+        if parent is None:
+            trace_id = span_ids.get(entry['trace_id'])
+            merged['parent_id'] = span_ids.get(entry['parent_id'])
+        else:
+            trace_id = parent.trace_id
+            merged['parent_id'] = span_ids.get(entry['parent_id'], parent.span_id)
+            merged['depth'] = entry['depth'] + parent.depth + 1
+        _store(merged, trace_id, entry['duration_ms'] / 1000)
+
+
+def _write_trace_line(entry):
+    global _trace_file
+    line = json.dumps(entry, default=str) + '\n'
+    with _file_lock:
+        try:
+            if _trace_file is None:
+                _trace_file = open(_trace_path, 'a', encoding='utf-8', buffering=1)
+            _trace_file.write(line)
+        except OSError as e:
+            print(f"Error writing trace file {_trace_path}: {e}")
+
+
+def enable(trace_file=None):
+    """Turn tracing on, optionally appending every span to a JSONL file"""
+    global _enabled, _trace_path, _trace_file
+    with _file_lock:
+        if trace_file and trace_file != _trace_path:
+            if _trace_file:
+                _trace_file.close()
+            _trace_path, _trace_file = trace_file, None
+    _enabled = True
+
+
+def disable():
+    """Turn tracing off; collected metrics and traces are kept"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drop collected metrics and recent traces"""
+    with _lock:
+        _metrics.clear()
+        _open_traces.clear()
+        _recent_traces.clear()
+
+
+def get_recent_traces(limit=20, exclude=()):
+    """Most recent finished traces, newest first
+
+    Each trace has its root name, duration and a flat list of spans ordered
+    by start time, with ``offset_ms`` relative to the root. Traces whose root
+    span name is in ``exclude`` (e.g. background work) are left out.
+    """
+    with _lock:
+        traces = [trace for trace in _recent_traces if trace['name'] not in exclude][-limit:]
+    result = []
+    for trace in reversed(traces):
+        start = trace['started_at']
+        spans = [dict(s, offset_ms=round((s['started_at'] - start) * 1000, 3)) for s in trace['spans']]
+        result.append(dict(trace, spans=spans))
+    return result
+
+
+def get_span_stats():
+    """Count, total, mean and error count per span name"""
+    with _lock:
+        items = [(name, metric[1], metric[2], metric[3]) for name, metric in _metrics.items()]
+    return {
+        name: {
+            'count': count,
+            'total_ms': round(total * 1000, 3),
+            'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+            'errors': errors,
+        }
+        for name, total, count, errors in sorted(items)
+    }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text():
+    """Span histograms and error counters in the Prometheus text exposition format"""
+    with _lock:
+        items = sorted((name, list(m[0]), m[1], m[2], m[3]) for name, m in _metrics.items())
+
+    lines = [
+        '# HELP resume_span_duration_seconds Duration of traced resume processing stages.',
+        '# TYPE resume_span_duration_seconds histogram',
+    ]
+    for name, buckets, total, count, _ in items:
+        label = _label(name)
+        cumulative = 0
+        for bound, bucket_count in zip(BUCKETS, buckets):
+            cumulative += bucket_count
+            lines.append(f'resume_span_duration_seconds_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+        lines.append(f'resume_span_duration_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+        lines.append(f'resume_span_duration_seconds_sum{{span="{label}"}} {total:.6f}')
+        lines.append(f'resume_span_duration_seconds_count{{span="{label}"}} {count}')
+
+    lines += [
+        '# HELP resume_span_errors_total Traced stages that raised an exception.',
+        '# TYPE resume_span_errors_total counter',
+    ]
+    for name, _, _, _, errors in items:
+        lines.append(f'resume_span_errors_total{{span="{_label(name)}"}} {errors}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,195 @@
+"""
+Write-behind queue for analytics inserts
+
+Request handlers enqueue small write jobs instead of opening a connection and
+committing themselves. A background thread drains the queue and runs the
+jobs in one transaction every ``flush_interval_ms`` or every ``batch_size``
+jobs, whichever comes first, so a page render never waits for a commit.
+"""
+import atexit
+import queue
+import threading
+import time
+
+from config.tracing import span
+
+# Root span of each background batch; not a request, so dashboards filter it out
+WRITE_BATCH_SPAN = 'db.write_batch'
+
+
+class _FlushMarker:
+    """Queue entry that is signalled once every job ahead of it is committed"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class WriteBehindQueue:
+    """Bounded queue of write jobs flushed in batches by a background thread
+
+    A job is a callable taking a sqlite3 cursor, with an optional callback
+    run after its transaction commits. Jobs of one batch share a transaction;
+    if the batch fails, each job is retried on its own so one bad row does not
+    drop the others.
+    """
+
+    def __init__(self, connect, batch_size=100, flush_interval_ms=200, max_size=10000,
+                 put_timeout=0.5):
+        self.connect = connect
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'enqueued': 0,
+            'written': 0,
+            'failed': 0,
+            'batches': 0,
+            'sync_fallbacks': 0,
+            'last_batch_size': 0,
+            'last_flush_ms': 0.0,
+        }
+
+    def _ensure_started(self):
+        if self._thread and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+            self._thread.start()
+
+    def submit(self, job, on_commit=None):
+        """Queue a write job; runs it synchronously if the queue stays full"""
+        self._ensure_started()
+        entry = job if isinstance(job, _FlushMarker) else (job, on_commit)
+        try:
+            self._queue.put(entry, timeout=self.put_timeout)
+            if entry is not job:
+                self._bump('enqueued')
+        except queue.Full:
+            # Back-pressure: never drop analytics, pay the write cost inline instead
+            self._bump('sync_fallbacks')
+            self._write_batch([entry])
+
+    def _bump(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _run(self):
+        while not self._stop.is_set() or not self._queue.empty():
+            batch = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+
+    def _collect_batch(self):
+        """Wait for the first job, then gather more until the batch or time window is full"""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch):
+        markers = [job for job in batch if isinstance(job, _FlushMarker)]
+        batch = [job for job in batch if not isinstance(job, _FlushMarker)]
+        try:
+            if batch:
+                self._execute(batch)
+        finally:
+            for marker in markers:
+                marker.done.set()
+
+    def _execute(self, batch):
+        with span(WRITE_BATCH_SPAN, jobs=len(batch)):
+            self._execute_batch(batch)
+
+    def _execute_batch(self, batch):
+        start = time.perf_counter()
+        conn = self.connect()
+        committed = []
+        try:
+            cursor = conn.cursor()
+            try:
+                for job, _ in batch:
+                    job(cursor)
+                conn.commit()
+                committed = batch
+            except Exception as e:
+                conn.rollback()
+                print(f"Error writing batch of {len(batch)} jobs, retrying individually: {e}")
+                for entry in batch:
+                    try:
+                        entry[0](cursor)
+                        conn.commit()
+                        committed.append(entry)
+                    except Exception as job_error:
+                        conn.rollback()
+                        print(f"Error writing queued job: {job_error}")
+        finally:
+            conn.close()
+
+        for _, on_commit in committed:
+            if on_commit:
+                try:
+                    on_commit()
+                except Exception as e:
+                    print(f"Error in write queue commit callback: {e}")
+        written, failed = len(committed), len(batch) - len(committed)
+
+        with self._stats_lock:
+            self._stats['written'] += written
+            self._stats['failed'] += failed
+            self._stats['batches'] += 1
+            self._stats['last_batch_size'] = len(batch)
+            self._stats['last_flush_ms'] = round((time.perf_counter() - start) * 1000, 2)
+
+    def flush(self, timeout=5.0):
+        """Block until every job queued so far has been written"""
+        marker = _FlushMarker()
+        self.submit(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout=10.0):
+        """Stop the writer thread after draining the queue"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self):
+        """Queue depth and throughput counters"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['max_size'] = self._queue.maxsize
+        stats['running'] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """Get the process-wide write-behind queue for the analytics database"""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            from config.database import get_database_connection
+            _write_queue = WriteBehindQueue(get_database_connection)
+            atexit.register(_write_queue.close)
+        return _write_queue
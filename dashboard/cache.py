@@ -0,0 +1,154 @@
+"""
+Process-wide caches for dashboard queries and figures
+
+Entries are keyed by query name and parameters and tagged with the database
+data version (see config.database.get_data_version). An entry is served until
+its TTL runs out or any write bumps the data version. Concurrent requests for
+the same key wait for a single computation instead of each running the query.
+"""
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 60
+# Keys share a fixed set of computation locks, so the locks never grow with the keys
+LOCK_STRIPES = 64
+
+
+class QueryCache:
+    """TTL cache invalidated by a monotonic data version"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._key_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key, version):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, entry_version, expires = entry
+        if entry_version != version or time.monotonic() >= expires:
+            return False, None
+        return True, value
+
+    def get_or_compute(self, key, version, compute, ttl=None):
+        """Return the cached value for key at version, computing it at most once"""
+        with self._lock:
+            found, value = self._lookup(key, version)
+            if found:
+                self.hits += 1
+                return value
+            key_lock = self._key_locks[hash(key) % LOCK_STRIPES]
+
+        # Only one caller computes a given key (or another key on the same
+        # stripe); the rest wait and reuse its result
+        with key_lock:
+            with self._lock:
+                found, value = self._lookup(key, version)
+                if found:
+                    self.hits += 1
+                    return value
+                self.misses += 1
+
+            value = compute()
+
+            with self._lock:
+                if len(self._entries) >= self.max_entries:
+                    self._evict()
+                self._entries[key] = (value, version, time.monotonic() + (ttl or self.ttl))
+            return value
+
+    def _evict(self):
+        """Drop expired entries, or the oldest half if nothing has expired"""
+        now = time.monotonic()
+        expired = [key for key, (_, _, expires) in self._entries.items() if expires <= now]
+        if not expired:
+            by_expiry = sorted(self._entries.items(), key=lambda item: item[1][2])
+            expired = [key for key, _ in by_expiry[:len(by_expiry) // 2]]
+        for key in expired:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+query_cache = QueryCache()
+
+
+def cached_query(ttl=None):
+    """Cache a DashboardManager query method by name and arguments
+
+    The instance must provide ``data_version()``; cached values are shared
+    between all instances, so every viewer reuses the same result.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__qualname__, repr(args), repr(sorted(kwargs.items())))
+            return query_cache.get_or_compute(
+                key,
+                self.data_version(),
+                lambda: method(self, *args, **kwargs),
+                ttl
+            )
+        return wrapper
+    return decorator
+
+
+def data_hash(*values):
+    """Stable hash of the (JSON-serialisable) data a figure is built from"""
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class FigureCache:
+    """LRU cache of built Plotly figures keyed by builder and data hash
+
+    Building and validating a figure costs far more than the query behind it
+    once the query is cached, and most reruns plot identical data. Cached
+    figures are shared between viewers, so callers must not mutate them.
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is not None:
+                self._entries.move_to_end(key)
+                return fig
+
+        fig = build()
+        with self._lock:
+            self._entries[key] = fig
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(method):
+    """Cache a chart builder by its arguments and the instance's colour scheme"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__qualname__, data_hash(args, kwargs, getattr(self, 'colors', None)))
+        return figure_cache.get_or_build(key, lambda: method(self, *args, **kwargs))
+    return wrapper
@@ -3,6 +3,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta
+from .cache import cached_figure
 
 class DashboardComponents:
     def __init__(self, colors):
@@ -31,6 +32,7 @@ class DashboardComponents:
             </div>
         """, unsafe_allow_html=True)
 
+    @cached_figure
     def create_gauge_chart(self, value, title):
         """Create a gauge chart for metrics like ATS score"""
         fig = go.Figure(go.Indicator(
@@ -61,6 +63,7 @@ class DashboardComponents:
         
         return fig
 
+    @cached_figure
     def create_trend_chart(self, dates, values, title):
         """Create a trend line chart"""
         fig = go.Figure()
@@ -93,6 +96,7 @@ class DashboardComponents:
         
         return fig
 
+    @cached_figure
     def create_bar_chart(self, categories, values, title):
         """Create a bar chart"""
         fig = go.Figure(go.Bar(
@@ -126,6 +130,7 @@ class DashboardComponents:
         
         return fig
 
+    @cached_figure
     def create_dual_axis_chart(self, categories, values1, values2, title):
         """Create a chart with dual y-axes"""
         fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -172,4 +177,4 @@ class DashboardComponents:
         fig.update_yaxes(title_text="Count", color=self.colors['text'], secondary_y=False)
         fig.update_yaxes(title_text="Score", color=self.colors['text'], secondary_y=True)
         
-        return fig
\ No newline at end of file
+        return fig
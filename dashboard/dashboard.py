@@ -3,11 +3,20 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from config.database import get_database_connection
+from config.database import (
+    get_database_connection, get_resume_page, count_resumes, get_resume_filter_options,
+    get_write_queue_stats, get_data_version, search_resumes, get_profiles, get_profile_data
+)
+from feedback.feedback import FeedbackManager
+from utils.rescoring import is_rescore_needed
+from config import profiling, tracing
+from config.write_queue import WRITE_BATCH_SPAN
 import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
+from .exports import export_table, EXPORT_FORMATS
+from .cache import cached_query, cached_figure
 
 class DashboardManager:
     def __init__(self):
@@ -26,6 +35,10 @@ class DashboardManager:
             'subtext': '#B0B0B0'
         }
         
+    def data_version(self):
+        """Current database data version; cached queries are invalidated when it changes"""
+        return get_data_version(self.conn)
+        
     def apply_dashboard_style(self):
         """Apply custom styling for dashboard"""
         st.markdown("""
@@ -109,6 +122,7 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @cached_query()
     def get_resume_metrics(self):
         """Get resume-related metrics from database"""
         cursor = self.conn.cursor()
@@ -156,36 +170,32 @@ class DashboardManager:
         
         return metrics
 
+    @cached_query()
     def get_skill_distribution(self):
         """Get skill distribution data"""
         cursor = self.conn.cursor()
         cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
+            WITH skill_values AS (
+                SELECT LOWER(TRIM(jt.value)) as skill
+                FROM resume_data rd, json_tree(rd.skills) jt
+                WHERE jt.type = 'text'
             ),
             SkillCategories AS (
                 SELECT 
                     CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
+                        WHEN skill LIKE '%python%' OR skill LIKE '%java%' OR 
+                             skill LIKE '%javascript%' OR skill LIKE '%c++%' OR 
+                             skill LIKE '%programming%' THEN 'Programming'
+                        WHEN skill LIKE '%sql%' OR skill LIKE '%database%' OR 
+                             skill LIKE '%mongodb%' THEN 'Database'
+                        WHEN skill LIKE '%aws%' OR skill LIKE '%cloud%' OR 
+                             skill LIKE '%azure%' THEN 'Cloud'
+                        WHEN skill LIKE '%agile%' OR skill LIKE '%scrum%' OR 
+                             skill LIKE '%management%' THEN 'Management'
                         ELSE 'Other'
                     END as category,
                     COUNT(*) as count
-                FROM split
+                FROM skill_values
                 WHERE skill <> ''
                 GROUP BY category
             )
@@ -201,6 +211,7 @@ class DashboardManager:
             
         return categories, counts
 
+    @cached_query()
     def get_weekly_trends(self):
         """Get weekly submission trends"""
         cursor = self.conn.cursor()
@@ -218,6 +229,7 @@ class DashboardManager:
             
         return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
 
+    @cached_query()
     def get_job_category_stats(self):
         """Get statistics by job category"""
         cursor = self.conn.cursor()
@@ -254,37 +266,20 @@ class DashboardManager:
         # Data Export Options
         export_format = st.sidebar.selectbox(
             "Export Format",
-            ["Excel", "CSV", "JSON"],
+            list(EXPORT_FORMATS.keys()),
             key="export_format"
         )
         
         if st.sidebar.button("📥 Export Data"):
-            if export_format == "Excel":
-                excel_data = self.export_to_excel()
-                if excel_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download Excel",
-                        data=excel_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
-            elif export_format == "CSV":
-                csv_data = self.export_to_csv()
-                if csv_data:
+            extension, mime = EXPORT_FORMATS[export_format]
+            export_path = self.export_data(extension)
+            if export_path:
+                with open(export_path, 'rb') as f:
                     st.sidebar.download_button(
-                        "⬇️ Download CSV",
-                        data=csv_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv"
-                    )
-            else:
-                json_data = self.export_to_json()
-                if json_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download JSON",
-                        data=json_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
-                        mime="application/json"
+                        f"⬇️ Download {export_format}",
+                        data=f,
+                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.{extension}",
+                        mime=mime
                     )
 
         # Database Stats
@@ -295,137 +290,343 @@ class DashboardManager:
             - Today's Submissions: {stats['today_submissions']}
             - Storage Used: {stats['storage_size']}
         """)
+        
+        if is_rescore_needed(self.conn):
+            st.sidebar.warning(
+                "Job role requirements changed since scores were computed. "
+                "Run `python -m utils.rescoring` to refresh them."
+            )
+        
+        # Background writer health
+        queue_stats = get_write_queue_stats()
+        st.sidebar.markdown(f"""
+            - Pending Writes: {queue_stats['queue_depth']} / {queue_stats['max_size']}
+            - Written: {queue_stats['written']} ({queue_stats['failed']} failed)
+            - Last Batch: {queue_stats['last_batch_size']} rows in {queue_stats['last_flush_ms']} ms
+        """)
 
-    def get_resume_data(self):
-        """Get all resume data"""
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute('''
-            SELECT 
-                r.id,
-                r.name,
-                r.email,
-                r.phone,
-                r.linkedin,
-                r.github,
-                r.portfolio,
-                r.target_role,
-                r.target_category,
-                r.created_at,
-                a.ats_score,
-                a.keyword_match_score,
-                a.format_score,
-                a.section_score
-            FROM resume_data r
-            LEFT JOIN resume_analysis a ON r.id = a.resume_id
-            ORDER BY r.created_at DESC
-            ''')
-            return cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching resume data: {str(e)}")
-            return []
+    @cached_query()
+    def get_resume_data(self, page_size=50, after=None, filters=None):
+        """Get one keyset-paginated page of resume data"""
+        return get_resume_page(page_size, after, filters, conn=self.conn)
+
+    @cached_query()
+    def count_resumes(self, filters=None):
+        """Count resumes matching the listing filters"""
+        return count_resumes(filters, conn=self.conn)
+
+    @cached_query()
+    def get_resume_filter_options(self):
+        """Get the distinct target roles and categories for the listing filters"""
+        return get_resume_filter_options(conn=self.conn)
+
+    def get_resume_filters(self):
+        """Render the resume listing filters and return the selected values"""
+        roles, categories = self.get_resume_filter_options()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            target_role = st.selectbox(
+                "Filter by Target Role",
+                options=["All"] + roles,
+                key="role_filter"
+            )
+        with col2:
+            target_category = st.selectbox(
+                "Filter by Category",
+                options=["All"] + categories,
+                key="category_filter"
+            )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            score_range = st.slider(
+                "ATS Score Range",
+                min_value=0,
+                max_value=100,
+                value=(0, 100),
+                key="score_filter"
+            )
+        with col2:
+            date_range = st.date_input(
+                "Submission Date Range",
+                value=(),
+                key="date_filter"
+            )
+        
+        filters = {}
+        if target_role != "All":
+            filters['role'] = target_role
+        if target_category != "All":
+            filters['category'] = target_category
+        if score_range != (0, 100):
+            filters['min_score'], filters['max_score'] = score_range
+        if len(date_range) == 2:
+            filters['start_date'], filters['end_date'] = date_range
+        elif len(date_range) == 1:
+            filters['start_date'] = date_range[0]
+        return filters
 
     def render_resume_data_section(self):
         """Render resume data section with Excel download"""
         st.markdown("<h2 class='section-title'>Resume Submissions</h2>", unsafe_allow_html=True)
         
-        # Get resume data
-        resume_data = self.get_resume_data()
+        # Style the dataframe
+        st.markdown("""
+        <style>
+        .resume-data {
+            background-color: #2D2D2D;
+            border-radius: 10px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+        }
+        </style>
+        """, unsafe_allow_html=True)
         
-        if resume_data:
-            # Convert to DataFrame
-            columns = [
-                'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 
-                'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
-                'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
-            ]
-            df = pd.DataFrame(resume_data, columns=columns)
+        with st.container():
+            st.markdown('<div class="resume-data">', unsafe_allow_html=True)
             
-            # Format scores as percentages
-            score_columns = ['ATS Score', 'Keyword Match', 'Format Score', 'Section Score']
-            for col in score_columns:
-                df[col] = df[col].apply(lambda x: f"{x*100:.1f}%" if pd.notnull(x) else "N/A")
+            filters = self.get_resume_filters()
+            page_size = st.selectbox("Rows per page", [25, 50, 100], index=1, key="resume_page_size")
             
-            # Style the dataframe
-            st.markdown("""
-            <style>
-            .resume-data {
-                background-color: #2D2D2D;
-                border-radius: 10px;
-                padding: 1rem;
-                margin-bottom: 1rem;
-            }
-            </style>
-            """, unsafe_allow_html=True)
+            # Keyset pagination: keep the cursor of every visited page so we can go back
+            filter_key = (tuple(sorted((k, str(v)) for k, v in filters.items())), page_size)
+            if st.session_state.get('resume_filter_key') != filter_key:
+                st.session_state.resume_filter_key = filter_key
+                st.session_state.resume_page_cursors = [None]
+            cursors = st.session_state.resume_page_cursors
             
-            with st.container():
-                st.markdown('<div class="resume-data">', unsafe_allow_html=True)
-                
-                # Add filters
-                col1, col2 = st.columns(2)
-                with col1:
-                    target_role = st.selectbox(
-                        "Filter by Target Role",
-                        options=["All"] + list(df['Target Role'].unique()),
-                        key="role_filter"
-                    )
-                with col2:
-                    target_category = st.selectbox(
-                        "Filter by Category",
-                        options=["All"] + list(df['Target Category'].unique()),
-                        key="category_filter"
-                    )
+            resume_data, next_cursor = self.get_resume_data(page_size, cursors[-1], filters)
+            total = self.count_resumes(filters)
+            
+            if resume_data:
+                # Convert to DataFrame
+                columns = [
+                    'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 
+                    'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
+                    'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
+                ]
+                df = pd.DataFrame(resume_data, columns=columns)
                 
-                # Apply filters
-                filtered_df = df.copy()
-                if target_role != "All":
-                    filtered_df = filtered_df[filtered_df['Target Role'] == target_role]
-                if target_category != "All":
-                    filtered_df = filtered_df[filtered_df['Target Category'] == target_category]
+                # Format scores as percentages
+                score_columns = ['ATS Score', 'Keyword Match', 'Format Score', 'Section Score']
+                for col in score_columns:
+                    df[col] = df[col].apply(lambda x: f"{x:.1f}%" if pd.notnull(x) else "N/A")
                 
-                # Display filtered data
+                # Display the current page
                 st.dataframe(
-                    filtered_df,
+                    df,
                     use_container_width=True,
                     hide_index=True
                 )
                 
-                # Add download buttons
-                col1, col2 = st.columns(2)
+                col1, col2, col3 = st.columns([1, 2, 1])
                 with col1:
-                    # Download filtered data
-                    excel_buffer = BytesIO()
-                    filtered_df.to_excel(excel_buffer, index=False, engine='openpyxl')
-                    excel_buffer.seek(0)
-                    
-                    st.download_button(
-                        label="📥 Download Filtered Data",
-                        data=excel_buffer,
-                        file_name=f"resume_data_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_filtered_data"
-                    )
-                
+                    if st.button("⬅️ Previous", disabled=len(cursors) == 1, key="resume_prev_page"):
+                        cursors.pop()
+                        st.rerun()
                 with col2:
-                    # Download all data
-                    excel_buffer_all = BytesIO()
-                    df.to_excel(excel_buffer_all, index=False, engine='openpyxl')
-                    excel_buffer_all.seek(0)
-                    
-                    st.download_button(
-                        label="📥 Download All Data",
-                        data=excel_buffer_all,
-                        file_name=f"resume_data_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_all_data"
+                    st.markdown(
+                        f"<p style='text-align: center;'>Page {len(cursors)} · {total:,} matching resumes</p>",
+                        unsafe_allow_html=True
                     )
+                with col3:
+                    if st.button("Next ➡️", disabled=next_cursor is None, key="resume_next_page"):
+                        cursors.append(next_cursor)
+                        st.rerun()
                 
-                st.markdown('</div>', unsafe_allow_html=True)
+                # Download the visible page
+                excel_buffer = BytesIO()
+                df.to_excel(excel_buffer, index=False, engine='openpyxl')
+                excel_buffer.seek(0)
+                
+                st.download_button(
+                    label="📥 Download This Page",
+                    data=excel_buffer,
+                    file_name=f"resume_data_page{len(cursors)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    key="download_filtered_data"
+                )
+                st.caption("Use 📥 Export Data in the sidebar to download the full table.")
+            else:
+                st.info("No resume submissions available")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    @cached_query()
+    def search_resumes(self, text, filters=None, limit=50):
+        """Ranked full-text search over resumes"""
+        return search_resumes(text, filters, limit, conn=self.conn)
+
+    def render_search_section(self):
+        """Render full-text search over resumes and written feedback"""
+        st.markdown("<h2 class='section-title'>Search</h2>", unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            text = st.text_input(
+                "Search",
+                placeholder="e.g. kubernetes docker, react OR angular, pyth*",
+                key="admin_search_text"
+            )
+        with col2:
+            source = st.selectbox("In", ["Resumes", "Feedback"], key="admin_search_source")
+        with col3:
+            min_score = st.number_input(
+                "Min ATS Score", 0, 100, 0, step=5, key="admin_search_min_score",
+                disabled=source != "Resumes"
+            )
+        
+        if not text.strip():
+            return
+        
+        if source == "Resumes":
+            filters = {'min_score': min_score} if min_score else None
+            results = self.search_resumes(text, filters)
+            if not results:
+                st.info("No matching resumes")
+                return
+            st.caption(f"{len(results)} best matches")
+            for result in results:
+                score = f"{result['ats_score']:.0f}" if result['ats_score'] is not None else "N/A"
+                st.markdown(
+                    f"**#{result['id']} {result['name'] or result['email']}** · "
+                    f"{result['target_role'] or 'No role'} · ATS {score}  \n{result['snippet']}"
+                )
         else:
-            st.info("No resume submissions available")
+            results = FeedbackManager().search_feedback(text)
+            if not results:
+                st.info("No matching feedback")
+                return
+            for _, rating, *_, timestamp, snippet in results:
+                st.markdown(f"**{'⭐' * (rating or 0)}** · {str(timestamp)[:16]}  \n{snippet}")
+
+    def render_timing_panel(self):
+        """Render per-request stage timings recorded by config.tracing"""
+        st.markdown("<h2 class='section-title'>Request Timing</h2>", unsafe_allow_html=True)
+        
+        enabled = st.checkbox(
+            "Record stage timings", value=tracing.is_enabled(), key="admin_tracing_enabled",
+            help="Times extraction, OCR, analysis, AI calls, database writes and reports in this process"
+        )
+        if enabled != tracing.is_enabled():
+            tracing.enable() if enabled else tracing.disable()
+        
+        traces = tracing.get_recent_traces(exclude=(WRITE_BATCH_SPAN,))
+        if not traces:
+            st.info("No requests recorded yet" if enabled else "Enable timing to record the next requests")
+            return
+        
+        labels = [
+            f"{datetime.fromtimestamp(trace['started_at']).strftime('%H:%M:%S')} · {trace['name']} · "
+            f"{trace['duration_ms']:.0f} ms" + (f" · {trace['error']}" if trace['error'] else "")
+            for trace in traces
+        ]
+        selected = st.selectbox("Request", range(len(traces)), format_func=labels.__getitem__,
+                                key="admin_trace_select")
+        trace = traces[selected]
+        
+        st.dataframe(
+            pd.DataFrame([{
+                'Stage': '\u2003' * span['depth'] + span['name'],
+                'Start (ms)': span['offset_ms'],
+                'Duration (ms)': span['duration_ms'],
+                'Share': f"{span['duration_ms'] / trace['duration_ms'] * 100:.0f}%" if trace['duration_ms'] else '',
+                'Details': ', '.join(f"{k}={v}" for k, v in span['attrs'].items()) or (span['error'] or ''),
+            } for span in trace['spans']]),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        with st.expander("All stages since start"):
+            stats = tracing.get_span_stats()
+            st.dataframe(
+                pd.DataFrame([
+                    {'Stage': name, 'Calls': s['count'], 'Mean (ms)': s['mean_ms'],
+                     'Total (ms)': s['total_ms'], 'Errors': s['errors']}
+                    for name, s in stats.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.download_button(
+                "📥 Download Prometheus metrics",
+                data=tracing.prometheus_text(),
+                file_name="resume_metrics.prom",
+                mime="text/plain",
+                key="download_trace_metrics"
+            )
+
+    def render_profiling_section(self):
+        """Render the on-demand profiler and the profiles it captured"""
+        st.markdown("<h2 class='section-title'>Profiling</h2>", unsafe_allow_html=True)
+        
+        armed_at = profiling.armed_at()
+        if armed_at:
+            col1, col2 = st.columns([3, 1])
+            col1.info(
+                f"Waiting for the next analysis (armed at {datetime.fromtimestamp(armed_at).strftime('%H:%M:%S')})"
+            )
+            if col2.button("Cancel", key="admin_profiler_disarm"):
+                profiling.disarm()
+                st.rerun()
+        elif st.button("🔬 Profile Next Analysis", key="admin_profiler_arm",
+                       help="Runs the next resume extraction and analysis under cProfile"):
+            profiling.arm()
+            st.rerun()
+        
+        profiles = get_profiles()
+        if not profiles:
+            st.info("No profiles captured yet")
+            return
+        
+        labels = {
+            profile['id']: f"#{profile['id']} · {str(profile['created_at'])[:16]} · {profile['analyzer']} · "
+                           f"{profile['file_name'] or profile['content_hash'][:12]} · {profile['duration_ms']:.0f} ms"
+            for profile in profiles
+        }
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            profile_id = st.selectbox("Profile", list(labels), format_func=labels.get, key="admin_profile_select")
+        with col2:
+            sort = st.selectbox("Sort By", ["cumulative", "tottime", "ncalls"], key="admin_profile_sort")
+        
+        profile = next(p for p in profiles if p['id'] == profile_id)
+        profile_data = get_profile_data(profile_id)
+        st.caption(f"Input hash: `{profile['content_hash']}`")
+        
+        rows = profile['top_functions']
+        if sort != 'cumulative' and profile_data:
+            rows = profiling.top_functions(profiling.load_stats(profile_data), sort=sort)
+        st.dataframe(
+            pd.DataFrame(rows).rename(columns={
+                'function': 'Function', 'calls': 'Calls', 'tottime_ms': 'Own (ms)',
+                'cumtime_ms': 'Cumulative (ms)', 'percall_ms': 'Per Call (ms)'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        if profile_data:
+            st.download_button(
+                "📥 Download .prof",
+                data=profile_data,
+                file_name=f"profile_{profile_id}_{profile['content_hash'][:8]}.prof",
+                mime="application/octet-stream",
+                key="download_profile"
+            )
 
     def render_admin_section(self):
         """Render admin section with logs and Excel download"""
+        # Full-text search across resumes and feedback
+        self.render_search_section()
+        
+        # Per-request stage timings
+        self.render_timing_panel()
+        
+        # On-demand cProfile of a single analysis
+        self.render_profiling_section()
+        
         # Render resume data section
         self.render_resume_data_section()
         
@@ -474,96 +675,27 @@ class DashboardManager:
         else:
             st.info("No admin activity logs available")
 
-    def export_to_excel(self):
-        """Export data to Excel format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+    def export_data(self, extension):
+        """Export resume data to a cached file and return its path"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            
-            # Create Excel writer object
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Resume Data', index=False)
-                
-                # Get the workbook and the worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Resume Data']
-                
-                # Add formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'fg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                # Write headers with formatting
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, min(max_length, 50))
-            
-            # Return the Excel file
-            output.seek(0)
-            return output.getvalue()
-            
+            return export_table(self.conn, extension)
         except Exception as e:
-            st.error(f"Error exporting to Excel: {str(e)}")
+            st.error(f"Error exporting data: {str(e)}")
             return None
 
+    def export_to_excel(self):
+        """Export data to Excel format"""
+        return self.export_data('xlsx')
+
     def export_to_csv(self):
         """Export data to CSV format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-        try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_csv(index=False).encode('utf-8')
-        except Exception as e:
-            st.error(f"Error exporting to CSV: {str(e)}")
-            return None
+        return self.export_data('csv')
 
     def export_to_json(self):
         """Export data to JSON format"""
-        query = """
-            SELECT 
-                rd.*, ra.*
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-        try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_json(orient='records', date_format='iso')
-        except Exception as e:
-            st.error(f"Error exporting to JSON: {str(e)}")
-            return None
+        return self.export_data('json')
 
+    @cached_query()
     def get_database_stats(self):
         """Get database statistics"""
         cursor = self.conn.cursor()
@@ -597,6 +729,7 @@ class DashboardManager:
         
         return stats
 
+    @cached_query()
     def get_admin_logs(self):
         """Get admin logs"""
         cursor = self.conn.cursor()
@@ -842,6 +975,7 @@ class DashboardManager:
         if st.session_state.get('is_admin', False):
             self.render_admin_section()
 
+    @cached_query()
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
         cursor = self.conn.cursor()
@@ -896,6 +1030,7 @@ class DashboardManager:
         
         return indicators
 
+    @cached_query()
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
         cursor = self.conn.cursor()
@@ -944,32 +1079,16 @@ class DashboardManager:
         
         # Most Common Skills
         cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
+            SELECT MIN(TRIM(jt.value)) as skill, COUNT(DISTINCT rd.id) as count
+            FROM resume_data rd, json_tree(rd.skills) jt
+            WHERE jt.type = 'text' AND TRIM(jt.value) <> ''
+            GROUP BY LOWER(TRIM(jt.value))
             ORDER BY count DESC
             LIMIT 3
         """)
         top_skills = cursor.fetchall()
         if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
+            skills_text = ", ".join(f"{skill} ({count} resumes)" for skill, count in top_skills)
             insights.append({
                 'title': 'Top Skills',
                 'icon': '💡',
@@ -981,6 +1100,7 @@ class DashboardManager:
         
         return insights
 
+    @cached_query()
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
         cursor = self.conn.cursor()
@@ -1007,6 +1127,7 @@ class DashboardManager:
             "Success Rate": f"{success_rate:.1f}%"
         }
 
+    @cached_figure
     def create_enhanced_ats_gauge(self, value):
         """Create an enhanced ATS score gauge chart"""
         reference = 70  # Target score
@@ -1064,7 +1185,11 @@ class DashboardManager:
     def create_skill_distribution_chart(self):
         """Create a skill distribution chart"""
         categories, counts = self.get_skill_distribution()
-        
+        return self.build_skill_distribution_chart(categories, counts)
+
+    @cached_figure
+    def build_skill_distribution_chart(self, categories, counts):
+        """Build the skill distribution figure from category counts"""
         fig = go.Figure(data=[
             go.Bar(
                 x=categories,
@@ -1106,6 +1231,11 @@ class DashboardManager:
     def create_submission_trends_chart(self):
         """Create a weekly submission trend chart"""
         dates, submissions = self.get_weekly_trends()
+        return self.build_submission_trends_chart(dates, submissions)
+
+    @cached_figure
+    def build_submission_trends_chart(self, dates, submissions):
+        """Build the weekly submission figure from daily counts"""
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=dates,
@@ -1131,6 +1261,11 @@ class DashboardManager:
     def create_job_category_chart(self):
         """Create a success rate by category chart"""
         categories, rates = self.get_job_category_stats()
+        return self.build_job_category_chart(categories, rates)
+
+    @cached_figure
+    def build_job_category_chart(self, categories, rates):
+        """Build the success rate figure from per-category rates"""
         fig = go.Figure(go.Bar(
             x=categories,
             y=rates,
@@ -1152,4 +1287,4 @@ class DashboardManager:
         fig.update_xaxes(title_text="Job Category", color=self.colors['text'])
         fig.update_yaxes(title_text="Success Rate (%)", color=self.colors['text'])
         
-        return fig
\ No newline at end of file
+        return fig
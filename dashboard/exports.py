@@ -0,0 +1,182 @@
+"""
+Streaming exporters for the admin dashboard
+
+Rows are read from the database cursor in batches and written straight to a
+file, so peak memory does not grow with the number of resumes. Finished
+exports are cached on disk under a key derived from the table version and
+reused until the data version changes.
+"""
+import csv
+import glob
+import hashlib
+import json
+import os
+import tempfile
+
+from config.database import get_data_version
+
+EXPORT_DIR = "exports"
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_QUERY = """
+    SELECT
+        rd.id, rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills, rd.template,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at, ra.created_at AS analyzed_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    ORDER BY rd.id
+"""
+
+EXPORT_FORMATS = {
+    'Excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'CSV': ('csv', 'text/csv'),
+    'JSON': ('json', 'application/json'),
+    'JSON Lines': ('jsonl', 'application/x-ndjson'),
+}
+
+# Excel caps the width of auto-sized columns
+MAX_EXCEL_COLUMN_WIDTH = 50
+
+
+def get_table_version(conn):
+    """Get a cheap fingerprint that changes whenever exported tables change"""
+    version = get_data_version(conn)
+    if version is not None:
+        return f"v{version}"
+    
+    # Databases created before the data_version counter: fall back to counts
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM resume_data),
+            (SELECT MAX(id) FROM resume_data),
+            (SELECT COUNT(*) FROM resume_analysis),
+            (SELECT MAX(id) FROM resume_analysis)
+    """)
+    return hashlib.sha1(repr(cursor.fetchone()).encode('utf-8')).hexdigest()[:16]
+
+
+def iter_query_batches(conn, query=EXPORT_QUERY, params=(), batch_size=EXPORT_BATCH_SIZE):
+    """Execute a query and return its column names and a row iterator"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    columns = [description[0] for description in cursor.description]
+
+    def rows():
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            yield from batch
+
+    return columns, rows()
+
+
+def write_csv(path, columns, rows):
+    """Write rows to a CSV file one at a time"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+
+
+def write_jsonl(path, columns, rows):
+    """Write rows as JSON Lines, one object per row"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str))
+            f.write('\n')
+
+
+def write_json(path, columns, rows):
+    """Write rows as a JSON array without building the array in memory"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i, row in enumerate(rows):
+            if i:
+                f.write(',\n')
+            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str))
+        f.write(']')
+
+
+def write_excel(path, columns, rows, sheet_name='Resume Data'):
+    """Write rows to an Excel workbook using xlsxwriter's constant-memory mode"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({
+            'bold': True,
+            'text_wrap': True,
+            'valign': 'top',
+            'fg_color': '#D7E4BC',
+            'border': 1
+        })
+
+        # constant_memory mode flushes each row, so rows must be written in order
+        widths = [len(str(col)) for col in columns]
+        for col_num, value in enumerate(columns):
+            worksheet.write(0, col_num, value, header_format)
+
+        for row_num, row in enumerate(rows, start=1):
+            for col_num, value in enumerate(row):
+                worksheet.write(row_num, col_num, value)
+                if value is not None:
+                    widths[col_num] = max(widths[col_num], len(str(value)))
+
+        # Column widths live outside the row data, so they can be set last
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, min(width + 2, MAX_EXCEL_COLUMN_WIDTH))
+    finally:
+        workbook.close()
+
+
+WRITERS = {
+    'xlsx': write_excel,
+    'csv': write_csv,
+    'json': write_json,
+    'jsonl': write_jsonl,
+}
+
+
+def export_table(conn, extension, query=EXPORT_QUERY, name='resume_data'):
+    """Export the query result to a cached file and return its path
+
+    Exports are keyed by the table version, so repeat downloads reuse the
+    file on disk until new resumes or analyses are saved.
+    """
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    version = get_table_version(conn)
+    path = os.path.join(EXPORT_DIR, f"{name}_{version}.{extension}")
+    if os.path.exists(path):
+        return path
+
+    # Write to a temporary file of our own first, so a failed export is never
+    # served from cache and concurrent exports never share a file
+    with tempfile.NamedTemporaryFile(
+        dir=EXPORT_DIR, prefix=f"{name}_{version}.", suffix='.tmp', delete=False
+    ) as tmp_file:
+        tmp_path = tmp_file.name
+    columns, rows = iter_query_batches(conn, query)
+    try:
+        WRITERS[extension](tmp_path, columns, rows)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    # Drop exports of older table versions
+    for stale in glob.glob(os.path.join(EXPORT_DIR, f"{name}_*.{extension}")):
+        if stale != path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    return path
@@ -1,17 +1,45 @@
 import streamlit as st
 import sqlite3
+import threading
 from datetime import datetime
 import pandas as pd
 import time
 
+from config.database import to_fts_query
+
+# Columns rated on the 1-5 scale
+RATING_COLUMNS = ('rating', 'usability_score', 'feature_satisfaction')
+
+# Free-text columns shown in the paginated feedback list
+TEXT_COLUMNS = ('missing_features', 'improvement_suggestions', 'user_experience')
+
+# Seconds feedback stats are served from memory before re-querying
+FEEDBACK_STATS_TTL = 60
+
+_initialized = set()
+_stats_cache = {}
+_stats_lock = threading.Lock()
+
 class FeedbackManager:
-    def __init__(self):
-        self.db_path = "feedback/feedback.db"
-        self.setup_database()
+    def __init__(self, db_path="feedback/feedback.db"):
+        self.db_path = db_path
+        if self.db_path not in _initialized:
+            self.setup_database()
+            _initialized.add(self.db_path)
+
+    def get_connection(self):
+        """Open a connection to the feedback database; the caller closes it"""
+        return sqlite3.connect(self.db_path)
 
     def setup_database(self):
         """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
+        try:
+            self._create_tables(conn)
+        finally:
+            conn.close()
+
+    def _create_tables(self, conn):
         c = conn.cursor()
         c.execute('''
             CREATE TABLE IF NOT EXISTS feedback (
@@ -25,52 +53,178 @@ class FeedbackManager:
                 timestamp DATETIME
             )
         ''')
+        self.setup_search_index(c)
         conn.commit()
-        conn.close()
+
+    def setup_search_index(self, c):
+        """Mirror the free-text columns into an external-content FTS5 index"""
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'feedback_fts'")
+        exists = c.fetchone() is not None
+
+        columns = ', '.join(TEXT_COLUMNS)
+        new_values = ', '.join(f'new.{column}' for column in TEXT_COLUMNS)
+        old_values = ', '.join(f'old.{column}' for column in TEXT_COLUMNS)
+        c.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS feedback_fts USING fts5(
+                {columns},
+                content = 'feedback',
+                content_rowid = 'id',
+                tokenize = 'porter unicode61'
+            )
+        ''')
+        c.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_insert AFTER INSERT ON feedback BEGIN
+                INSERT INTO feedback_fts (rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        c.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_delete AFTER DELETE ON feedback BEGIN
+                INSERT INTO feedback_fts (feedback_fts, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        c.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_update AFTER UPDATE ON feedback BEGIN
+                INSERT INTO feedback_fts (feedback_fts, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO feedback_fts (rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        if not exists:
+            # Index feedback written before the search index existed
+            c.execute("INSERT INTO feedback_fts (feedback_fts) VALUES ('rebuild')")
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (
-                rating, usability_score, feature_satisfaction,
-                missing_features, improvement_suggestions,
-                user_experience, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            feedback_data['rating'],
-            feedback_data['usability_score'],
-            feedback_data['feature_satisfaction'],
-            feedback_data['missing_features'],
-            feedback_data['improvement_suggestions'],
-            feedback_data['user_experience'],
-            datetime.now()
-        ))
-        conn.commit()
-        conn.close()
+        conn = self.get_connection()
+        try:
+            c = conn.cursor()
+            c.execute('''
+                INSERT INTO feedback (
+                    rating, usability_score, feature_satisfaction,
+                    missing_features, improvement_suggestions,
+                    user_experience, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction'],
+                feedback_data['missing_features'],
+                feedback_data['improvement_suggestions'],
+                feedback_data['user_experience'],
+                datetime.now()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate_stats()
 
-    def get_feedback_stats(self):
-        """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("SELECT * FROM feedback", conn)
-        conn.close()
-        
-        if df.empty:
-            return {
-                'avg_rating': 0,
-                'avg_usability': 0,
-                'avg_satisfaction': 0,
-                'total_responses': 0
-            }
-        
+    def invalidate_stats(self):
+        """Drop cached stats so the next read re-queries"""
+        with _stats_lock:
+            _stats_cache.pop(self.db_path, None)
+
+    def query_feedback_stats(self):
+        """Compute averages, counts and 1-5 histograms in a single aggregate query"""
+        histogram_columns = ",\n".join(
+            f"SUM(CASE WHEN {column} = {value} THEN 1 ELSE 0 END)"
+            for column in RATING_COLUMNS for value in range(1, 6)
+        )
+        text_filter = " OR ".join(f"TRIM(COALESCE({column}, '')) <> ''" for column in TEXT_COLUMNS)
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    COUNT(*),
+                    AVG(rating),
+                    AVG(usability_score),
+                    AVG(feature_satisfaction),
+                    SUM(CASE WHEN {text_filter} THEN 1 ELSE 0 END),
+                    {histogram_columns}
+                FROM feedback
+            """)
+            row = cursor.fetchone()
+        finally:
+            conn.close()
+        histograms = row[5:]
         return {
-            'avg_rating': df['rating'].mean(),
-            'avg_usability': df['usability_score'].mean(),
-            'avg_satisfaction': df['feature_satisfaction'].mean(),
-            'total_responses': len(df)
+            'avg_rating': row[1] or 0,
+            'avg_usability': row[2] or 0,
+            'avg_satisfaction': row[3] or 0,
+            'total_responses': row[0] or 0,
+            'text_responses': row[4] or 0,
+            'histograms': {
+                column: [count or 0 for count in histograms[i * 5:(i + 1) * 5]]
+                for i, column in enumerate(RATING_COLUMNS)
+            }
         }
 
+    def get_feedback_stats(self):
+        """Get feedback statistics, cached until new feedback is saved"""
+        with _stats_lock:
+            cached = _stats_cache.get(self.db_path)
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+
+        stats = self.query_feedback_stats()
+        with _stats_lock:
+            _stats_cache[self.db_path] = (stats, time.monotonic() + FEEDBACK_STATS_TTL)
+        return stats
+
+    def get_feedback_page(self, page_size=10, before_id=None):
+        """Get one page of free-text feedback, newest first
+
+        Pages are keyed on the id of the last row shown, so reading a page
+        never scans the rows before it. Returns (rows, next_before_id).
+        """
+        text_filter = " OR ".join(f"TRIM(COALESCE({column}, '')) <> ''" for column in TEXT_COLUMNS)
+        query = f"""
+            SELECT id, rating, {', '.join(TEXT_COLUMNS)}, timestamp
+            FROM feedback
+            WHERE ({text_filter})
+        """
+        params = []
+        if before_id is not None:
+            query += " AND id < ?"
+            params.append(before_id)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(page_size + 1)
+
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+        next_before_id = rows[page_size - 1][0] if len(rows) > page_size else None
+        return rows[:page_size], next_before_id
+
+    def search_feedback(self, text, limit=20):
+        """Full-text search over written feedback, best matches first"""
+        match = to_fts_query(text)
+        if not match:
+            return []
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT f.id, f.rating, {', '.join('f.' + column for column in TEXT_COLUMNS)}, f.timestamp,
+                       snippet(feedback_fts, -1, '**', '**', '…', 12)
+                FROM feedback_fts
+                JOIN feedback f ON f.id = feedback_fts.rowid
+                WHERE feedback_fts MATCH ?
+                ORDER BY bm25(feedback_fts)
+                LIMIT ?
+            """, (match, limit))
+            return cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"Error searching feedback: {str(e)}")
+            return []
+        finally:
+            conn.close()
+
     def render_feedback_form(self):
         """Render the feedback form"""
         st.markdown("""
@@ -293,3 +447,52 @@ class FeedbackManager:
                     <div style="color: #E0E0E0; font-size: 1.2em;">{metric['delta']}</div>
                 </div>
             """, unsafe_allow_html=True)
+        
+        # Rating breakdown
+        with st.expander("Rating Breakdown"):
+            labels = {
+                'rating': "Overall Rating",
+                'usability_score': "Usability",
+                'feature_satisfaction': "Satisfaction"
+            }
+            breakdown = pd.DataFrame(
+                {labels[column]: counts for column, counts in stats['histograms'].items()},
+                index=[f"{value}★" for value in range(1, 6)]
+            )
+            st.bar_chart(breakdown)
+        
+        self.render_feedback_comments(stats['text_responses'])
+
+    def render_feedback_comments(self, total, page_size=10):
+        """Render written feedback one page at a time"""
+        if not total:
+            return
+        
+        with st.expander(f"Written Feedback ({total:,})"):
+            # Stack of page cursors so we can step back without OFFSET scans
+            cursors = st.session_state.setdefault('feedback_page_cursors', [None])
+            rows, next_before_id = self.get_feedback_page(page_size, cursors[-1])
+            
+            for _, rating, missing_features, improvement_suggestions, user_experience, timestamp in rows:
+                st.markdown(f"**{'⭐' * (rating or 0)}** · {str(timestamp)[:16]}")
+                for label, text in (
+                    ("Missing features", missing_features),
+                    ("Suggestions", improvement_suggestions),
+                    ("Experience", user_experience)
+                ):
+                    if text and text.strip():
+                        st.markdown(f"- *{label}:* {text}")
+                st.markdown("---")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                if st.button("⬅️ Newer", disabled=len(cursors) == 1, key="feedback_prev_page"):
+                    cursors.pop()
+                    st.rerun()
+            with col2:
+                pages = max(1, -(-total // page_size))
+                st.markdown(f"Page {len(cursors)} of {pages}")
+            with col3:
+                if st.button("Older ➡️", disabled=next_before_id is None, key="feedback_next_page"):
+                    cursors.append(next_before_id)
+                    st.rerun()
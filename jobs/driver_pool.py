@@ -0,0 +1,227 @@
+"""
+Process-wide pool of warm headless Chrome drivers
+
+Starting Chrome costs seconds and a few hundred MB, so drivers are kept
+alive between scrapes instead of being quit after every search. Streamlit
+reruns keep the module, and with it the pool, so back-to-back searches reuse
+the same browsers.
+
+- At most ``max_size`` drivers exist at once; callers beyond that wait
+  (or get None with ``timeout=0``).
+- Every idle driver is health-checked before it is handed out, and a dead
+  one is replaced transparently.
+- Drivers are recycled after ``max_age`` seconds or ``max_uses`` leases, to
+  bound Chrome's memory growth; a background reaper thread quits drivers
+  idle for over ``max_idle`` seconds.
+- All drivers, idle and leased, are quit when the process exits.
+"""
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .webdriver_utils import setup_webdriver
+
+POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '4'))
+MAX_AGE_SECONDS = 30 * 60
+MAX_IDLE_SECONDS = 10 * 60
+MAX_USES = 50
+# How often the reaper looks for idle drivers to quit
+REAP_INTERVAL_SECONDS = 60
+
+
+class _PooledDriver:
+    __slots__ = ('driver', 'created_at', 'last_used', 'uses')
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class WebDriverPool:
+    """Bounded pool of WebDriver instances, leased with ``with pool.lease() as driver``"""
+
+    def __init__(self, factory=None, max_size=POOL_SIZE, max_age=MAX_AGE_SECONDS,
+                 max_idle=MAX_IDLE_SECONDS, max_uses=MAX_USES):
+        self.factory = factory or (lambda: setup_webdriver(show_status=False))
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []  # most recently used last
+        self._leased = {}  # id(driver) -> _PooledDriver
+        self._closed = False
+        self._reaper = None
+        self._stop_reaper = threading.Event()
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+            'failed_starts': 0,
+        }
+
+    def acquire(self, timeout=None):
+        """Lease a driver, waiting up to ``timeout`` seconds for a free slot
+
+        Returns None if no slot frees up in time or Chrome fails to start.
+        """
+        if self._closed:
+            return None
+        if not self._slots.acquire(timeout=timeout):
+            return None
+        try:
+            entry = self._take_idle() or self._start()
+        except BaseException:
+            self._slots.release()
+            raise
+        if entry is None:
+            self._slots.release()
+            return None
+        entry.uses += 1
+        with self._lock:
+            self._leased[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, discard=False):
+        """Return a leased driver; ``discard`` quits it instead of keeping it warm"""
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            return
+        try:
+            now = time.monotonic()
+            if discard or self._closed or self._expired(entry, now):
+                self._bump('recycled')
+                self._quit(entry)
+                return
+            try:
+                # Drop the page so an idle browser holds as little memory as possible
+                driver.get('about:blank')
+            except Exception:
+                self._quit(entry)
+                return
+            entry.last_used = now
+            with self._lock:
+                self._idle.append(entry)
+            self._start_reaper()
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Context manager around acquire/release; yields None if no driver is available"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            if driver is not None:
+                self.release(driver)
+
+    def _take_idle(self):
+        """Most recently used healthy idle driver, quitting expired and dead ones on the way"""
+        self.reap()
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return None
+            if self._is_healthy(entry.driver):
+                self._bump('reused')
+                return entry
+            self._bump('failed_health_checks')
+            self._quit(entry)
+
+    def _start_reaper(self):
+        with self._lock:
+            if self._reaper is not None or self._closed:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name='webdriver-pool-reaper', daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        interval = min(REAP_INTERVAL_SECONDS, self.max_idle)
+        while not self._stop_reaper.wait(interval):
+            self.reap()
+
+    def reap(self):
+        """Quit idle drivers that have expired; returns how many were quit"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [entry for entry in self._idle if self._expired(entry, now)]
+            self._idle = [entry for entry in self._idle if entry not in expired]
+        for entry in expired:
+            self._bump('recycled')
+            self._quit(entry)
+        return len(expired)
+
+    def _start(self):
+        driver = self.factory()
+        if not driver:
+            self._bump('failed_starts')
+            return None
+        self._bump('created')
+        return _PooledDriver(driver)
+
+    def _expired(self, entry, now):
+        return (
+            now - entry.created_at > self.max_age
+            or now - entry.last_used > self.max_idle
+            or entry.uses >= self.max_uses
+        )
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(entry):
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            print(f"Error quitting WebDriver: {e}")
+
+    def _bump(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def close(self):
+        """Stop the reaper and quit every driver, including ones still leased"""
+        self._closed = True
+        self._stop_reaper.set()
+        with self._lock:
+            entries = self._idle + list(self._leased.values())
+            self._idle, self._leased = [], {}
+        for entry in entries:
+            self._quit(entry)
+
+    def stats(self):
+        """Pool size and lifecycle counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+            stats['leased'] = len(self._leased)
+        stats['max_size'] = self.max_size
+        return stats
+
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """Get the process-wide WebDriver pool"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = WebDriverPool()
+            atexit.register(_driver_pool.close)
+        return _driver_pool
@@ -1,4 +1,7 @@
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import streamlit as st
@@ -6,13 +9,109 @@ from streamlit_extras.add_vertical_space import add_vertical_space
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
+)
 import warnings
 warnings.filterwarnings('ignore')
 
+from config.database import get_document_text, hash_bytes
+from utils.job_index import index_jobs, rank_jobs_for_resume
+from utils.resume_analyzer import ResumeAnalyzer
+
 # Import our custom webdriver utility
+from .driver_pool import get_driver_pool
 from .webdriver_utils import setup_webdriver
 
+# Upper bound on headless browsers scraping job pages at once (each uses a few hundred MB)
+MAX_SCRAPE_WORKERS = 4
+
+# Upper bounds (seconds) for the explicit waits; each returns as soon as its condition holds
+PAGE_LOAD_TIMEOUT = 10
+SCROLL_TIMEOUT = 3
+SHOW_MORE_TIMEOUT = 1
+RETRY_DELAY = 2
+# How long a search waits for a pooled browser while other searches use them all
+BROWSER_WAIT_TIMEOUT = 60
+
+JOB_CARD_SELECTOR = '.base-search-card'
+DESCRIPTION_SELECTORS = ('div.show-more-less-html__markup', 'div.description__text')
+
+# Scroll rounds in a row that must load nothing before the results count as exhausted
+MAX_STALLED_SCROLLS = 2
+
+# Title and location of every loaded job card, read in one round trip
+CARD_TEXT_SCRIPT = """
+    return Array.from(document.querySelectorAll(arguments[0])).map(card => {
+        const title = card.querySelector('h3.base-search-card__title');
+        const location = card.querySelector('span.job-search-card__location');
+        return [title ? title.innerText : '', location ? location.innerText : ''];
+    });
+"""
+
+# Styling for job cards, shared by the search results and the resume ranking
+JOB_CARD_STYLES = """
+    <style>
+    .job-card {
+        background: rgba(255, 255, 255, 0.05);
+        border-radius: 10px;
+        padding: 1.5rem;
+        margin-bottom: 1rem;
+        border-left: 4px solid #0A66C2;
+        transition: transform 0.2s;
+    }
+    .job-card:hover {
+        background: rgba(255, 255, 255, 0.08);
+    }
+    .job-title {
+        color: #0A66C2;
+        font-size: 1.3rem;
+        margin-bottom: 0.5rem;
+    }
+    .company-name {
+        font-weight: bold;
+        font-size: 1.1rem;
+    }
+    .job-location {
+        color: #888;
+        margin-bottom: 1rem;
+    }
+    .job-url-button {
+        display: inline-block;
+        background: #0A66C2;
+        color: white;
+        padding: 0.5rem 1rem;
+        border-radius: 5px;
+        text-decoration: none;
+        margin-top: 1rem;
+        font-weight: bold;
+    }
+    .job-url-button:hover {
+        background: #084d8e;
+    }
+    .job-count {
+        background: rgba(10, 102, 194, 0.1);
+        color: #0A66C2;
+        padding: 0.5rem 1rem;
+        border-radius: 5px;
+        margin-bottom: 1rem;
+        font-weight: bold;
+    }
+    .job-section {
+        margin-top: 1rem;
+        padding-top: 0.5rem;
+        border-top: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    .job-section-title {
+        font-weight: bold;
+        color: #0A66C2;
+        margin-bottom: 0.5rem;
+    }
+    </style>
+"""
+
 class LinkedInScraper:
     """Class for scraping job listings from LinkedIn"""
 
@@ -55,7 +154,7 @@ class LinkedInScraper:
             st.markdown('<p class="linkedin-subtitle">Find real-time job listings directly from LinkedIn</p>', unsafe_allow_html=True)
             
         with st.form(key='linkedin_scrape'):
-            col1, col2, col3 = st.columns([0.5, 0.3, 0.2], gap='medium')
+            col1, col2, col3, col4 = st.columns([0.4, 0.25, 0.175, 0.175], gap='medium')
             
             with col1:
                 job_title_input = st.text_input(
@@ -77,10 +176,20 @@ class LinkedInScraper:
                 job_count = st.number_input(
                     label='Number of Jobs', 
                     min_value=1, 
-                    max_value=10,
+                    max_value=25,
                     value=3, 
                     step=1,
-                    help="Number of job listings to scrape (max 10)"
+                    help="Number of job listings to scrape (max 25)"
+                )
+            
+            with col4:
+                workers = st.number_input(
+                    label='Parallel Browsers',
+                    min_value=1,
+                    max_value=MAX_SCRAPE_WORKERS,
+                    value=3,
+                    step=1,
+                    help="Headless browsers fetching job descriptions at the same time"
                 )
 
             # Submit Button
@@ -95,7 +204,7 @@ class LinkedInScraper:
         if show_title:
             st.markdown('</div>', unsafe_allow_html=True)
         
-        return job_title_input, job_location, job_count, submit
+        return job_title_input, job_location, job_count, workers, submit
 
     @staticmethod
     def build_url(job_title, job_location):
@@ -123,69 +232,98 @@ class LinkedInScraper:
         
         return link
 
+    @staticmethod
+    def count_job_cards(driver):
+        """Number of job result cards currently on the search page"""
+        return len(driver.find_elements(by=By.CSS_SELECTOR, value=JOB_CARD_SELECTOR))
+
     @staticmethod
     def open_link(driver, link):
-        """Open LinkedIn link and wait for page to load"""
+        """Open LinkedIn link and wait for the job results to render"""
         max_attempts = 3
         attempts = 0
         
+        # Explicit waits below; an implicit wait would stall every empty lookup
+        driver.implicitly_wait(0)
+        
         while attempts < max_attempts:
             try:
                 driver.get(link)
-                driver.implicitly_wait(5)
-                time.sleep(3)
-                
-                # Check if page loaded correctly
-                if "LinkedIn" in driver.title:
-                    return True
-                    
-                # Alternative check for elements
-                try:
-                    driver.find_element(by=By.CSS_SELECTOR, value='.jobs-search-results')
-                    return True
-                except:
-                    pass
-                    
-                try:
-                    driver.find_element(by=By.CSS_SELECTOR, value='.jobs-search-results-list')
-                    return True
-                except:
-                    pass
                 
-                # One more attempt with a different selector
+                # Wait for the results list or the first job card
                 try:
-                    driver.find_element(by=By.CSS_SELECTOR, value='.base-search-card')
+                    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '.jobs-search-results')),
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '.jobs-search-results-list')),
+                        EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+                    ))
                     return True
-                except:
-                    pass
+                except TimeoutException:
+                    # A LinkedIn page without results (e.g. no matching jobs)
+                    if "LinkedIn" in driver.title:
+                        return True
                 
                 attempts += 1
                 if attempts >= max_attempts:
                     st.warning("Could not load LinkedIn jobs page. Please try again.")
                     return False
                     
-                time.sleep(2)
+                time.sleep(RETRY_DELAY)
                 
             except Exception as e:
                 attempts += 1
                 if attempts >= max_attempts:
                     st.warning(f"Error loading LinkedIn page: {str(e)}")
                     return False
-                time.sleep(2)
+                time.sleep(RETRY_DELAY)
                 
         return False
 
     @staticmethod
-    def link_open_scrolldown(driver, link, job_count):
-        """Open LinkedIn link and scroll down to load more jobs"""
+    def wait_for_more_cards(driver, previous_count, timeout=SCROLL_TIMEOUT):
+        """Wait until more job cards than ``previous_count`` are loaded; returns the new count"""
+        def more_cards(d):
+            count = LinkedInScraper.count_job_cards(d)
+            return count if count > previous_count else False
+        
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.25).until(more_cards)
+        except TimeoutException:
+            return LinkedInScraper.count_job_cards(driver)
+
+    @staticmethod
+    def count_matching_cards(driver, job_title_input, job_location):
+        """Number of loaded job cards that pass the title and location filters of scrap_company_data"""
+        try:
+            cards = driver.execute_script(CARD_TEXT_SCRIPT, JOB_CARD_SELECTOR)
+        except WebDriverException:
+            return 0
+        return sum(
+            1 for title, location in cards or []
+            if title.strip() and location.strip()
+            and LinkedInScraper.title_matches(title, job_title_input)
+            and LinkedInScraper.location_matches(location, job_location)
+        )
+
+    @staticmethod
+    def link_open_scrolldown(driver, link, job_count, job_title_input=None, job_location=None):
+        """Open LinkedIn link and scroll down until enough jobs are loaded
+        
+        Scrolling stops once ``job_count`` cards pass the title and location
+        filters, or when neither scrolling nor the "See more jobs" button
+        has loaded anything for MAX_STALLED_SCROLLS rounds in a row.
+        """
         # Open the link
         if not LinkedInScraper.open_link(driver, link):
             return False
         
-        # Scroll down to load more jobs
-        scroll_attempts = min(job_count + 5, 15)  # Add extra scrolls to ensure we get enough jobs
+        max_scrolls = min(job_count + 5, 15)
+        card_count = LinkedInScraper.count_job_cards(driver)
+        stalled = 0
         
-        for i in range(scroll_attempts):
+        for _ in range(max_scrolls):
+            if LinkedInScraper.count_matching_cards(driver, job_title_input, job_location) >= job_count:
+                break
             try:
                 # Handle sign-in modal if it appears
                 try:
@@ -200,19 +338,29 @@ class LinkedInScraper:
                 
                 # Scroll down to load more content
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1.5)
+                new_count = LinkedInScraper.wait_for_more_cards(driver, card_count)
                 
-                # Try to click "See more jobs" button if present
-                try:
-                    see_more_buttons = driver.find_elements(
-                        by=By.CSS_SELECTOR, 
-                        value="button[aria-label='See more jobs']"
-                    )
-                    if see_more_buttons:
-                        see_more_buttons[0].click()
-                        time.sleep(2)
-                except:
-                    pass
+                # Infinite scroll ran out; try the "See more jobs" button
+                if new_count <= card_count:
+                    try:
+                        see_more_buttons = driver.find_elements(
+                            by=By.CSS_SELECTOR, 
+                            value="button[aria-label='See more jobs']"
+                        )
+                        if see_more_buttons and see_more_buttons[0].is_displayed():
+                            see_more_buttons[0].click()
+                            new_count = LinkedInScraper.wait_for_more_cards(driver, card_count)
+                    except:
+                        pass
+                
+                # The card count stopped growing: every available job is loaded
+                if new_count <= card_count:
+                    stalled += 1
+                    if stalled >= MAX_STALLED_SCROLLS:
+                        break
+                    continue
+                stalled = 0
+                card_count = new_count
                 
             except Exception as e:
                 continue
@@ -245,6 +393,19 @@ class LinkedInScraper:
         # No match found
         return np.nan
 
+    @staticmethod
+    def title_matches(title, job_title_input):
+        """Whether a scraped job title contains one of the requested titles (any title if none given)"""
+        user_titles = [user_title.lower().strip() for user_title in job_title_input or [] if user_title.strip()]
+        return not user_titles or any(user_title in title.lower() for user_title in user_titles)
+
+    @staticmethod
+    def location_matches(location, job_location):
+        """Whether a scraped location is in the requested one; "India" matches everywhere"""
+        if not job_location or job_location.lower() == "india":
+            return True
+        return job_location.lower() in location.lower()
+
     @staticmethod
     def scrap_company_data(driver, job_title_input, job_location):
         """Scrape company data from LinkedIn job listings"""
@@ -302,25 +463,15 @@ class LinkedInScraper:
                 'Website URL': job_urls
             })
             
-            # Filter job titles based on user input if provided
-            if job_title_input and job_title_input != ['']:
-                filtered_titles = []
-                for title in df['Job Title']:
-                    if any(user_title.lower().strip() in title.lower() for user_title in job_title_input if user_title.strip()):
-                        filtered_titles.append(title)
-                    else:
-                        filtered_titles.append(np.nan)
-                df['Job Title'] = filtered_titles
-            
-            # Filter locations based on user input if provided and not "India"
-            if job_location and job_location.lower() != "india":
-                filtered_locations = []
-                for loc in df['Location']:
-                    if job_location.lower() in loc.lower():
-                        filtered_locations.append(loc)
-                    else:
-                        filtered_locations.append(np.nan)
-                df['Location'] = filtered_locations
+            # Filter job titles and locations based on user input if provided
+            df['Job Title'] = [
+                title if LinkedInScraper.title_matches(title, job_title_input) else np.nan
+                for title in df['Job Title']
+            ]
+            df['Location'] = [
+                loc if LinkedInScraper.location_matches(loc, job_location) else np.nan
+                for loc in df['Location']
+            ]
             
             # Drop rows with NaN values and reset index
             df = df.dropna()
@@ -334,7 +485,123 @@ class LinkedInScraper:
             return pd.DataFrame()
 
     @staticmethod
-    def scrap_job_description(driver, df, job_count):
+    def find_description(driver):
+        """First populated job description element on the page, or False"""
+        for selector in DESCRIPTION_SELECTORS:
+            for element in driver.find_elements(by=By.CSS_SELECTOR, value=selector):
+                if element.text.strip():
+                    return element
+        return False
+
+    @staticmethod
+    def scrape_description(driver, url):
+        """Open one job listing and return its processed description, or None"""
+        driver.implicitly_wait(0)
+        driver.get(url)
+        
+        # Wait for the description node to be populated
+        try:
+            description = WebDriverWait(driver, PAGE_LOAD_TIMEOUT, poll_frequency=0.2).until(
+                LinkedInScraper.find_description
+            )
+        except TimeoutException:
+            return None
+        
+        # Try to click "Show more" button to expand job description
+        try:
+            show_more_buttons = driver.find_elements(
+                by=By.CSS_SELECTOR, 
+                value='button[data-tracking-control-name="public_jobs_show-more-html-btn"]'
+            )
+            if show_more_buttons and show_more_buttons[0].is_displayed():
+                collapsed_length = len(description.text)
+                show_more_buttons[0].click()
+                # Expanded once the text grows or the button turns into "Show less"
+                WebDriverWait(driver, SHOW_MORE_TIMEOUT, poll_frequency=0.1).until(EC.any_of(
+                    lambda d: len(description.text) > collapsed_length,
+                    EC.invisibility_of_element(show_more_buttons[0]),
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, 'button[data-tracking-control-name="public_jobs_show-less-html-btn"]')
+                    )
+                ))
+        except:
+            pass
+        
+        try:
+            text = description.text
+        except StaleElementReferenceException:
+            # Re-rendered while expanding
+            description = LinkedInScraper.find_description(driver)
+            text = description.text if description else ''
+        return LinkedInScraper.process_job_description(text) if text.strip() else None
+
+    @staticmethod
+    def scrape_descriptions(job_urls, driver=None, workers=1, progress_callback=None):
+        """Scrape the descriptions of job listings, returned in the order of ``job_urls``
+        
+        With workers > 1 the URLs are shared out across that many headless
+        browsers: ``driver`` plus any free ones from the warm driver pool,
+        each taking the next URL as soon as it is free. ``progress_callback(done,
+        total)`` runs on the calling thread after every job, so it may update
+        Streamlit elements.
+        
+        Returns (descriptions, errors): None marks a listing without a
+        description, and errors are (index, message) pairs.
+        """
+        total = len(job_urls)
+        descriptions = [None] * total
+        errors = []
+        pending = queue.Queue()
+        for i, url in enumerate(job_urls):
+            pending.put((i, url))
+        finished = queue.Queue()
+        
+        def work(worker_driver):
+            own_driver = worker_driver is None
+            if own_driver:
+                worker_driver = get_driver_pool().acquire(timeout=0)
+                if not worker_driver:
+                    # The pool is busy or Chrome failed to start; the other browsers pick up this share
+                    return
+            try:
+                while True:
+                    try:
+                        i, url = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        descriptions[i] = LinkedInScraper.scrape_description(worker_driver, url)
+                    except Exception as e:
+                        errors.append((i, str(e)))
+                    finished.put(i)
+            finally:
+                if own_driver:
+                    get_driver_pool().release(worker_driver)
+        
+        workers = max(1, min(workers, MAX_SCRAPE_WORKERS, total))
+        drivers = [driver] + [None] * (workers - 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='linkedin-scrape') as pool:
+            futures = [pool.submit(work, worker_driver) for worker_driver in drivers]
+            done = 0
+            while done < total:
+                try:
+                    finished.get(timeout=0.5)
+                except queue.Empty:
+                    if all(future.done() for future in futures):
+                        break
+                    continue
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+        
+        # Listings no browser got to, e.g. when none could be started
+        while not pending.empty():
+            i, _ = pending.get_nowait()
+            errors.append((i, "No browser available"))
+        return descriptions, sorted(errors)
+
+    @staticmethod
+    def scrap_job_description(driver, df, job_count, workers=1):
         """Scrape job descriptions for each job listing"""
         if df.empty:
             return df
@@ -345,65 +612,19 @@ class LinkedInScraper:
         # Limit to requested job count
         job_urls = job_urls[:min(len(job_urls), job_count)]
         
-        # Initialize list for job descriptions
-        job_descriptions = []
-        
         # Progress bar for scraping job descriptions
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for i, url in enumerate(job_urls):
-            try:
-                # Update progress
-                progress = int((i + 1) / len(job_urls) * 100)
-                progress_bar.progress(progress)
-                status_text.text(f"Scraping job {i+1} of {len(job_urls)}...")
-                
-                # Open job listing page
-                driver.get(url)
-                driver.implicitly_wait(5)
-                time.sleep(2)
-                
-                # Try to click "Show more" button to expand job description
-                try:
-                    show_more_buttons = driver.find_elements(
-                        by=By.CSS_SELECTOR, 
-                        value='button[data-tracking-control-name="public_jobs_show-more-html-btn"]'
-                    )
-                    if show_more_buttons:
-                        show_more_buttons[0].click()
-                        time.sleep(1)
-                except:
-                    pass
-                
-                # Get job description
-                description_elements = driver.find_elements(
-                    by=By.CSS_SELECTOR, 
-                    value='div.show-more-less-html__markup'
-                )
-                
-                if description_elements and description_elements[0].text.strip():
-                    description_text = description_elements[0].text
-                    
-                    # Process and structure the job description
-                    processed_description = LinkedInScraper.process_job_description(description_text)
-                    job_descriptions.append(processed_description)
-                else:
-                    # Try alternative selectors
-                    alt_description = driver.find_elements(
-                        by=By.CSS_SELECTOR, 
-                        value='div.description__text'
-                    )
-                    if alt_description and alt_description[0].text.strip():
-                        description_text = alt_description[0].text
-                        processed_description = LinkedInScraper.process_job_description(description_text)
-                        job_descriptions.append(processed_description)
-                    else:
-                        job_descriptions.append("Description not available")
-                    
-            except Exception as e:
-                job_descriptions.append("Description not available")
-                st.warning(f"Error scraping job description {i+1}: {str(e)}")
+        def update_progress(done, total):
+            progress_bar.progress(int(done / total * 100))
+            status_text.text(f"Scraped {done} of {total} jobs...")
+        
+        job_descriptions, errors = LinkedInScraper.scrape_descriptions(
+            job_urls, driver, workers, update_progress
+        )
+        for i, error in errors:
+            st.warning(f"Error scraping job description {i+1}: {error}")
             
         # Clear progress indicators
         progress_bar.empty()
@@ -413,12 +634,11 @@ class LinkedInScraper:
         df = df.iloc[:len(job_descriptions), :]
         
         # Add job descriptions to DataFrame
-        df['Job Description'] = job_descriptions
+        df['Job Description'] = [
+            description if description else np.nan for description in job_descriptions
+        ]
         
         # Filter out rows with unavailable descriptions
-        df['Job Description'] = df['Job Description'].apply(
-            lambda x: np.nan if x == "Description not available" else x
-        )
         df = df.dropna()
         df = df.reset_index(drop=True)
         
@@ -493,6 +713,85 @@ class LinkedInScraper:
         # Join all processed sections
         return '\n\n'.join(processed_sections)
 
+    @staticmethod
+    def save_jobs(df_final):
+        """Store scraped jobs and add them to the job index for resume ranking"""
+        try:
+            index_jobs([
+                {
+                    'url': row['Website URL'],
+                    'title': row['Job Title'],
+                    'company': row['Company Name'],
+                    'location': row['Location'],
+                    'description': row['Job Description'],
+                }
+                for _, row in df_final.iterrows()
+            ])
+        except Exception as e:
+            print(f"Error indexing scraped jobs: {str(e)}")
+
+    @staticmethod
+    def get_resume_text(uploaded_file):
+        """Text of an uploaded resume, or of the last resume analyzed in this session"""
+        if uploaded_file is None:
+            content_hash = st.session_state.get('last_resume_hash')
+            return get_document_text(content_hash) if content_hash else None
+
+        text = get_document_text(hash_bytes(uploaded_file.getvalue()))
+        if text is not None:
+            return text
+        analyzer = ResumeAnalyzer()
+        if uploaded_file.type == "application/pdf":
+            return analyzer.extract_text_from_pdf(uploaded_file)
+        return analyzer.extract_text_from_docx(uploaded_file)
+
+    @staticmethod
+    def render_job_ranking():
+        """Rank every scraped job against the user's resume"""
+        st.markdown(JOB_CARD_STYLES, unsafe_allow_html=True)
+        st.markdown("### 🎯 Rank Scraped Jobs for My Resume")
+        uploaded_file = st.file_uploader(
+            "Upload your resume",
+            type=['pdf', 'docx'],
+            key="linkedin_rank_resume",
+            help="Leave empty to use the last resume you analyzed"
+        )
+        col1, col2 = st.columns([0.6, 0.4])
+        with col1:
+            top_n = st.slider("Jobs to show", min_value=5, max_value=50, value=10, step=5)
+        with col2:
+            skills_only = st.checkbox("Only jobs sharing a skill with my resume", value=False)
+
+        if not st.button("Rank Jobs", use_container_width=True):
+            return
+
+        text = LinkedInScraper.get_resume_text(uploaded_file)
+        if not text or not text.strip():
+            st.warning("Upload a resume, or analyze one in the Resume Analyzer first.")
+            return
+
+        with st.spinner('Ranking jobs...'):
+            ranked = rank_jobs_for_resume(text, top_n, skills_only)
+        if not ranked:
+            st.info("No scraped jobs to rank yet. Search LinkedIn jobs above first.")
+            return
+
+        for job in ranked:
+            st.markdown(f"""
+                <div class="job-card">
+                    <div class="job-title">{job['title']} · {job['similarity']}% match</div>
+                    <div class="company-name">{job['company']}</div>
+                    <div class="job-location">📍 {job['location']}</div>
+                </div>
+            """, unsafe_allow_html=True)
+            with st.expander("Skills and Description"):
+                if job['matched_skills']:
+                    st.markdown(f"**Your matching skills:** {', '.join(job['matched_skills'])}")
+                if job['missing_skills']:
+                    st.markdown(f"**Skills to add:** {', '.join(job['missing_skills'])}")
+                st.markdown(job['description'])
+                st.markdown(f"<a href='{job['url']}' target='_blank' class='job-url-button'>Apply on LinkedIn</a>", unsafe_allow_html=True)
+
     @staticmethod
     def display_data_userinterface(df_final):
         """Display scraped job data in the user interface"""
@@ -501,65 +800,7 @@ class LinkedInScraper:
             return
             
         # Apply custom styling for job cards
-        st.markdown("""
-            <style>
-            .job-card {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                padding: 1.5rem;
-                margin-bottom: 1rem;
-                border-left: 4px solid #0A66C2;
-                transition: transform 0.2s;
-            }
-            .job-card:hover {
-                background: rgba(255, 255, 255, 0.08);
-            }
-            .job-title {
-                color: #0A66C2;
-                font-size: 1.3rem;
-                margin-bottom: 0.5rem;
-            }
-            .company-name {
-                font-weight: bold;
-                font-size: 1.1rem;
-            }
-            .job-location {
-                color: #888;
-                margin-bottom: 1rem;
-            }
-            .job-url-button {
-                display: inline-block;
-                background: #0A66C2;
-                color: white;
-                padding: 0.5rem 1rem;
-                border-radius: 5px;
-                text-decoration: none;
-                margin-top: 1rem;
-                font-weight: bold;
-            }
-            .job-url-button:hover {
-                background: #084d8e;
-            }
-            .job-count {
-                background: rgba(10, 102, 194, 0.1);
-                color: #0A66C2;
-                padding: 0.5rem 1rem;
-                border-radius: 5px;
-                margin-bottom: 1rem;
-                font-weight: bold;
-            }
-            .job-section {
-                margin-top: 1rem;
-                padding-top: 0.5rem;
-                border-top: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            .job-section-title {
-                font-weight: bold;
-                color: #0A66C2;
-                margin-bottom: 0.5rem;
-            }
-            </style>
-        """, unsafe_allow_html=True)
+        st.markdown(JOB_CARD_STYLES, unsafe_allow_html=True)
         
         # Display job count
         st.markdown(f'<div class="job-count">🎯 Found {len(df_final)} matching jobs on LinkedIn</div>', unsafe_allow_html=True)
@@ -591,19 +832,20 @@ class LinkedInScraper:
     @staticmethod
     def main(show_title=True):
         """Main function to run the LinkedIn job scraper"""
-        # Initialize driver to None
+        # Initialize driver to None; browsers come from the process-wide warm pool
         driver = None
+        pool = get_driver_pool()
         
         try:
             # Get user input
-            job_title_input, job_location, job_count, submit = LinkedInScraper.get_user_input(show_title)
+            job_title_input, job_location, job_count, workers, submit = LinkedInScraper.get_user_input(show_title)
             
             if submit:
                 if job_title_input != [''] and job_location:
                     try:
-                        # Set up Chrome webdriver
+                        # Lease a warm Chrome webdriver, starting one if none is idle
                         with st.spinner('Setting up Chrome webdriver...'):
-                            driver = LinkedInScraper.webdriver_setup()
+                            driver = pool.acquire(timeout=BROWSER_WAIT_TIMEOUT)
                             
                             if not driver:
                                 st.error("Failed to initialize Chrome webdriver. Please make sure Chrome is installed.")
@@ -613,7 +855,9 @@ class LinkedInScraper:
                         with st.spinner('Loading LinkedIn jobs page...'):
                             link = LinkedInScraper.build_url(job_title_input, job_location)
                             st.info(f"Searching for: {', '.join([t for t in job_title_input if t.strip()])} in {job_location}")
-                            success = LinkedInScraper.link_open_scrolldown(driver, link, job_count)
+                            success = LinkedInScraper.link_open_scrolldown(
+                                driver, link, job_count, job_title_input, job_location
+                            )
                             
                             if not success:
                                 st.error("Failed to load LinkedIn jobs page. Please try again.")
@@ -629,12 +873,15 @@ class LinkedInScraper:
                         
                         # Scrape job descriptions
                         with st.spinner('Fetching job descriptions...'):
-                            df_final = LinkedInScraper.scrap_job_description(driver, df, job_count)
+                            df_final = LinkedInScraper.scrap_job_description(driver, df, job_count, workers)
                             
                             if df_final.empty:
                                 st.warning("Could not retrieve job descriptions. Try different search terms.")
                                 return
                         
+                        # Keep the jobs for ranking against resumes later
+                        LinkedInScraper.save_jobs(df_final)
+                        
                         # Display results
                         LinkedInScraper.display_data_userinterface(df_final)
                         
@@ -647,14 +894,16 @@ class LinkedInScraper:
                     
                 elif not job_location:
                     st.warning("Please enter a job location to search.")
+            
+            LinkedInScraper.render_job_ranking()
                     
         except Exception as e:
             st.error(f"An unexpected error occurred: {str(e)}")
             
         finally:
-            # Close the webdriver
+            # Return the webdriver to the pool so the next search starts warm
             if driver:
-                driver.quit()
+                pool.release(driver)
 
 def render_linkedin_scraper():
     """Render the LinkedIn job scraper interface"""
@@ -11,13 +11,21 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 
 
-def setup_webdriver():
+def setup_webdriver(show_status=True):
     """
     Starts Chrome WebDriver safely.
 
     - Windows: uses local chromedriver.exe + installed Chrome
     - Render/Linux (Docker): uses system chromium + chromedriver
+
+    With show_status=False, nothing is written to the Streamlit page (e.g.
+    when starting browsers from worker threads); errors are printed instead.
     """
+    def report_error(message):
+        if show_status:
+            st.error(message)
+        else:
+            print(message)
 
     options = Options()
 
@@ -47,20 +55,21 @@ def setup_webdriver():
                     break
 
             if not chrome_binary:
-                st.error("Google Chrome not found on this system")
+                report_error("Google Chrome not found on this system")
                 return None
 
             options.binary_location = chrome_binary
 
             driver_path = os.path.join(os.getcwd(), "chromedriver.exe")
             if not os.path.exists(driver_path):
-                st.error("chromedriver.exe not found in project root")
+                report_error("chromedriver.exe not found in project root")
                 return None
 
             service = Service(driver_path)
             driver = webdriver.Chrome(service=service, options=options)
 
-            st.success("Chrome WebDriver started on Windows")
+            if show_status:
+                st.success("Chrome WebDriver started on Windows")
             return driver
 
         # =========================
@@ -69,9 +78,10 @@ def setup_webdriver():
         else:
             # Docker already installs chromium + chromedriver
             driver = webdriver.Chrome(options=options)
-            st.success("Chrome WebDriver started on Render / Docker")
+            if show_status:
+                st.success("Chrome WebDriver started on Render / Docker")
             return driver
 
     except Exception as e:
-        st.error(f"WebDriver failed: {e}")
+        report_error(f"WebDriver failed: {e}")
         return None
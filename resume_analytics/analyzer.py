@@ -1,14 +1,74 @@
 import spacy
+import threading
 from collections import Counter
 from datetime import datetime
+from spacy.matcher import Matcher, PhraseMatcher
+from spacy.tokens import Span
+from spacy.util import filter_spans
+
+from config.skills import get_skill_matcher
+
+# Components of en_core_web_sm that the analytics never read
+DISABLED_COMPONENTS = ("ner", "lemmatizer")
+
+_nlp = None
+_matchers = None
+_lock = threading.Lock()
+
+def get_nlp():
+    """Shared spaCy pipeline, loaded once per process on first use"""
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                _nlp = spacy.load("en_core_web_sm", disable=list(DISABLED_COMPONENTS))
+    return _nlp
+
+def get_matchers():
+    """Shared (skills PhraseMatcher, years Matcher, phrase -> skill) built on get_nlp()'s vocab"""
+    global _matchers
+    if _matchers is None:
+        nlp = get_nlp()
+        with _lock:
+            if _matchers is None:
+                # Every name and alias from config.skills, keyed by phrase
+                skills = PhraseMatcher(nlp.vocab, attr="LOWER")
+                phrase_skills = {}
+                for phrase, skill, case_sensitive in get_skill_matcher().phrases():
+                    skills.add(phrase, [nlp.make_doc(phrase)])
+                    phrase_skills[phrase] = (skill, case_sensitive)
+                years = Matcher(nlp.vocab)
+                years.add("YEARS", [[{"LIKE_NUM": True}, {"LOWER": {"REGEX": "year"}}]])
+                _matchers = (skills, years, phrase_skills)
+    return _matchers
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    @property
+    def nlp(self):
+        return get_nlp()
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        return self._analyze_doc(self.nlp(resume_text))
+    
+    def analyze_many(self, texts, batch_size=64, n_process=1, as_tuples=False):
+        """Analyze many resume texts, yielding one result per text in order
+        
+        Texts go through nlp.pipe in batches; n_process > 1 spreads them
+        across worker processes. With as_tuples, texts are (text, context)
+        pairs and (result, context) pairs are yielded, as in nlp.pipe.
+        """
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process, as_tuples=as_tuples)
+        if as_tuples:
+            for doc, context in docs:
+                yield self._analyze_doc(doc), context
+        else:
+            for doc in docs:
+                yield self._analyze_doc(doc)
+    
+    def _analyze_doc(self, doc):
+        """Metrics for one processed document"""
+        resume_text = doc.text
         
         # Basic metrics
         word_count = len(resume_text.split())
@@ -42,37 +102,28 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        # One pass over the document matches taxonomy skills of any length
+        skill_matcher, _, phrase_skills = get_matchers()
+        spans = []
+        for match_id, start, end in skill_matcher(doc):
+            phrase = doc.vocab.strings[match_id]
+            skill, case_sensitive = phrase_skills[phrase]
+            if case_sensitive and doc[start:end].text != phrase:
+                continue
+            spans.append(Span(doc, start, end, label=skill))
+        # Prefer the longest phrase, e.g. "React Native" over "React"
+        return {span.label_ for span in filter_spans(spans)}
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
         # Simple heuristic - look for number + "years"
+        _, years_matcher, _ = get_matchers()
         experience_years = 0
-        for token in doc:
-            if token.like_num and token.i < len(doc) - 1:
-                next_token = doc[token.i + 1]
-                if "year" in next_token.text.lower():
-                    try:
-                        experience_years = max(experience_years, int(token.text))
-                    except ValueError:
-                        continue
+        for _, start, _ in years_matcher(doc):
+            try:
+                experience_years = max(experience_years, int(doc[start].text))
+            except ValueError:
+                continue
         return experience_years
     
     def _calculate_profile_score(self, word_count, sentence_count, skills_count, experience_years):
@@ -134,3 +185,20 @@ class ResumeAnalyzer:
             })
             
         return suggestions
+
+def analyze_stored_resumes(batch_size=64, n_process=1):
+    """Analyze the stored text of every uploaded resume
+    
+    Yields (content_hash, result) pairs, streaming documents from the
+    database so memory stays flat however many resumes are stored.
+    """
+    from config.database import get_database_connection, decompress_text
+    
+    conn = get_database_connection()
+    try:
+        rows = conn.execute('SELECT content_hash, text_blob FROM resume_documents ORDER BY created_at')
+        texts = ((decompress_text(blob), content_hash) for content_hash, blob in rows)
+        for result, content_hash in ResumeAnalyzer().analyze_many(texts, batch_size, n_process, as_tuples=True):
+            yield content_hash, result
+    finally:
+        conn.close()
@@ -6,5 +6,6 @@ from .resume_analyzer import ResumeAnalyzer
 from .resume_builder import ResumeBuilder
 from .resume_parser import ResumeParser
 from .excel_manager import ExcelManager
+from .resume_store import ResumeStore
 from .database import * 
 from .ai_resume_analyzer import AIResumeAnalyzer
\ No newline at end of file
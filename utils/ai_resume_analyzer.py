@@ -11,6 +11,8 @@ import json
 import math
 import re
 
+from config.tracing import span, traced
+
 
 class AIResumeAnalyzer:
     def __init__(self):
@@ -24,6 +26,7 @@ class AIResumeAnalyzer:
         if self.google_api_key:
             genai.configure(api_key=self.google_api_key)
     
+    @traced('extract.ai')
     def extract_text_from_pdf(self, pdf_file):
         """Extract text from PDF using pdfplumber and OCR if needed"""
         text = ""
@@ -43,7 +46,8 @@ class AIResumeAnalyzer:
         try:
             # Try direct text extraction with pdfplumber
             try:
-                with pdfplumber.open(temp_path) as pdf:
+                with span('extract.ai.pdfplumber') as current, pdfplumber.open(temp_path) as pdf:
+                    current.set(pages=len(pdf.pages))
                     for page in pdf.pages:
                         try:
                             # Suppress specific warnings about PDFColorSpace conversion
@@ -71,7 +75,7 @@ class AIResumeAnalyzer:
             try:
                 import pypdf
                 pdf_text = ""
-                with open(temp_path, 'rb') as file:
+                with span('extract.ai.pypdf'), open(temp_path, 'rb') as file:
                     pdf_reader = pypdf.PdfReader(file)
                     for page in pdf_reader.pages:
                         page_text = page.extract_text()
@@ -117,16 +121,19 @@ class AIResumeAnalyzer:
                 
                 # Try to convert PDF to images
                 try:
-                    if poppler_path and os.name == 'nt':
-                        images = convert_from_path(temp_path, poppler_path=poppler_path)
-                    else:
-                        images = convert_from_path(temp_path)
+                    with span('extract.ocr.render') as current:
+                        if poppler_path and os.name == 'nt':
+                            images = convert_from_path(temp_path, poppler_path=poppler_path)
+                        else:
+                            images = convert_from_path(temp_path)
+                        current.set(pages=len(images))
                     
                     # Process each image with OCR
                     ocr_text = ""
                     for i, image in enumerate(images):
                         st.info(f"Processing page {i+1} with OCR...")
-                        page_text = pytesseract.image_to_string(image)
+                        with span('extract.ocr.page', page=i + 1):
+                            page_text = pytesseract.image_to_string(image)
                         ocr_text += page_text + "\n"
                     
                     if ocr_text.strip():
@@ -161,6 +168,7 @@ class AIResumeAnalyzer:
         st.error("All text extraction methods failed. Please try a different PDF or manually extract the text.")
         return ""
     
+    @traced('extract.ai.docx')
     def extract_text_from_docx(self, docx_file):
         """Extract text from DOCX file"""
         from docx import Document
@@ -257,8 +265,9 @@ class AIResumeAnalyzer:
                 [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
                 """
             
-            response = model.generate_content(base_prompt)
-            analysis = response.text.strip()
+            with span('llm.gemini', model="gemini-2.5-flash", prompt_chars=len(base_prompt)):
+                response = model.generate_content(base_prompt)
+                analysis = response.text.strip()
             
             # Extract resume score if present
             resume_score = self._extract_score_from_text(analysis)
@@ -276,6 +285,7 @@ class AIResumeAnalyzer:
             return {"error": f"Analysis failed: {str(e)}"}
 
     
+    @traced('report.pdf')
     def generate_pdf_report(self, analysis_result, candidate_name, job_role):
         """Generate a PDF report of the analysis"""
         try:
@@ -1,8 +1,13 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func, select, literal, union_all
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
+from contextlib import contextmanager
 import datetime
 import json
+import threading
+
+DEFAULT_DB_PATH = 'resume_data.db'
 
 # Create the base class for declarative models
 Base = declarative_base()
@@ -37,12 +42,72 @@ class AIAnalysis(Base):
     job_role = Column(String(100))
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+_engines = {}
+_sessions = {}
+_engines_lock = threading.Lock()
+
+def get_engine(db_path=DEFAULT_DB_PATH):
+    """Get the shared engine for a database file, creating tables on first use"""
+    with _engines_lock:
+        engine = _engines.get(db_path)
+        if engine is None:
+            engine = create_engine(
+                f'sqlite:///{db_path}',
+                poolclass=QueuePool,
+                pool_size=5,
+                max_overflow=10,
+                pool_pre_ping=True,
+                # Pooled connections are handed to whichever thread checks them out
+                connect_args={'check_same_thread': False}
+            )
+            Base.metadata.create_all(engine)
+            _engines[db_path] = engine
+        return engine
+
+def get_session_factory(db_path=DEFAULT_DB_PATH):
+    """Get the thread-local session registry bound to the shared engine"""
+    engine = get_engine(db_path)
+    with _engines_lock:
+        factory = _sessions.get(db_path)
+        if factory is None:
+            factory = scoped_session(sessionmaker(bind=engine))
+            _sessions[db_path] = factory
+        return factory
+
+def new_session(db_path=DEFAULT_DB_PATH):
+    """Open a session of its own on the shared engine; the caller closes it
+
+    Unlike the thread-local registry session used by DatabaseManager, it
+    shares no pending work or loaded objects with other code on the thread.
+    """
+    return sessionmaker(bind=get_engine(db_path))()
+
+@contextmanager
+def session_scope(db_path=DEFAULT_DB_PATH):
+    """Provide a transactional scope: commit on success, roll back on error
+
+    The scope uses its own session, so it never commits, rolls back or
+    detaches work of a DatabaseManager on the same thread.
+    """
+    session = new_session(db_path)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 class DatabaseManager:
-    def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.engine = get_engine(db_path)
+        self.Session = get_session_factory(db_path)
+    
+    @property
+    def session(self):
+        """The session of the calling thread"""
+        return self.Session()
     
     def save_resume(self, user_id, job_role, content):
         resume = Resume(
@@ -75,94 +140,116 @@ class DatabaseManager:
     def get_resume_analyses(self, resume_id):
         return self.session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
     
+    def bulk_save_resumes(self, resumes):
+        """Save many (user_id, job_role, content) tuples in one transaction"""
+        objects = [
+            Resume(user_id=user_id, job_role=job_role, content=content)
+            for user_id, job_role, content in resumes
+        ]
+        return self._bulk_save(objects)
+    
+    def bulk_save_analyses(self, analyses):
+        """Save many (resume_id, analysis_data) tuples in one transaction"""
+        objects = [
+            Analysis(resume_id=resume_id, analysis_data=analysis_data)
+            for resume_id, analysis_data in analyses
+        ]
+        return self._bulk_save(objects)
+    
+    def _bulk_save(self, objects):
+        session = self.session
+        try:
+            session.add_all(objects)
+            session.flush()
+            ids = [obj.id for obj in objects]
+            session.commit()
+            return ids
+        except Exception:
+            session.rollback()
+            raise
+    
     def close(self):
-        self.session.close()
+        self.Session.remove()
 
 def get_database_connection():
-    """Get a connection to the database"""
-    engine = create_engine('sqlite:///resume_data.db')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Open a session on the shared database engine; the caller must close it"""
+    return new_session(DEFAULT_DB_PATH)
 
 def save_resume_data(resume_data):
     """Save resume data to the database"""
-    session = get_database_connection()
-    try:
-        # Convert resume_data to JSON string
-        resume_json = json.dumps(resume_data)
-        
-        # Create a new Resume object
-        resume = Resume(
-            user_id="anonymous",  # We don't have user authentication yet
-            job_role=resume_data.get('target_role', 'Unknown'),
-            content=resume_json
-        )
-        
-        session.add(resume)
-        session.commit()
-        return resume.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    return bulk_save_resume_data([resume_data])[0]
+
+def bulk_save_resume_data(resumes):
+    """Save many resumes in a single transaction and return their ids"""
+    with session_scope() as session:
+        objects = [
+            Resume(
+                user_id="anonymous",  # We don't have user authentication yet
+                job_role=resume_data.get('target_role', 'Unknown'),
+                content=json.dumps(resume_data)
+            )
+            for resume_data in resumes
+        ]
+        session.add_all(objects)
+        session.flush()
+        return [resume.id for resume in objects]
 
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
-    session = get_database_connection()
-    try:
-        # Create a new AIAnalysis object
-        ai_analysis = AIAnalysis(
-            resume_id=resume_id,
-            model_used=analysis_data.get('model_used', 'Unknown'),
-            resume_score=analysis_data.get('resume_score', 0),
-            job_role=analysis_data.get('job_role', 'Unknown')
-        )
-        
-        session.add(ai_analysis)
-        session.commit()
-        return ai_analysis.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    return bulk_save_ai_analysis_data([(resume_id, analysis_data)])[0]
+
+def bulk_save_ai_analysis_data(analyses):
+    """Save many (resume_id, analysis_data) pairs in a single transaction and return their ids"""
+    with session_scope() as session:
+        objects = [
+            AIAnalysis(
+                resume_id=resume_id,
+                model_used=analysis_data.get('model_used', 'Unknown'),
+                resume_score=analysis_data.get('resume_score', 0),
+                job_role=analysis_data.get('job_role', 'Unknown')
+            )
+            for resume_id, analysis_data in analyses
+        ]
+        session.add_all(objects)
+        session.flush()
+        return [ai_analysis.id for ai_analysis in objects]
 
 def get_ai_analysis_statistics():
-    """Get statistics about AI analyses"""
-    session = get_database_connection()
+    """Get statistics about AI analyses in a single query"""
     try:
-        # Get total number of analyses
-        total_analyses = session.query(func.count(AIAnalysis.id)).scalar() or 0
-        
-        # Get average resume score
-        average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
-        
-        # Get model usage distribution
-        model_usage_query = session.query(
-            AIAnalysis.model_used, 
-            func.count(AIAnalysis.id)
-        ).group_by(AIAnalysis.model_used).all()
+        with session_scope() as session:
+            # One grouped query per dimension, combined so the database is hit once
+            by_model = select(
+                literal('model').label('kind'),
+                AIAnalysis.model_used.label('key'),
+                func.count(AIAnalysis.id).label('count'),
+                func.count(AIAnalysis.resume_score).label('scored'),
+                func.sum(AIAnalysis.resume_score).label('score_sum')
+            ).group_by(AIAnalysis.model_used)
+            by_role = select(
+                literal('role').label('kind'),
+                AIAnalysis.job_role.label('key'),
+                func.count(AIAnalysis.id).label('count'),
+                func.count(AIAnalysis.resume_score).label('scored'),
+                func.sum(AIAnalysis.resume_score).label('score_sum')
+            ).group_by(AIAnalysis.job_role)
+            rows = session.execute(union_all(by_model, by_role)).all()
         
-        model_usage = {model: count for model, count in model_usage_query}
+        model_usage = {row.key: row.count for row in rows if row.kind == 'model'}
+        job_roles = {row.key: row.count for row in rows if row.kind == 'role'}
         
-        # Get job role distribution
-        job_roles_query = session.query(
-            AIAnalysis.job_role, 
-            func.count(AIAnalysis.id)
-        ).group_by(AIAnalysis.job_role).all()
-        
-        job_roles = {role: count for role, count in job_roles_query}
+        # Totals are the sums over one dimension's groups
+        model_rows = [row for row in rows if row.kind == 'model']
+        total_analyses = sum(row.count for row in model_rows)
+        scored = sum(row.scored for row in model_rows)
+        score_sum = sum(row.score_sum or 0 for row in model_rows)
         
         return {
             'total_analyses': total_analyses,
-            'average_score': float(average_score),
+            'average_score': float(score_sum / scored) if scored else 0.0,
             'model_usage': model_usage,
             'job_roles': job_roles
         }
     except Exception as e:
         print(f"Error getting AI analysis statistics: {e}")
         return None
-    finally:
-        session.close()
\ No newline at end of file
@@ -1,43 +1,54 @@
+import json
+import os
 import pandas as pd
 from datetime import datetime
 
+from .resume_store import ResumeStore
+
 class ExcelManager:
-    def __init__(self):
+    """Resume storage with Excel available as an on-demand export format
+
+    Data is stored in an append-only ResumeStore; ``resume_data.xlsx`` is only
+    written when export_to_excel is called. An existing workbook from before
+    the switch is imported on first use.
+    """
+
+    def __init__(self, store=None):
         self.excel_file = "resume_data.xlsx"
-    
+        self.store = store or ResumeStore()
+        excel_name = os.path.basename(self.excel_file)
+        if os.path.exists(self.excel_file) and not self.store.is_import_complete(excel_name):
+            try:
+                self.store.import_excel(self.excel_file)
+            except Exception as e:
+                print(f"Error importing {self.excel_file}: {str(e)}")
+
     def save_resume_data(self, user_id, job_role, content, analysis_data=None):
         try:
-            # Try to read existing Excel file
-            try:
-                df = pd.read_excel(self.excel_file)
-            except FileNotFoundError:
-                df = pd.DataFrame()
-            
-            # Create new data entry
-            new_data = {
+            return self.store.append({
                 'user_id': user_id,
                 'job_role': job_role,
                 'content': content,
-                'analysis_data': str(analysis_data) if analysis_data else None,
+                'analysis_data': analysis_data,
                 'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Append new data
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.excel_file, index=False)
-            return True
+            })
         except Exception as e:
-            print(f"Error saving to Excel: {str(e)}")
+            print(f"Error saving resume data: {str(e)}")
             return False
-    
+
     def get_all_resumes(self):
-        try:
-            return pd.read_excel(self.excel_file)
-        except FileNotFoundError:
-            return pd.DataFrame()
-    
+        return pd.DataFrame(list(self.store.iter_records()))
+
     def get_user_resumes(self, user_id):
+        return pd.DataFrame(self.store.get_user_records(user_id))
+
+    def export_to_excel(self, path=None):
+        """Write all stored resumes to an Excel workbook and return its path"""
+        path = path or self.excel_file
         df = self.get_all_resumes()
-        return df[df['user_id'] == user_id]
\ No newline at end of file
+        if 'analysis_data' in df.columns:
+            df['analysis_data'] = df['analysis_data'].apply(
+                lambda x: json.dumps(x, default=str) if isinstance(x, (dict, list)) else x
+            )
+        df.to_excel(path, index=False)
+        return path
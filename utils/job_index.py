@@ -0,0 +1,329 @@
+"""
+Index of scraped job descriptions for ranking jobs against a resume
+
+Job postings collected by jobs/linkedin_scraper.py are stored in the
+scraped_jobs table, with their canonical skills (config.skills) in the
+scraped_job_skills inverted index. This module keeps a TF-IDF index over the
+descriptions next to them:
+
+- terms are the same words, word pairs and ``skill:`` features as
+  utils/semantic_scorer.py, hashed into a fixed number of columns so new
+  jobs never change the vocabulary,
+- the sublinear term frequencies live in a scipy CSR matrix, saved in one
+  file under JOB_INDEX_DIR with each job's id and the scraped_at it was
+  indexed at; IDF weights are derived from its document frequencies, so
+  adding jobs is an append and a save, not a rebuild,
+- ranking a resume is one sparse matrix-vector product over every job.
+
+The database is the source of truth. Whenever the index is loaded, and
+whenever scraped_jobs changes under a running process, it is synced with
+the database's job ids and scraped_at values: new and re-scraped jobs are
+(re)indexed and removed ones dropped, whatever another process last saved.
+
+Usage:
+    python -m utils.job_index resume.txt [--top 10]
+    python -m utils.job_index --rebuild
+"""
+import argparse
+import os
+import tempfile
+import threading
+import zlib
+
+import numpy as np
+from scipy import sparse
+
+from config.database import (
+    get_job_skills, get_jobs_with_skills, get_scraped_job_versions, get_scraped_jobs,
+    get_scraped_jobs_signature, init_database, save_scraped_jobs
+)
+from config.skills import get_skill_matcher
+from utils.semantic_scorer import extract_terms
+
+INDEX_DIR = os.getenv('JOB_INDEX_DIR', 'job_index')
+INDEX_FILE = 'job_index.npz'
+
+# Hashed feature space; collisions are negligible at this size
+N_FEATURES = 2 ** 18
+
+# Jobs fetched from the database per query while syncing
+SYNC_BATCH_SIZE = 500
+
+
+def hash_terms(text):
+    """Sublinear term frequencies of a text as (columns, weights) arrays"""
+    counts = {}
+    for term, count in extract_terms(text).items():
+        column = zlib.crc32(term.encode('utf-8')) % N_FEATURES
+        counts[column] = counts.get(column, 0) + count
+    columns = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    weights = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    return columns, weights
+
+
+class JobIndex:
+    """Term-frequency matrix of job descriptions, one row per job id"""
+
+    def __init__(self, matrix=None, job_ids=None, versions=None):
+        if matrix is None:
+            matrix = sparse.csr_matrix((0, N_FEATURES), dtype=np.float32)
+        self.matrix = matrix.tocsr()
+        self.job_ids = np.asarray(job_ids if job_ids is not None else [], dtype=np.int64)
+        # scraped_at of each job when it was indexed
+        self.versions = np.asarray(versions if versions is not None else [''] * len(self.job_ids), dtype=str)
+        self.document_frequency = np.bincount(self.matrix.indices, minlength=N_FEATURES)
+        self._weighted = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    @classmethod
+    def load(cls, index_dir=INDEX_DIR):
+        with np.load(os.path.join(index_dir, INDEX_FILE)) as saved:
+            job_ids, versions, indptr = saved['job_ids'], saved['versions'], saved['indptr']
+            if len(indptr) != len(job_ids) + 1 or len(versions) != len(job_ids):
+                raise ValueError(f"Job index in {index_dir} is inconsistent, rebuild it")
+            matrix = sparse.csr_matrix(
+                (saved['data'], saved['indices'], indptr), shape=(len(job_ids), N_FEATURES)
+            )
+        return cls(matrix, job_ids, versions)
+
+    def save(self, index_dir=INDEX_DIR):
+        """Write the matrix, job ids and versions to one file, replacing any previous index atomically"""
+        os.makedirs(index_dir, exist_ok=True)
+        with self._lock:
+            matrix, job_ids, versions = self.matrix, self.job_ids, self.versions
+        # A unique temporary name, so concurrent saves never write the same file
+        fd, tmp_path = tempfile.mkstemp(prefix=INDEX_FILE + '.', suffix='.tmp', dir=index_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                         job_ids=job_ids, versions=versions)
+            os.replace(tmp_path, os.path.join(index_dir, INDEX_FILE))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def add(self, jobs):
+        """Index (job_id, description, scraped_at) triples; a job already in the index is replaced"""
+        jobs = list(jobs)
+        if not jobs:
+            return
+        indptr, indices, data = [0], [], []
+        for _, text, _ in jobs:
+            columns, weights = hash_terms(text)
+            indices.append(columns)
+            data.append(weights)
+            indptr.append(indptr[-1] + len(columns))
+        rows = sparse.csr_matrix(
+            (np.concatenate(data), np.concatenate(indices), np.array(indptr)),
+            shape=(len(jobs), N_FEATURES), dtype=np.float32
+        )
+        rows.sum_duplicates()
+        new_ids = np.array([job_id for job_id, _, _ in jobs], dtype=np.int64)
+        new_versions = np.array([version or '' for _, _, version in jobs], dtype=str)
+
+        with self._lock:
+            keep = ~np.isin(self.job_ids, new_ids)
+            self._keep_rows(keep)
+            self.matrix = sparse.vstack([self.matrix, rows], format='csr')
+            self.job_ids = np.concatenate([self.job_ids, new_ids])
+            self.versions = np.concatenate([self.versions, new_versions])
+            self.document_frequency = np.bincount(self.matrix.indices, minlength=N_FEATURES)
+            self._weighted = None
+
+    def remove(self, job_ids):
+        """Drop jobs from the index"""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self._lock:
+            self._keep_rows(~np.isin(self.job_ids, job_ids))
+            self.document_frequency = np.bincount(self.matrix.indices, minlength=N_FEATURES)
+            self._weighted = None
+
+    def _keep_rows(self, keep):
+        if not keep.all():
+            self.matrix = self.matrix[keep]
+            self.job_ids = self.job_ids[keep]
+            self.versions = self.versions[keep]
+
+    def diff(self, versions):
+        """(job ids to index or re-index, job ids to drop) to match a {job_id: scraped_at} mapping"""
+        with self._lock:
+            indexed = dict(zip(self.job_ids.tolist(), self.versions.tolist()))
+        stale = [job_id for job_id, version in versions.items() if indexed.get(job_id) != (version or '')]
+        gone = [job_id for job_id in indexed if job_id not in versions]
+        return stale, gone
+
+    def _idf_weighted(self):
+        """(TF-IDF matrix with unit-length rows, idf, job ids), cached until the next add"""
+        with self._lock:
+            if self._weighted is None:
+                count = len(self.job_ids)
+                # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+                idf = (np.log((1 + count) / (1 + self.document_frequency)) + 1.0).astype(np.float32)
+                weighted = self.matrix @ sparse.diags(idf)
+                norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+                norms[norms == 0] = 1.0
+                weighted = sparse.diags(1.0 / norms) @ weighted
+                self._weighted = (weighted.tocsr().astype(np.float32), idf, self.job_ids)
+            return self._weighted
+
+    def rank(self, text, top_n=10, job_ids=None):
+        """(job_id, cosine similarity) of the jobs closest to a text, best first
+
+        ``job_ids`` restricts the ranking to those jobs, e.g. candidates from
+        the skill inverted index.
+        """
+        if not len(self.job_ids):
+            return []
+        weighted, idf, indexed_ids = self._idf_weighted()
+        columns, weights = hash_terms(text)
+        query = np.zeros(N_FEATURES, dtype=np.float32)
+        np.add.at(query, columns, weights)
+        query *= idf
+        norm = np.linalg.norm(query)
+        if not norm:
+            return []
+        similarities = weighted @ (query / norm)
+
+        candidates = np.arange(len(indexed_ids))
+        if job_ids is not None:
+            candidates = candidates[np.isin(indexed_ids, list(job_ids))]
+        top_n = min(top_n, len(candidates))
+        if not top_n:
+            return []
+        best = candidates[np.argpartition(-similarities[candidates], top_n - 1)[:top_n]]
+        best = best[np.argsort(-similarities[best], kind='stable')]
+        return [(int(indexed_ids[i]), float(similarities[i])) for i in best]
+
+
+_index = None
+_index_signature = None
+_index_lock = threading.Lock()
+
+
+def sync(index):
+    """Bring an index in line with scraped_jobs; returns True if anything changed"""
+    stale, gone = index.diff(get_scraped_job_versions())
+    index.remove(gone)
+    for start in range(0, len(stale), SYNC_BATCH_SIZE):
+        jobs = get_scraped_jobs(stale[start:start + SYNC_BATCH_SIZE])
+        index.add((job['id'], job['description'], job['scraped_at']) for job in jobs)
+    return bool(stale or gone)
+
+
+def _save(index, index_dir):
+    try:
+        index.save(index_dir)
+    except OSError as e:
+        # The next load syncs from the database again
+        print(f"Could not save job index to {index_dir}: {e}")
+
+
+def load_or_build(index_dir=INDEX_DIR):
+    """Saved index synced with scraped_jobs, or one rebuilt from it"""
+    try:
+        index = JobIndex.load(index_dir)
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Rebuilding job index: {e}")
+        index = JobIndex()
+    if sync(index):
+        _save(index, index_dir)
+    return index
+
+
+def get_job_index():
+    """Process-wide JobIndex, loaded on first use and synced whenever scraped_jobs changes"""
+    global _index, _index_signature
+    signature = get_scraped_jobs_signature()
+    if _index is None or signature != _index_signature:
+        with _index_lock:
+            if _index is None:
+                _index = load_or_build()
+            elif signature != _index_signature and sync(_index):
+                _save(_index, INDEX_DIR)
+            _index_signature = signature
+    return _index
+
+
+def index_jobs(jobs):
+    """Store scraped jobs with their skills and add them to the index
+
+    ``jobs`` are dicts with url, title, company, location and description.
+    Returns the stored job ids in order.
+    """
+    matcher = get_skill_matcher()
+    jobs = [dict(job, skills=matcher.find(job['description'])) for job in jobs]
+    job_ids = save_scraped_jobs(jobs)
+    # Syncing picks up the jobs just stored, including re-scraped ones
+    get_job_index()
+    return job_ids
+
+
+def rank_jobs_for_resume(resume_text, top_n=10, skills_only=False):
+    """Indexed jobs ranked by similarity to a resume, best first
+
+    Each result has the job's details, ``similarity`` (0-100) and the job's
+    skills split into ``matched_skills`` and ``missing_skills`` for this
+    resume. With ``skills_only``, jobs sharing no skill with the resume are
+    left out.
+    """
+    resume_skills = set(get_skill_matcher().find(resume_text))
+    candidates = get_jobs_with_skills(resume_skills) if skills_only else None
+    if candidates is not None and not candidates:
+        return []
+    ranked = get_job_index().rank(resume_text, top_n, candidates)
+    if not ranked:
+        return []
+    job_ids = [job_id for job_id, _ in ranked]
+    jobs = {job['id']: job for job in get_scraped_jobs(job_ids)}
+    job_skills = get_job_skills(job_ids)
+
+    results = []
+    for job_id, similarity in ranked:
+        job = jobs.get(job_id)
+        if job is None:
+            continue
+        skills = job_skills.get(job_id, set())
+        results.append({
+            **job,
+            'similarity': round(similarity * 100, 1),
+            'matched_skills': sorted(skills & resume_skills),
+            'missing_skills': sorted(skills - resume_skills),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank scraped jobs for a resume")
+    parser.add_argument('resume', nargs='?', help="Plain-text resume to rank jobs for")
+    parser.add_argument('--top', type=int, default=10, help="Number of jobs to show")
+    parser.add_argument('--skills-only', action='store_true', help="Only jobs sharing a skill with the resume")
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild the index from the database")
+    args = parser.parse_args()
+
+    init_database()
+    if args.rebuild:
+        index = JobIndex()
+        sync(index)
+        index.save()
+        print(f"Indexed {len(index)} jobs in {INDEX_DIR}")
+        return
+    if not args.resume:
+        parser.error("a resume file is required unless --rebuild is given")
+
+    with open(args.resume, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    for rank, job in enumerate(rank_jobs_for_resume(text, args.top, args.skills_only), 1):
+        print(f"{rank:>2}. {job['similarity']:5.1f}  {job['title']} at {job['company']} ({job['location']})")
+        if job['missing_skills']:
+            print(f"           missing: {', '.join(job['missing_skills'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Extraction and analysis pipeline shared by the headless entry points
+
+batch_analyze.py and api_server.py run these functions in worker processes.
+Each process keeps one warm analyzer instance per kind, and text already
+extracted from the same file (by content hash) is reused from the database.
+"""
+import io
+import time
+
+from config.database import hash_bytes, get_document_text
+from config.job_roles import JOB_ROLES
+from config.tracing import span, traced
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+_analyzers = {}
+
+
+def get_analyzer(kind='standard'):
+    """Get this process's analyzer instance ('standard' or 'ai'), creating it once"""
+    if kind not in _analyzers:
+        if kind == 'ai':
+            from utils.ai_resume_analyzer import AIResumeAnalyzer
+            _analyzers[kind] = AIResumeAnalyzer()
+        else:
+            from utils.resume_analyzer import ResumeAnalyzer
+            _analyzers[kind] = ResumeAnalyzer()
+    return _analyzers[kind]
+
+
+def warm_worker(*kinds):
+    """Process pool initializer: load analyzers before the first request arrives"""
+    for kind in kinds or ('standard',):
+        get_analyzer(kind)
+
+
+def find_role(role, category=None):
+    """Return (category, requirements) for a role name, or (None, None)"""
+    if category:
+        requirements = JOB_ROLES.get(category, {}).get(role)
+        return (category, requirements) if requirements else (None, None)
+    for category_name, roles in JOB_ROLES.items():
+        if role in roles:
+            return category_name, roles[role]
+    return None, None
+
+
+def extract_text(content, file_name, kind='standard', use_stored=True):
+    """Extract text from PDF/DOCX bytes, reusing stored text for a known file
+
+    ``use_stored=False`` skips the database lookup, e.g. for runs that must
+    not touch the database. Returns (text, content_hash, reused).
+    """
+    content_hash = hash_bytes(content)
+    if use_stored:
+        with span('db.document_lookup'):
+            text = get_document_text(content_hash)
+        if text is not None:
+            return text, content_hash, True
+
+    analyzer = get_analyzer(kind)
+    if file_name.lower().endswith('.pdf'):
+        text = analyzer.extract_text_from_pdf(content)
+    else:
+        text = analyzer.extract_text_from_docx(io.BytesIO(content))
+    return text, content_hash, False
+
+
+@traced('analyze_document')
+def analyze_document(content, file_name, requirements, semantic=False, use_stored=True):
+    """Extract and run the standard analysis on one document
+
+    Returns a result dict with per-stage timings in seconds. Errors are
+    reported in the result instead of raised so one bad file does not stop
+    a batch. ``semantic`` adds the semantic role match to the analysis;
+    ``use_stored`` is passed on to extract_text.
+    """
+    timings = {}
+    result = {'status': 'ok', 'error': None}
+    try:
+        start = time.perf_counter()
+        text, content_hash, reused = extract_text(content, file_name, use_stored=use_stored)
+        timings['extract'] = time.perf_counter() - start
+        result['content_hash'] = content_hash
+        result['text_reused'] = reused
+        if not reused:
+            result['text'] = text
+
+        if not text or not text.strip():
+            raise ValueError("Could not extract any text from the file")
+
+        start = time.perf_counter()
+        analysis = get_analyzer().analyze_resume({'raw_text': text}, requirements, semantic=semantic)
+        timings['analyze'] = time.perf_counter() - start
+        if 'error' in analysis:
+            raise ValueError(analysis['error'])
+        result['analysis'] = analysis
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+    result['timings'] = timings
+    return result
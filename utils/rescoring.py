@@ -0,0 +1,252 @@
+"""
+Bulk re-scoring of stored resumes
+
+Stored ats_score/keyword_match_score values go stale whenever
+config/job_roles.JOB_ROLES or config/skills.SKILL_TAXONOMY changes. This job
+re-runs ResumeAnalyzer over the stored text of every resume (see
+resume_documents) in a process pool and updates each resume's latest
+resume_analysis row in batched transactions. Resumes with no stored text or
+an unknown role keep their scores and are counted as skipped.
+
+Progress is checkpointed per JOB_ROLES fingerprint in the same transaction
+as each batch, so an interrupted run resumes where it stopped and a finished
+run is not repeated until the roles change again.
+
+Usage:
+    python -m utils.rescoring [--workers N] [--batch-size N] [--restart]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from config.database import get_database_connection, init_database
+from config.job_roles import JOB_ROLES
+from config.skills import get_roles_fingerprint
+
+DEFAULT_BATCH_SIZE = 200
+
+_analyzer = None
+
+
+def find_role_requirements(category, role, job_roles=None):
+    """Look up a role by category, falling back to a search across categories"""
+    job_roles = job_roles or JOB_ROLES
+    if role in job_roles.get(category, {}):
+        return job_roles[category][role]
+    for roles in job_roles.values():
+        if role in roles:
+            return roles[role]
+    return None
+
+
+def _init_worker():
+    global _analyzer
+    from utils.resume_analyzer import ResumeAnalyzer
+    _analyzer = ResumeAnalyzer()
+
+
+def _score_resume(task):
+    """Score one stored resume text in a worker process"""
+    resume_id, text_blob, requirements = task
+    try:
+        text = zlib.decompress(text_blob).decode('utf-8')
+        analysis = _analyzer.analyze_resume({'raw_text': text}, requirements)
+        if 'error' in analysis:
+            return resume_id, None
+        keyword_match = analysis.get('keyword_match', {})
+        return resume_id, (
+            float(analysis.get('ats_score', 0)),
+            float(keyword_match.get('score', 0)),
+            float(analysis.get('format_score', 0)),
+            float(analysis.get('section_score', 0)),
+            json.dumps(keyword_match.get('missing_skills', [])),
+            json.dumps(analysis.get('suggestions', []))
+        )
+    except Exception as e:
+        print(f"Error re-scoring resume {resume_id}: {e}")
+        return resume_id, None
+
+
+def get_checkpoint(cursor, roles_hash):
+    cursor.execute("""
+        SELECT last_resume_id, processed, skipped, failed, completed_at
+        FROM rescore_checkpoints WHERE roles_hash = ?
+    """, (roles_hash,))
+    row = cursor.fetchone()
+    if not row:
+        return {'last_resume_id': 0, 'processed': 0, 'skipped': 0, 'failed': 0, 'completed_at': None}
+    return dict(zip(('last_resume_id', 'processed', 'skipped', 'failed', 'completed_at'), row))
+
+
+def save_checkpoint(cursor, roles_hash, checkpoint, completed=False):
+    cursor.execute("""
+        INSERT INTO rescore_checkpoints (
+            roles_hash, last_resume_id, processed, skipped, failed, completed_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, CASE WHEN ? THEN CURRENT_TIMESTAMP END, CURRENT_TIMESTAMP)
+        ON CONFLICT (roles_hash) DO UPDATE SET
+            last_resume_id = excluded.last_resume_id,
+            processed = excluded.processed,
+            skipped = excluded.skipped,
+            failed = excluded.failed,
+            completed_at = excluded.completed_at,
+            updated_at = excluded.updated_at
+    """, (
+        roles_hash,
+        checkpoint['last_resume_id'],
+        checkpoint['processed'],
+        checkpoint['skipped'],
+        checkpoint['failed'],
+        completed
+    ))
+
+
+def is_rescore_needed(conn=None):
+    """True if scores were not yet recomputed for the current JOB_ROLES
+
+    Read-only: init_database records the baseline roles that stored scores
+    were computed against (see config.database.record_rescore_baseline).
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT completed_at FROM rescore_checkpoints WHERE roles_hash = ?",
+            (get_roles_fingerprint(),)
+        )
+        row = cursor.fetchone()
+        if row and row[0] is not None:
+            return False
+        cursor.execute("SELECT 1 FROM rescore_checkpoints LIMIT 1")
+        return cursor.fetchone() is not None
+    except sqlite3.OperationalError:
+        # Database not initialised yet, so there are no stale scores
+        return False
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def write_scores(cursor, scores):
+    """Update each resume's latest analysis row, inserting one if it has none"""
+    for resume_id, values in scores:
+        cursor.execute("""
+            UPDATE resume_analysis SET
+                ats_score = ?, keyword_match_score = ?, format_score = ?,
+                section_score = ?, missing_skills = ?, recommendations = ?
+            WHERE id = (SELECT MAX(id) FROM resume_analysis WHERE resume_id = ?)
+        """, values + (resume_id,))
+        if cursor.rowcount == 0:
+            cursor.execute("""
+                INSERT INTO resume_analysis (
+                    ats_score, keyword_match_score, format_score,
+                    section_score, missing_skills, recommendations, resume_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, values + (resume_id,))
+
+
+def fetch_batch(cursor, after_id, batch_size):
+    """Next batch of resumes with their stored document text, None where there is none"""
+    cursor.execute("""
+        SELECT r.id, r.target_category, r.target_role, d.text_blob
+        FROM resume_data r
+        LEFT JOIN resume_documents d ON d.content_hash = r.document_hash
+        WHERE r.id > ?
+        ORDER BY r.id
+        LIMIT ?
+    """, (after_id, batch_size))
+    return cursor.fetchall()
+
+
+def rescore_all(workers=None, batch_size=DEFAULT_BATCH_SIZE, restart=False, progress=print):
+    """Re-score every stored resume against the current JOB_ROLES
+
+    Returns the final checkpoint with throughput added.
+    """
+    init_database()
+    roles_hash = get_roles_fingerprint()
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    checkpoint = get_checkpoint(cursor, roles_hash)
+
+    if checkpoint['completed_at'] and not restart:
+        progress(f"Scores are already current for roles {roles_hash} ({checkpoint['processed']} resumes)")
+        return checkpoint
+    if restart:
+        checkpoint = {'last_resume_id': 0, 'processed': 0, 'skipped': 0, 'failed': 0, 'completed_at': None}
+    elif checkpoint['last_resume_id']:
+        progress(f"Resuming after resume #{checkpoint['last_resume_id']}")
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    scored_this_run = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            while True:
+                rows = fetch_batch(cursor, checkpoint['last_resume_id'], batch_size)
+                if not rows:
+                    break
+
+                tasks = []
+                for resume_id, category, role, text_blob in rows:
+                    requirements = find_role_requirements(category, role)
+                    if text_blob is None or requirements is None:
+                        # Nothing to re-score from; the stored score is left as it is
+                        checkpoint['skipped'] += 1
+                    else:
+                        tasks.append((resume_id, text_blob, requirements))
+
+                chunksize = max(1, len(tasks) // (workers * 4))
+                results = list(pool.map(_score_resume, tasks, chunksize=chunksize))
+                scores = [(resume_id, values) for resume_id, values in results if values]
+
+                # Scores and checkpoint commit together, so a crash never skips or repeats work
+                write_scores(cursor, scores)
+                checkpoint['processed'] += len(scores)
+                checkpoint['failed'] += len(results) - len(scores)
+                checkpoint['last_resume_id'] = rows[-1][0]
+                save_checkpoint(cursor, roles_hash, checkpoint)
+                conn.commit()
+
+                scored_this_run += len(scores)
+                elapsed = time.perf_counter() - start
+                progress(
+                    f"Re-scored {checkpoint['processed']} resumes "
+                    f"(up to #{checkpoint['last_resume_id']}, {scored_this_run / elapsed:.1f} resumes/sec)"
+                )
+
+        save_checkpoint(cursor, roles_hash, checkpoint, completed=True)
+        conn.commit()
+        checkpoint = get_checkpoint(cursor, roles_hash)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - start
+    checkpoint['elapsed_seconds'] = round(elapsed, 2)
+    checkpoint['resumes_per_second'] = round(scored_this_run / elapsed, 2) if elapsed else 0
+    progress(
+        f"Done: {checkpoint['processed']} re-scored, "
+        f"{checkpoint['skipped']} skipped (no stored text or unknown role), "
+        f"{checkpoint['failed']} failed, {checkpoint['resumes_per_second']} resumes/sec"
+    )
+    return checkpoint
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score stored resumes against the current job roles")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Resumes per transaction and checkpoint")
+    parser.add_argument('--restart', action='store_true', help="Ignore the checkpoint and start over")
+    args = parser.parse_args()
+    rescore_all(args.workers, args.batch_size, args.restart)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import re
 
+from config.skills import get_skill_matcher
+from config.tracing import span, traced
+
 class ResumeAnalyzer:
     def __init__(self):
         # Document type indicators
@@ -40,20 +43,9 @@ class ResumeAnalyzer:
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
     def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
-        found_skills = []
-        missing_skills = []
-        
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
-                found_skills.append(skill)
-            else:
-                missing_skills.append(skill)
+        # Whole-phrase matching through the shared taxonomy, so aliases count
+        # ("k8s" for Kubernetes) and "Java" is not found inside "JavaScript"
+        found_skills, missing_skills = get_skill_matcher().match(resume_text, required_skills)
                 
         match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
         
@@ -132,13 +124,15 @@ class ResumeAnalyzer:
                 # If it's already bytes
                 file_content = file
                 
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+            with span('extract.pypdf2', bytes=len(file_content)) as current:
+                # Create BytesIO from bytes content
+                pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+                
+                # Extract text from all pages
+                text = ""
+                for page in pdf_reader.pages:
+                    text += page.extract_text() + "\n"
+                current.set(pages=len(pdf_reader.pages))
                 
             return text
         except Exception as e:
@@ -148,10 +142,11 @@ class ResumeAnalyzer:
         """Extract text from a DOCX file"""
         try:
             from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
+            with span('extract.docx'):
+                doc = Document(docx_file)
+                full_text = []
+                for paragraph in doc.paragraphs:
+                    full_text.append(paragraph.text)
             return '\n'.join(full_text)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
@@ -442,16 +437,24 @@ class ResumeAnalyzer:
         
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
+    @traced('analyze_resume')
+    def analyze_resume(self, resume_data, job_requirements, semantic=False):
+        """Analyze resume and return scores and recommendations
+        
+        With ``semantic``, the result also has a ``semantic_match`` entry with
+        the TF-IDF similarity to the target role and the closest roles overall
+        (see utils/semantic_scorer.py).
+        """
         try:
             text = resume_data.get('raw_text', '')
             
             # Extract personal information
-            personal_info = self.extract_personal_info(text)
+            with span('analyze.personal_info'):
+                personal_info = self.extract_personal_info(text)
             
             # First detect document type
-            doc_type = self.detect_document_type(text)
+            with span('analyze.document_type'):
+                doc_type = self.detect_document_type(text)
             if doc_type != 'resume':
                 return {
                     'ats_score': 0,
@@ -464,20 +467,28 @@ class ResumeAnalyzer:
                 
             # Calculate keyword match
             required_skills = job_requirements.get('required_skills', [])
-            keyword_match = self.calculate_keyword_match(text, required_skills)
+            with span('analyze.keyword_match'):
+                keyword_match = self.calculate_keyword_match(text, required_skills)
             
             # Extract all resume sections
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            projects = self.extract_projects(text)
-            skills = list(self.extract_skills(text))  # Convert skills set to list
-            summary = self.extract_summary(text)
+            with span('analyze.education'):
+                education = self.extract_education(text)
+            with span('analyze.experience'):
+                experience = self.extract_experience(text)
+            with span('analyze.projects'):
+                projects = self.extract_projects(text)
+            with span('analyze.skills'):
+                skills = list(self.extract_skills(text))  # Convert skills set to list
+            with span('analyze.summary'):
+                summary = self.extract_summary(text)
             
             # Check resume sections
-            section_score = self.check_resume_sections(text)
+            with span('analyze.section_check'):
+                section_score = self.check_resume_sections(text)
             
             # Check formatting
-            format_score, format_deductions = self.check_formatting(text)
+            with span('analyze.formatting'):
+                format_score, format_deductions = self.check_formatting(text)
             
             # Generate section-specific suggestions
             contact_suggestions = []
@@ -570,8 +581,7 @@ class ResumeAnalyzer:
             if not suggestions:
                 suggestions.append("Your resume is well-optimized for ATS systems")
             
-            # Return final structured result
-            return {
+            result = {
                 **personal_info,  # Include extracted personal info
                 'ats_score': ats_score,
                 'document_type': 'resume',
@@ -599,6 +609,18 @@ class ResumeAnalyzer:
                     'format': format_score
                 }
             }
+            
+            if semantic:
+                try:
+                    from utils.semantic_scorer import get_semantic_scorer
+                    with span('analyze.semantic'):
+                        result['semantic_match'] = get_semantic_scorer().match(text, job_requirements)
+                except Exception as e:
+                    # The semantic match is optional; keep the rest of the analysis
+                    print(f"Error computing semantic match: {str(e)}")
+            
+            # Return final structured result
+            return result
         except Exception as e:
             import traceback
             print(f"Error analyzing resume: {str(e)}")
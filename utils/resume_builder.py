@@ -9,6 +9,8 @@ from io import BytesIO
 import tempfile
 import traceback
 
+from config.tracing import traced
+
 class ResumeBuilder:
     def __init__(self):
         self.templates = {
@@ -18,6 +20,7 @@ class ResumeBuilder:
             "Creative": self.build_creative_template
         }
         
+    @traced('report.docx')
     def generate_resume(self, data):
         """Generate a resume based on the provided data and template"""
         try:
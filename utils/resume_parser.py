@@ -3,10 +3,14 @@ import docx
 import re
 from io import BytesIO
 
+from config.skills import get_skill_matcher
+from config.tracing import traced
+
 class ResumeParser:
     def __init__(self):
         pass
         
+    @traced('extract.parser.pypdf')
     def extract_text_from_pdf(self, pdf_file):
         try:
             # Handle different file input types
@@ -32,6 +36,7 @@ class ResumeParser:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
+    @traced('extract.parser.docx')
     def extract_text_from_docx(self, docx_file):
         try:
             doc = docx.Document(BytesIO(docx_file.read()))
@@ -54,24 +59,16 @@ class ResumeParser:
         else:
             return ""
             
+    @traced('resume_parser.parse')
     def parse(self, file):
         text = self.extract_text(file)
         
         # Simple keyword-based parsing
-        skills = []
         experience = []
         education = []
         
-        # Common programming languages and tools
-        skill_keywords = ['python', 'java', 'javascript', 'html', 'css', 'sql', 'react', 'angular', 'vue', 
-                         'node', 'express', 'django', 'flask', 'spring', 'docker', 'kubernetes', 'aws', 
-                         'azure', 'git', 'jenkins', 'jira']
-                         
-        # Look for skills
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill in text_lower:
-                skills.append(skill)
+        # Look for skills from the shared taxonomy
+        skills = get_skill_matcher().find(text)
                 
         return {
             "skills": skills,
@@ -0,0 +1,281 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive inter-process lock on ``path`` for the duration of the block"""
+    with open(path, 'a+b') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ResumeStore:
+    """Append-only resume storage in JSON Lines segments
+
+    Every save appends one line to the active segment, so inserts cost the
+    same no matter how many resumes are stored. Each record has a
+    ``record_id``; appending a record with an existing id supersedes the
+    earlier version, and delete() appends a tombstone. Segments roll over once
+    they reach ``max_segment_bytes``; when enough sealed segments pile up they
+    are compacted into one, dropping superseded records and tombstones. A
+    user_id index of (segment, offset) pairs is kept in an append-only index
+    log so per-user reads seek straight to their records.
+    """
+
+    INDEX_FILE = 'index.jsonl'
+    LOCK_FILE = '.lock'
+    # Key marking a tombstone line
+    DELETED = '_deleted'
+
+    def __init__(self, base_dir='resume_store', max_segment_bytes=8 * 1024 * 1024,
+                 compact_after_segments=8):
+        self.base_dir = base_dir
+        self.max_segment_bytes = max_segment_bytes
+        self.compact_after_segments = compact_after_segments
+        self._lock = threading.Lock()
+        self._index = None
+        self._latest = None
+        self._index_size = 0
+        self._index_inode = None
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Paths and segments
+    # ------------------------------------------------------------------
+    def _path(self, name):
+        return os.path.join(self.base_dir, name)
+
+    def _segments(self):
+        """Segment file names in write order"""
+        return sorted(
+            name for name in os.listdir(self.base_dir)
+            if name.startswith('segment-') and name.endswith('.jsonl')
+        )
+
+    def _active_segment(self):
+        segments = self._segments()
+        if not segments:
+            return 'segment-000001.jsonl'
+        active = segments[-1]
+        if os.path.getsize(self._path(active)) >= self.max_segment_bytes:
+            number = int(active[len('segment-'):-len('.jsonl')]) + 1
+            return f'segment-{number:06d}.jsonl'
+        return active
+
+    def _scan(self, segments=None):
+        """(segment, offset, record) for every complete line, in write order"""
+        for segment in self._segments() if segments is None else segments:
+            with open(self._path(segment), 'rb') as f:
+                offset = 0
+                for line in f:
+                    if line.endswith(b'\n') and line.strip():
+                        yield segment, offset, json.loads(line)
+                    offset += len(line)
+
+    def _latest_events(self):
+        """record_id -> (segment, offset, deleted) of the last write to each record"""
+        latest = {}
+        for segment, offset, record in self._scan():
+            latest[record['record_id']] = (segment, offset, bool(record.get(self.DELETED)))
+        return latest
+
+    def _is_current(self, latest, segment, offset, record):
+        """Whether a line is a live record: not a tombstone, superseded or deleted"""
+        if record.get(self.DELETED):
+            return False
+        return latest.get(record['record_id']) == (segment, offset, False)
+
+    # ------------------------------------------------------------------
+    # user_id index
+    # ------------------------------------------------------------------
+    def _load_index(self):
+        """Load new index log entries written since the last load (possibly by another process)"""
+        path = self._path(self.INDEX_FILE)
+        if self._index is None:
+            self._index, self._latest, self._index_size = {}, {}, 0
+        if not os.path.exists(path):
+            return self._index
+        stat = os.stat(path)
+        size = stat.st_size
+        if stat.st_ino != self._index_inode or size < self._index_size:
+            # The log was rewritten by a compaction, possibly in another process
+            self._index, self._latest, self._index_size, self._index_inode = {}, {}, 0, stat.st_ino
+        if size > self._index_size:
+            with open(path, 'rb') as f:
+                f.seek(self._index_size)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Partially written entry; pick it up next time
+                    entry = json.loads(line)
+                    position = (entry['segment'], entry['offset'])
+                    if not entry.get('deleted'):
+                        self._index.setdefault(entry['user_id'], []).append(position)
+                    self._latest[entry['record_id']] = position + (bool(entry.get('deleted')),)
+                    self._index_size += len(line)
+        return self._index
+
+    def _rebuild_index(self):
+        """Rewrite the index log from the segments on disk"""
+        entries = [
+            self._index_entry(record, segment, offset)
+            for segment, offset, record in self._scan()
+        ]
+
+        tmp_path = self._path(self.INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        os.replace(tmp_path, self._path(self.INDEX_FILE))
+        self._index = None
+
+    def _index_entry(self, record, segment, offset):
+        entry = {'record_id': record['record_id'], 'segment': segment, 'offset': offset}
+        if record.get(self.DELETED):
+            entry['deleted'] = True
+        else:
+            entry['user_id'] = record.get('user_id')
+        return entry
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def append(self, record):
+        """Append a record and return True on success
+
+        A record without a ``record_id`` gets a new one; a record with the id
+        of an earlier one replaces it.
+        """
+        if record.get('record_id') is None:
+            record = dict(record, record_id=uuid.uuid4().hex)
+        self._write(record)
+        return True
+
+    def delete(self, record_id):
+        """Delete a record by appending a tombstone for its id"""
+        self._write({'record_id': record_id, self.DELETED: True})
+        return True
+
+    def _write(self, record):
+        line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+        with self._lock, _locked(self._path(self.LOCK_FILE)):
+            segment = self._active_segment()
+            path = self._path(segment)
+            with open(path, 'ab') as f:
+                offset = f.tell()
+                f.write(line)
+            with open(self._path(self.INDEX_FILE), 'ab') as f:
+                f.write((json.dumps(self._index_entry(record, segment, offset)) + '\n').encode('utf-8'))
+
+            if len(self._segments()) > self.compact_after_segments:
+                self._compact()
+
+    def iter_records(self):
+        """Iterate over all live records in insertion order"""
+        # Read everything under the lock so a compaction cannot remove or
+        # rewrite segments between working out the latest events and the scan
+        with self._lock, _locked(self._path(self.LOCK_FILE)):
+            latest = self._latest_events()
+            records = [
+                record for segment, offset, record in self._scan()
+                if self._is_current(latest, segment, offset, record)
+            ]
+        return iter(records)
+
+    def get_user_records(self, user_id):
+        """Get all records of one user through the user_id index"""
+        records = []
+        handles = {}
+        # Hold the lock so a compaction cannot move records between index load and reads
+        with self._lock, _locked(self._path(self.LOCK_FILE)):
+            try:
+                for segment, offset in self._load_index().get(user_id, []):
+                    if segment not in handles:
+                        handles[segment] = open(self._path(segment), 'rb')
+                    f = handles[segment]
+                    f.seek(offset)
+                    record = json.loads(f.readline())
+                    if self._is_current(self._latest, segment, offset, record):
+                        records.append(record)
+            finally:
+                for f in handles.values():
+                    f.close()
+        return records
+
+    def compact(self):
+        """Merge all sealed segments into one, dropping superseded and deleted records"""
+        with self._lock, _locked(self._path(self.LOCK_FILE)):
+            self._compact()
+
+    def _compact(self):
+        segments = self._segments()
+        sealed = segments[:-1]
+        if not sealed:
+            return
+
+        # Compacted data takes the first sealed segment's name so ordering is preserved.
+        # Tombstones only ever follow the records they delete, so once those
+        # records are dropped the tombstones in sealed segments are dropped too.
+        latest = self._latest_events()
+        target = sealed[0]
+        tmp_path = self._path(target + '.tmp')
+        with open(tmp_path, 'wb') as out:
+            for segment, offset, record in self._scan(sealed):
+                if self._is_current(latest, segment, offset, record):
+                    out.write((json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8'))
+        os.replace(tmp_path, self._path(target))
+        for segment in sealed[1:]:
+            os.remove(self._path(segment))
+        self._rebuild_index()
+
+    def _import_marker(self, name):
+        return self._path(f'imported-{name}.done')
+
+    def is_import_complete(self, name):
+        """Whether an import of ``name`` ran to completion"""
+        return os.path.exists(self._import_marker(name))
+
+    def mark_import_complete(self, name):
+        with open(self._import_marker(name), 'w', encoding='utf-8') as f:
+            f.write(time.strftime('%Y-%m-%d %H:%M:%S') + '\n')
+
+    def import_excel(self, excel_file):
+        """Import rows from a legacy resume_data.xlsx workbook
+
+        Rows get ids derived from the workbook name and row number, so rerunning
+        an interrupted import replaces the rows it already wrote instead of
+        duplicating them. The import is marked complete only once every row is in.
+        """
+        import pandas as pd
+
+        name = os.path.basename(excel_file)
+        df = pd.read_excel(excel_file)
+        for row_number, record in enumerate(df.where(pd.notnull(df), None).to_dict(orient='records')):
+            record.setdefault('record_id', None)
+            if record['record_id'] is None:
+                record['record_id'] = f'{name}:{row_number}'
+            self.append(record)
+        self.mark_import_complete(name)
+        return len(df)
+
@@ -0,0 +1,298 @@
+"""
+Semantic resume-to-role scoring
+
+Keyword matching only credits the exact skills a role lists. This scorer
+compares the whole resume with every role in JOB_ROLES instead: each role's
+name, description and required and recommended skills become a TF-IDF
+vector over words, word pairs and canonical skills from config.skills, so
+aliases ("k8s", "JS") and related wording in a resume still count.
+
+The L2-normalised role vectors are stored as one float32 matrix under
+SEMANTIC_INDEX_DIR, next to a metadata file naming it, and memory-mapped on
+load, so ranking a resume against every role is a single matrix-vector
+product. The index is rebuilt
+automatically when JOB_ROLES or the skill taxonomy change. Everything runs
+on the CPU with NumPy; no model download is needed.
+
+Usage:
+    python -m utils.semantic_scorer --build
+    python -m utils.semantic_scorer resume.txt [--top 5]
+"""
+import argparse
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import Counter
+
+import numpy as np
+
+from config.job_roles import JOB_ROLES
+from config.skills import get_roles_fingerprint, get_skill_matcher, tokenize
+
+INDEX_DIR = os.getenv('SEMANTIC_INDEX_DIR', 'semantic_index')
+# Each save writes a uniquely named role_vectors-*.npy recorded in META_FILE
+MATRIX_PREFIX = 'role_vectors-'
+META_FILE = 'role_index.json'
+
+# Canonical skills are worth more than any single word of the description
+SKILL_WEIGHT = 2
+TOP_ROLES = 3
+
+STOP_WORDS = frozenset("""
+    a an and are as at be been but by for from has have in into is it its of on or our
+    that the their this to was we were will with you your i my me he she they them his her
+    also etc using use used work worked working including such other various across within
+""".split())
+
+
+def extract_terms(text):
+    """TF-IDF terms of a text: words, adjacent word pairs and ``skill:`` features"""
+    words = [
+        token for token in (t.lower() for t in tokenize(text))
+        if token[0].isalnum() and len(token) > 1 and token not in STOP_WORDS
+    ]
+    terms = Counter(words)
+    terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    for skill in get_skill_matcher().find(text):
+        terms[f"skill:{skill.lower()}"] += SKILL_WEIGHT
+    return terms
+
+
+def role_document(requirements, role=None):
+    """Text representing a role: its name, description and skills"""
+    recommended = requirements.get('recommended_skills', {})
+    parts = [
+        role or '',
+        requirements.get('description', ''),
+        ', '.join(requirements.get('required_skills', [])),
+        ', '.join(recommended.get('technical', [])),
+        ', '.join(recommended.get('soft', [])),
+    ]
+    return '\n'.join(part for part in parts if part)
+
+
+def _weights(terms):
+    # Sublinear term frequency, so repeating a word has diminishing returns
+    return {term: 1.0 + math.log(count) for term, count in terms.items()}
+
+
+class SemanticScorer:
+    """Role vectors plus the vocabulary and IDF weights to project a resume onto them"""
+
+    def __init__(self, matrix, roles, vocabulary, idf, fingerprint=None):
+        self.matrix = matrix
+        self.roles = [tuple(role) for role in roles]
+        self.vocabulary = vocabulary
+        self.columns = {term: i for i, term in enumerate(vocabulary)}
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.fingerprint = fingerprint
+        self._role_rows = {role: i for i, role in enumerate(self.roles)}
+
+    @classmethod
+    def build(cls, job_roles=None):
+        """Fit IDF weights and role vectors on the role documents"""
+        job_roles = job_roles or JOB_ROLES
+        roles, documents = [], []
+        for category, category_roles in job_roles.items():
+            for role, requirements in category_roles.items():
+                roles.append((category, role))
+                documents.append(_weights(extract_terms(role_document(requirements, role))))
+
+        document_frequency = Counter(term for weights in documents for term in weights)
+        vocabulary = sorted(document_frequency)
+        columns = {term: i for i, term in enumerate(vocabulary)}
+        count = len(documents)
+        # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+        idf = np.array(
+            [math.log((1 + count) / (1 + document_frequency[term])) + 1.0 for term in vocabulary],
+            dtype=np.float32
+        )
+
+        matrix = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        for row, weights in enumerate(documents):
+            for term, weight in weights.items():
+                matrix[row, columns[term]] = weight
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1.0, norms)
+        return cls(matrix, roles, vocabulary, idf, get_roles_fingerprint(job_roles))
+
+    def save(self, index_dir=INDEX_DIR):
+        """Write the index, replacing any previous one atomically
+
+        The matrix goes to a new uniquely named file and the metadata naming
+        it replaces the old metadata in one step, so concurrent saves never
+        share files and readers see either the old or the new index.
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        meta_path = os.path.join(index_dir, META_FILE)
+        fd, matrix_path = tempfile.mkstemp(prefix=MATRIX_PREFIX, suffix='.npy', dir=index_dir)
+        meta_tmp = None
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(self.matrix))
+            fd, meta_tmp = tempfile.mkstemp(prefix=META_FILE + '.', suffix='.tmp', dir=index_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'fingerprint': self.fingerprint,
+                    'matrix_file': os.path.basename(matrix_path),
+                    'roles': self.roles,
+                    'vocabulary': self.vocabulary,
+                    'idf': self.idf.tolist(),
+                }, f)
+            os.replace(meta_tmp, meta_path)
+        except BaseException:
+            for path in (matrix_path, meta_tmp):
+                if path and os.path.exists(path):
+                    os.remove(path)
+            raise
+        _remove_unused_matrices(index_dir)
+
+    @classmethod
+    def load(cls, index_dir=INDEX_DIR):
+        """Open a saved index; the role matrix is memory-mapped, not read into memory"""
+        with open(os.path.join(index_dir, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        matrix = np.load(os.path.join(index_dir, meta['matrix_file']), mmap_mode='r')
+        if matrix.shape != (len(meta['roles']), len(meta['vocabulary'])):
+            raise ValueError(f"Semantic index in {index_dir} is inconsistent, rebuild it")
+        return cls(matrix, meta['roles'], meta['vocabulary'], meta['idf'], meta.get('fingerprint'))
+
+    def vectorize(self, text):
+        """Unit-length TF-IDF vector of a text in the role vocabulary"""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, weight in _weights(extract_terms(text)).items():
+            column = self.columns.get(term)
+            if column is not None:
+                vector[column] = weight
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def score(self, text):
+        """Cosine similarity of a text to every role, in ``self.roles`` order"""
+        return self.matrix @ self.vectorize(text)
+
+    def rank(self, text, top_n=5, similarities=None):
+        """Best matching roles for a text, most similar first"""
+        if similarities is None:
+            similarities = self.score(text)
+        top_n = min(top_n, len(self.roles))
+        order = np.argsort(-similarities, kind='stable')[:top_n]
+        return [
+            {
+                'category': self.roles[i][0],
+                'role': self.roles[i][1],
+                'similarity': round(float(similarities[i]) * 100, 1),
+            }
+            for i in order
+        ]
+
+    def match(self, text, requirements, top_n=TOP_ROLES, category=None, role=None):
+        """Similarity of a resume to one role, plus the roles it is closest to
+
+        The target role is found in the index by name or by its requirements;
+        requirements that are not in JOB_ROLES (e.g. edited ones) are
+        vectorized on the fly.
+        """
+        vector = self.vectorize(text)
+        similarities = self.matrix @ vector
+        row = self._role_rows.get((category, role)) if category and role else None
+        if row is None:
+            row = self._find_role(requirements)
+        if row is not None:
+            similarity = float(similarities[row])
+        else:
+            similarity = float(self.vectorize(role_document(requirements, role)) @ vector)
+        return {
+            'score': round(similarity * 100, 1),
+            'top_roles': self.rank(text, top_n, similarities),
+        }
+
+    def _find_role(self, requirements):
+        for row, (category, role) in enumerate(self.roles):
+            if JOB_ROLES.get(category, {}).get(role) == requirements:
+                return row
+        return None
+
+
+def _remove_unused_matrices(index_dir):
+    """Delete matrix files the current metadata does not name
+
+    This includes the files of saves that lost a race with a concurrent
+    one. A save still in flight whose matrix is removed leaves an index that
+    fails to load, and load_or_build rebuilds it.
+    """
+    try:
+        with open(os.path.join(index_dir, META_FILE), encoding='utf-8') as f:
+            current = json.load(f)['matrix_file']
+    except (OSError, ValueError, KeyError):
+        return
+    for name in os.listdir(index_dir):
+        if name.startswith(MATRIX_PREFIX) and name.endswith('.npy') and name != current:
+            try:
+                os.remove(os.path.join(index_dir, name))
+            except OSError:
+                pass  # Already gone, or still mapped by a reader on Windows
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def load_or_build(index_dir=INDEX_DIR):
+    """Saved index if it matches the current roles, otherwise a freshly built (and saved) one"""
+    fingerprint = get_roles_fingerprint()
+    try:
+        scorer = SemanticScorer.load(index_dir)
+        if scorer.fingerprint == fingerprint:
+            return scorer
+    except (OSError, ValueError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Rebuilding semantic index: {e}")
+
+    scorer = SemanticScorer.build()
+    try:
+        scorer.save(index_dir)
+    except OSError as e:
+        # Read-only deployments keep the index in memory
+        print(f"Could not save semantic index to {index_dir}: {e}")
+    return scorer
+
+
+def get_semantic_scorer():
+    """Process-wide SemanticScorer, loaded or built on first use"""
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = load_or_build()
+    return _scorer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank job roles for a resume by semantic similarity")
+    parser.add_argument('resume', nargs='?', help="Plain-text resume to score")
+    parser.add_argument('--build', action='store_true', help="Rebuild the role index and exit")
+    parser.add_argument('--top', type=int, default=5, help="Number of roles to show")
+    parser.add_argument('--index-dir', default=INDEX_DIR)
+    args = parser.parse_args()
+
+    if args.build:
+        scorer = SemanticScorer.build()
+        scorer.save(args.index_dir)
+        print(f"Indexed {len(scorer.roles)} roles over {len(scorer.vocabulary)} terms in {args.index_dir}")
+        return
+    if not args.resume:
+        parser.error("a resume file is required unless --build is given")
+
+    with open(args.resume, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    for rank, match in enumerate(load_or_build(args.index_dir).rank(text, args.top), 1):
+        print(f"{rank:>2}. {match['similarity']:5.1f}  {match['role']} ({match['category']})")
+
+
+if __name__ == '__main__':
+    main()